@@ -41,7 +41,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from infrastructure.database import init_db
 from infrastructure.auth.config import auth_config
 from infrastructure.logging.config import configure_structured_logging, get_logger
-from api.routes import auth, tasks, attachments, worker, metrics, health
+from api.routes import auth, tasks, attachments, worker, metrics, health, well_known
 from api.middleware.rate_limiting import RateLimitingMiddleware
 from api.middleware.correlation_id import CorrelationIDMiddleware
 from api.middleware.metrics import MetricsMiddleware
@@ -64,7 +64,7 @@ logger = get_logger(__name__)
 try:
     auth_config.validate()
 except ValueError as e:
-    logger.warning("auth_config_validation_failed", error=str(e), message="Please set JWT_SECRET_KEY environment variable (min 32 characters)")
+    logger.warning("auth_config_validation_failed", error=str(e), message="Please set JWT_SECRET_KEY (min 32 characters), or JWT_SIGNING_KEY_FILE for RS256/ES256")
 
 # Build dynamic API description with rate limiting info
 RATE_LIMIT_ENABLED = os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true"
@@ -113,6 +113,13 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error("worker_scheduler_stop_failed", error=str(e), exc_info=True)
     
+    # Close pooled async database connections
+    try:
+        from infrastructure.database import dispose_async_engines
+        await dispose_async_engines()
+    except Exception as e:
+        logger.error("async_engine_dispose_failed", error=str(e), exc_info=True)
+    
     # Close Redis connection
     try:
         from infrastructure.rate_limiting.redis_client import close_redis_client
@@ -151,6 +158,7 @@ app.include_router(attachments.router)
 app.include_router(worker.router)
 app.include_router(metrics.router)
 app.include_router(health.router)
+app.include_router(well_known.router)
 
 # Add middleware (order matters: FastAPI executes middleware in reverse order - LIFO)
 # So add in reverse: rate limiting first, then metrics, then correlation ID, then CORS last (executes first)
@@ -1,55 +1,91 @@
 """Authentication middleware."""
 
-from typing import Optional
-from fastapi import HTTPException, status, Depends
+from typing import Any, Dict, Optional
+from fastapi import HTTPException, Request, status, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from jose import jwt, JWTError
-from sqlalchemy.orm import Session
+from fastapi.security.utils import get_authorization_scheme_param
+from jose import JWTError
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from infrastructure.auth.config import auth_config
-from infrastructure.database import get_db
-from domain.models.user import User
+from infrastructure.auth.token_verifier import verify_access_token
+from infrastructure.database import get_async_db
+from infrastructure.persistence.statements import USER_BY_ID
+from infrastructure.cache.principal_cache import get_local_principal, get_principal, put_principal
+from infrastructure.cache.redis_cache import run_cache_io
+from domain.auth.principal import Principal
 
 security = HTTPBearer()
 
+_NOT_VERIFIED = object()
 
-def get_current_user(
+
+def get_token_claims(request: Request) -> Optional[Dict[str, Any]]:
+    """
+    Get the verified claims of the request's bearer token (auth context).
+    
+    The token is verified once per request: the first caller (the rate
+    limiter, or get_current_user when rate limiting is skipped) stores the
+    result on `request.state.token_claims` for the later ones.
+    
+    Returns:
+        The token's claims, or None if there is no bearer token or it is
+        invalid or expired
+    """
+    claims = getattr(request.state, "token_claims", _NOT_VERIFIED)
+    if claims is _NOT_VERIFIED:
+        claims = None
+        scheme, token = get_authorization_scheme_param(request.headers.get("Authorization"))
+        if scheme.lower() == "bearer" and token:
+            try:
+                claims = verify_access_token(token)
+            except JWTError:
+                pass
+        request.state.token_claims = claims
+    return claims
+
+
+async def get_current_user(
+    request: Request,
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
-) -> User:
+    db: AsyncSession = Depends(get_async_db)
+) -> Principal:
     """
-    Get current authenticated user from JWT token.
+    Get the principal of the authenticated user from the JWT token.
+    
+    The token's claims come from the request's auth context (see
+    get_token_claims); `credentials` makes HTTPBearer reject requests
+    without a bearer token. The principal is served from the principal cache
+    when possible, so authenticated requests usually cost no database query.
+    It is an immutable value, not attached to the request's session.
     
     Raises HTTPException if token is invalid or user not found.
     """
-    token = credentials.credentials
-    
+    claims = get_token_claims(request)
     try:
-        # Decode JWT token
-        payload = jwt.decode(
-            token,
-            auth_config.get_secret_key(),
-            algorithms=[auth_config.get_algorithm()]
-        )
-        user_id: int = int(payload.get("sub"))
-        
-        if user_id is None:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid authentication credentials"
-            )
-    except JWTError:
+        user_id = int(claims["sub"])
+    except (TypeError, KeyError, ValueError):
+        # No valid token, or no user id in it
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid authentication credentials"
         )
     
-    # Get user from database
-    user = db.query(User).filter(User.id == user_id).first()
+    # In-process hits are served inline; the Redis tier is read off the event loop
+    principal = get_local_principal(user_id)
+    if principal is None:
+        principal = await run_cache_io(get_principal, user_id)
+    if principal is not None:
+        return principal
+    
+    # Get user from database (pre-built statement)
+    result = await db.execute(USER_BY_ID, {"user_id": user_id})
+    user = result.scalar_one_or_none()
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found"
         )
     
-    return user
+    principal = Principal.of(user)
+    await run_cache_io(put_principal, principal)
+    return principal
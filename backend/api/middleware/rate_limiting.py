@@ -4,11 +4,13 @@ import os
 from typing import Optional
 from fastapi import Request, HTTPException, status
 from fastapi.responses import JSONResponse
+from starlette.concurrency import run_in_threadpool
 from starlette.middleware.base import BaseHTTPMiddleware
 
 from infrastructure.rate_limiting.rate_limiter import check_rate_limit
 from infrastructure.logging.config import get_logger
 from api.middleware.correlation_id import get_correlation_id
+from api.middleware.auth import get_token_claims
 from domain.models.user import User
 
 logger = get_logger(__name__)
@@ -39,20 +41,12 @@ def get_rate_limit_key(request: Request) -> Optional[str]:
     Returns:
         Rate limit key string, or None if key cannot be determined
     """
-    # Try to get authenticated user ID from Authorization header
-    auth_header = request.headers.get("Authorization")
-    if auth_header and auth_header.startswith("Bearer "):
-        try:
-            from infrastructure.auth.config import auth_config
-            from jose import jwt
-            token = auth_header.split(" ")[1]
-            payload = jwt.decode(token, auth_config.get_secret_key(), algorithms=[auth_config.get_algorithm()])
-            user_id = payload.get("sub")
-            if user_id:
-                return f"user:{user_id}"
-        except Exception:
-            # Token invalid or expired, fall back to IP
-            pass
+    # Authenticated user ID from the verified token (invalid or expired: fall back to IP).
+    # Verifying here stores the claims for get_current_user (verified once per request)
+    claims = get_token_claims(request)
+    user_id = claims.get("sub") if claims else None
+    if user_id:
+        return f"user:{user_id}"
     
     # Fallback to IP address
     # Get real client IP (handle proxies)
@@ -90,6 +84,10 @@ def should_skip_rate_limiting(request: Request) -> bool:
     if request.url.path == "/api/metrics":
         return True
     
+    # Skip the JWKS (fetched by other services, cacheable)
+    if request.url.path == "/.well-known/jwks.json":
+        return True
+    
     # Skip rate limiting if disabled
     if os.getenv("RATE_LIMIT_ENABLED", "true").lower() != "true":
         return True
@@ -118,8 +116,9 @@ class RateLimitingMiddleware(BaseHTTPMiddleware):
         # Get rate limit configuration (read dynamically)
         limit_requests, limit_window = get_rate_limit_config()
         
-        # Check rate limit
-        allowed, retry_after, remaining = check_rate_limit(
+        # Check rate limit (blocking Redis calls: run in a worker thread, off the event loop)
+        allowed, retry_after, remaining = await run_in_threadpool(
+            check_rate_limit,
             key=key,
             limit=limit_requests,
             window_seconds=limit_window
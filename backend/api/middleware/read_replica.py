@@ -0,0 +1,79 @@
+"""Read-replica routing dependencies.
+
+Read endpoints that tolerate replication lag take their session from
+get_read_db/get_async_read_db: a read replica (round-robin) when
+DATABASE_REPLICA_URLS is set, otherwise the request's primary session.
+Write endpoints declare track_user_write, which keeps the writing user's
+reads on the primary for REPLICA_STICKY_SECONDS (read-your-writes).
+
+Sessions routed to the primary for read-your-writes carry
+`info["read_your_writes"] = True` so shared caches that may hold
+replica-computed results are not read for them.
+"""
+
+from typing import AsyncIterator, Iterator
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from api.middleware.auth import get_current_user
+from domain.auth.principal import Principal
+from infrastructure.database import (
+    get_db,
+    get_async_db,
+    replicas_configured,
+    replica_session,
+    async_replica_session
+)
+from infrastructure.cache.redis_cache import run_cache_io
+from infrastructure.database.read_your_writes import mark_user_write, must_read_primary
+
+
+def get_read_db(
+    current_user: Principal = Depends(get_current_user),
+    db: Session = Depends(get_db)
+) -> Iterator[Session]:
+    """Get a read-only session: a replica, or the primary within the user's read-your-writes window."""
+    if not replicas_configured():
+        yield db
+        return
+    if must_read_primary(current_user.id):
+        db.info["read_your_writes"] = True
+        yield db
+        return
+
+    replica_db = replica_session()
+    try:
+        yield replica_db
+    finally:
+        replica_db.close()
+
+
+async def get_async_read_db(
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+) -> AsyncIterator[AsyncSession]:
+    """Get a read-only async session: a replica, or the primary within the user's read-your-writes window."""
+    if not replicas_configured():
+        yield db
+        return
+    if await run_cache_io(must_read_primary, current_user.id):
+        db.info["read_your_writes"] = True
+        yield db
+        return
+
+    async with async_replica_session() as replica_db:
+        yield replica_db
+
+
+async def track_user_write(current_user: Principal = Depends(get_current_user)) -> AsyncIterator[None]:
+    """Keep the user's reads on the primary after this write request."""
+    if not replicas_configured():
+        yield
+        return
+    # Before the write: the window is open by the time the client has the
+    # response. After it: the window lasts REPLICA_STICKY_SECONDS past the commit.
+    await run_cache_io(mark_user_write, current_user.id)
+    yield
+    await run_cache_io(mark_user_write, current_user.id)
@@ -0,0 +1,54 @@
+"""Pre-encoded JSON responses for hot read routes.
+
+Task responses are built from database values with `model_construct` (see
+application/tasks/serialization.py), so re-validating them through the
+route's `response_model` only repeats work. With FAST_JSON_RESPONSES
+enabled (default), hot GET routes return the model encoded in one pass by
+Pydantic's compiled (Rust) serializer; `response_model` still documents
+the schema in OpenAPI. Set FAST_JSON_RESPONSES=false to go back to
+FastAPI's validate-then-serialize path.
+"""
+
+import os
+from typing import Union
+
+from fastapi import Response
+from pydantic import BaseModel
+
+FAST_JSON_RESPONSES = os.getenv("FAST_JSON_RESPONSES", "true").lower() == "true"
+
+
+class PrecompiledJSONResponse(Response):
+    """JSON response rendered by the model's compiled Pydantic serializer."""
+    
+    media_type = "application/json"
+    
+    def render(self, content: Union[BaseModel, bytes]) -> bytes:
+        """Encode the model straight to JSON bytes (no validation, no dict round-trip)."""
+        if isinstance(content, bytes):
+            return content  # Already encoded (e.g. from the task response cache)
+        return type(content).__pydantic_serializer__.to_json(content)
+
+
+def fast_json_enabled() -> bool:
+    """Whether hot GET routes return pre-encoded responses."""
+    return FAST_JSON_RESPONSES
+
+
+def json_response(content: Union[BaseModel, bytes]) -> Union[Response, BaseModel]:
+    """
+    Return a pre-encoded response for a route's result.
+    
+    Args:
+        content: Response model instance matching the route's response_model,
+            or an already encoded JSON body
+    
+    Returns:
+        PrecompiledJSONResponse if FAST_JSON_RESPONSES is enabled or the
+        content is already encoded (FastAPI skips response_model validation
+        for Response objects), otherwise the model itself for FastAPI to
+        validate and serialize
+    """
+    if not FAST_JSON_RESPONSES and isinstance(content, BaseModel):
+        return content
+    return PrecompiledJSONResponse(content)
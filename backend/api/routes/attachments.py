@@ -2,47 +2,58 @@
 
 from typing import List
 from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from io import BytesIO
 
-from infrastructure.database import get_db
-from domain.models.user import User
+from infrastructure.database import get_async_db
+from domain.auth.principal import Principal
 from api.middleware.auth import get_current_user
+from api.middleware.read_replica import get_async_read_db, track_user_write
 from application.attachments.schemas import AttachmentResponse
 from application.attachments.upload_attachment import upload_attachment
 from application.attachments.list_attachments import list_attachments
 from application.attachments.delete_attachment import delete_attachment
-from application.attachments.repository import AttachmentRepository
-from application.tasks.repository import TaskRepository
-from infrastructure.persistence.repositories.attachment_repository import SQLAlchemyAttachmentRepository
-from infrastructure.persistence.repositories.task_repository import SQLAlchemyTaskRepository
+from infrastructure.persistence.repositories.attachment_repository import AsyncSQLAlchemyAttachmentRepository
+from infrastructure.persistence.repositories.task_repository import AsyncSQLAlchemyTaskRepository
 from infrastructure.attachments.storage import LocalFileStorage
-from application.audit.audit_logger import AuditLogger
-from infrastructure.audit.audit_logger import AuditLoggerImpl
-from infrastructure.persistence.repositories.audit_repository import SQLAlchemyAuditRepository
+from application.audit.audit_logger import AsyncAuditLogger
+from infrastructure.audit.audit_logger import AsyncAuditLoggerImpl
+from infrastructure.persistence.repositories.audit_repository import AsyncSQLAlchemyAuditRepository
+from application.unit_of_work import AsyncUnitOfWork
+from infrastructure.database.unit_of_work import AsyncSQLAlchemyUnitOfWork
 
 router = APIRouter(prefix="/api", tags=["attachments"])
 
 
-def get_attachment_repository(db: Session = Depends(get_db)) -> SQLAlchemyAttachmentRepository:
+async def get_attachment_repository(db: AsyncSession = Depends(get_async_db)) -> AsyncSQLAlchemyAttachmentRepository:
     """Dependency to get attachment repository."""
-    return SQLAlchemyAttachmentRepository(db)
+    return AsyncSQLAlchemyAttachmentRepository(db)
 
 
-def get_task_repository(db: Session = Depends(get_db)) -> SQLAlchemyTaskRepository:
+async def get_read_attachment_repository(db: AsyncSession = Depends(get_async_read_db)) -> AsyncSQLAlchemyAttachmentRepository:
+    """Dependency to get attachment repository for reads (replica when configured)."""
+    return AsyncSQLAlchemyAttachmentRepository(db)
+
+
+async def get_task_repository(db: AsyncSession = Depends(get_async_db)) -> AsyncSQLAlchemyTaskRepository:
     """Dependency to get task repository."""
-    return SQLAlchemyTaskRepository(db)
+    return AsyncSQLAlchemyTaskRepository(db)
 
 
-def get_storage() -> LocalFileStorage:
+async def get_storage() -> LocalFileStorage:
     """Dependency to get storage implementation."""
     return LocalFileStorage()
 
 
-def get_audit_logger(db: Session = Depends(get_db)) -> AuditLogger:
+async def get_audit_logger(db: AsyncSession = Depends(get_async_db)) -> AsyncAuditLogger:
     """Dependency to get audit logger."""
-    audit_repository = SQLAlchemyAuditRepository(db)
-    return AuditLoggerImpl(audit_repository)
+    audit_repository = AsyncSQLAlchemyAuditRepository(db)
+    return AsyncAuditLoggerImpl(audit_repository)
+
+
+async def get_unit_of_work(db: AsyncSession = Depends(get_async_db)) -> AsyncUnitOfWork:
+    """Dependency to get the request's unit of work (commits the repositories' session)."""
+    return AsyncSQLAlchemyUnitOfWork(db)
 
 
 @router.post(
@@ -54,16 +65,18 @@ def get_audit_logger(db: Session = Depends(get_db)) -> AuditLogger:
         403: {"description": "Forbidden - not the task owner"},
         404: {"description": "Task not found"},
         401: {"description": "Unauthorized"}
-    }
+    },
+    dependencies=[Depends(track_user_write)]
 )
 async def upload_attachment_endpoint(
     task_id: int,
     file: UploadFile = File(...),
-    current_user: User = Depends(get_current_user),
-    task_repository: SQLAlchemyTaskRepository = Depends(get_task_repository),
-    attachment_repository: SQLAlchemyAttachmentRepository = Depends(get_attachment_repository),
+    current_user: Principal = Depends(get_current_user),
+    task_repository: AsyncSQLAlchemyTaskRepository = Depends(get_task_repository),
+    attachment_repository: AsyncSQLAlchemyAttachmentRepository = Depends(get_attachment_repository),
     storage: LocalFileStorage = Depends(get_storage),
-    audit_logger: AuditLogger = Depends(get_audit_logger)
+    unit_of_work: AsyncUnitOfWork = Depends(get_unit_of_work),
+    audit_logger: AsyncAuditLogger = Depends(get_audit_logger)
 ):
     """
     Upload an attachment for a task.
@@ -76,9 +89,10 @@ async def upload_attachment_endpoint(
         file_bytes = BytesIO(file_content)
         
         # Upload attachment
-        result = upload_attachment(
+        result = await upload_attachment(
             task_repository=task_repository,
             attachment_repository=attachment_repository,
+            unit_of_work=unit_of_work,
             storage=storage,
             task_id=task_id,
             file=file_bytes,
@@ -131,17 +145,17 @@ async def upload_attachment_endpoint(
         401: {"description": "Unauthorized"}
     }
 )
-def list_attachments_endpoint(
+async def list_attachments_endpoint(
     task_id: int,
-    current_user: User = Depends(get_current_user),
-    attachment_repository: SQLAlchemyAttachmentRepository = Depends(get_attachment_repository)
+    current_user: Principal = Depends(get_current_user),
+    attachment_repository: AsyncSQLAlchemyAttachmentRepository = Depends(get_read_attachment_repository)
 ):
     """
     List all attachments for a task.
     
     All authenticated users can view attachments (no ownership filter for reads).
     """
-    attachments = list_attachments(attachment_repository, task_id)
+    attachments = await list_attachments(attachment_repository, task_id)
     return attachments
 
 
@@ -152,15 +166,17 @@ def list_attachments_endpoint(
         403: {"description": "Forbidden - not the task owner"},
         404: {"description": "Attachment not found"},
         401: {"description": "Unauthorized"}
-    }
+    },
+    dependencies=[Depends(track_user_write)]
 )
-def delete_attachment_endpoint(
+async def delete_attachment_endpoint(
     attachment_id: int,
-    current_user: User = Depends(get_current_user),
-    task_repository: SQLAlchemyTaskRepository = Depends(get_task_repository),
-    attachment_repository: SQLAlchemyAttachmentRepository = Depends(get_attachment_repository),
+    current_user: Principal = Depends(get_current_user),
+    task_repository: AsyncSQLAlchemyTaskRepository = Depends(get_task_repository),
+    attachment_repository: AsyncSQLAlchemyAttachmentRepository = Depends(get_attachment_repository),
     storage: LocalFileStorage = Depends(get_storage),
-    audit_logger: AuditLogger = Depends(get_audit_logger)
+    unit_of_work: AsyncUnitOfWork = Depends(get_unit_of_work),
+    audit_logger: AsyncAuditLogger = Depends(get_audit_logger)
 ):
     """
     Delete an attachment.
@@ -168,9 +184,10 @@ def delete_attachment_endpoint(
     Only the task owner can delete attachments. Requires authentication.
     """
     try:
-        deleted = delete_attachment(
+        deleted = await delete_attachment(
             task_repository=task_repository,
             attachment_repository=attachment_repository,
+            unit_of_work=unit_of_work,
             storage=storage,
             attachment_id=attachment_id,
             authenticated_user_id=current_user.id,
@@ -1,22 +1,41 @@
 """Authentication API routes."""
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-import bcrypt
+from sqlalchemy import or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from infrastructure.database import get_db
+from infrastructure.database import get_async_db
+from infrastructure.auth.password_hashing import PasswordHashingBusyError, run_password_hashing
 from application.auth.schemas import (
     LoginRequest, LoginResponse, ErrorResponse,
     ChangePasswordRequest, ChangePasswordResponse
 )
-from application.auth.login import login_user
+from application.auth.login import login_user, hash_password
 from application.auth.change_password import change_user_password
 from api.middleware.auth import get_current_user
 from domain.models.user import User
+from domain.auth.principal import Principal
 from pydantic import BaseModel, EmailStr, Field
 
 router = APIRouter(prefix="/api/auth", tags=["auth"])
 
+# Answered while the password hashing queue is full (see infrastructure/auth/password_hashing.py)
+HASHING_BUSY_RESPONSE = {"model": ErrorResponse, "description": "Too many password operations in progress"}
+
+
+def hashing_busy_error() -> HTTPException:
+    """503 for a request refused by the full password hashing queue."""
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail={
+            "error": {
+                "code": "SERVICE_BUSY",
+                "message": "Too many password operations in progress, please retry shortly"
+            }
+        },
+        headers={"Retry-After": "1"}
+    )
+
 
 class RegisterRequest(BaseModel):
     """User registration request schema."""
@@ -37,23 +56,25 @@ class RegisterResponse(BaseModel):
     status_code=status.HTTP_201_CREATED,
     responses={
         400: {"model": ErrorResponse, "description": "Validation error or user already exists"},
-        409: {"model": ErrorResponse, "description": "User already exists"}
+        409: {"model": ErrorResponse, "description": "User already exists"},
+        503: HASHING_BUSY_RESPONSE
     }
 )
-def register(
+async def register(
     request: RegisterRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Register a new user.
     
     Creates a new user account with username, email, and password.
-    Password is hashed using bcrypt before storage.
+    Password is hashed using bcrypt (on the password hashing pool) before storage.
     """
     # Check if user already exists
-    existing = db.query(User).filter(
-        (User.username == request.username) | (User.email == request.email)
-    ).first()
+    result = await db.execute(
+        select(User.id).where(or_(User.username == request.username, User.email == request.email))
+    )
+    existing = result.first()
     
     if existing:
         raise HTTPException(
@@ -67,10 +88,10 @@ def register(
         )
     
     # Hash password
-    hashed_password = bcrypt.hashpw(
-        request.password.encode('utf-8'),
-        bcrypt.gensalt()
-    ).decode('utf-8')
+    try:
+        hashed_password = await run_password_hashing(hash_password, request.password)
+    except PasswordHashingBusyError:
+        raise hashing_busy_error()
     
     # Create user
     user = User(
@@ -81,8 +102,7 @@ def register(
     
     try:
         db.add(user)
-        db.commit()
-        db.refresh(user)
+        await db.commit()  # id comes back from the INSERT; no reload needed
         
         return RegisterResponse(
             message="User registered successfully",
@@ -93,7 +113,7 @@ def register(
             }
         )
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail={
@@ -110,12 +130,13 @@ def register(
     response_model=LoginResponse,
     status_code=status.HTTP_200_OK,
     responses={
-        401: {"model": ErrorResponse, "description": "Invalid credentials"}
+        401: {"model": ErrorResponse, "description": "Invalid credentials"},
+        503: HASHING_BUSY_RESPONSE
     }
 )
-def login(
+async def login(
     request: LoginRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Login endpoint.
@@ -124,7 +145,10 @@ def login(
     Returns JWT token and user information on success.
     Returns generic error message on failure (prevents user enumeration).
     """
-    result = login_user(db, request.username, request.password)
+    try:
+        result = await login_user(db, request.username, request.password)
+    except PasswordHashingBusyError:
+        raise hashing_busy_error()
     
     if not result:
         raise HTTPException(
@@ -146,25 +170,29 @@ def login(
     status_code=status.HTTP_200_OK,
     responses={
         401: {"model": ErrorResponse, "description": "Unauthorized or invalid current password"},
-        400: {"model": ErrorResponse, "description": "Invalid request (weak password)"}
+        400: {"model": ErrorResponse, "description": "Invalid request (weak password)"},
+        503: HASHING_BUSY_RESPONSE
     }
 )
-def change_password(
+async def change_password(
     request: ChangePasswordRequest,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Change password endpoint.
     
     Requires authentication. Verifies current password before allowing change.
     """
-    result = change_user_password(
-        db,
-        current_user.id,
-        request.current_password,
-        request.new_password
-    )
+    try:
+        result = await change_user_password(
+            db,
+            current_user.id,
+            request.current_password,
+            request.new_password
+        )
+    except PasswordHashingBusyError:
+        raise hashing_busy_error()
     
     if not result:
         raise HTTPException(
@@ -3,48 +3,53 @@
 from typing import List, Optional
 from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from fastapi import status as http_status  # `status` is shadowed by the query parameter in list_tasks_endpoint
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from infrastructure.database import get_db
-from domain.models.user import User
+from infrastructure.database import get_async_db
+from domain.auth.principal import Principal
 from api.middleware.auth import get_current_user
+from api.middleware.read_replica import get_async_read_db, track_user_write
+from api.responses import json_response, fast_json_enabled
 from application.tasks.schemas import TaskCreateRequest, TaskResponse, TaskUpdateRequest
-from application.tasks.pagination_schemas import PaginatedTaskResponse
+from application.tasks.pagination_schemas import PaginatedTaskResponse, PaginationMetadata
 from application.tasks.create_task import create_task
-from application.tasks.get_task import get_task_by_id
-from application.tasks.list_tasks import list_tasks
+from application.tasks.get_task import get_task_by_id, get_task_json
 from application.tasks.search_tasks import search_tasks
 from application.tasks.update_task import update_task
 from application.tasks.delete_task import delete_task
-from application.audit.audit_logger import AuditLogger
-from infrastructure.persistence.repositories.task_repository import SQLAlchemyTaskRepository
-from infrastructure.persistence.repositories.attachment_repository import SQLAlchemyAttachmentRepository
+from infrastructure.persistence.repositories.task_repository import AsyncSQLAlchemyTaskRepository
+from infrastructure.persistence.repositories.attachment_repository import AsyncSQLAlchemyAttachmentRepository
 from infrastructure.attachments.storage import LocalFileStorage
-from infrastructure.audit.audit_logger import AuditLoggerImpl
-from infrastructure.persistence.repositories.audit_repository import SQLAlchemyAuditRepository
+from application.unit_of_work import AsyncUnitOfWork
+from infrastructure.database.unit_of_work import AsyncSQLAlchemyUnitOfWork
 
 router = APIRouter(prefix="/api/tasks", tags=["tasks"])
 
 
-def get_task_repository(db: Session = Depends(get_db)) -> SQLAlchemyTaskRepository:
+async def get_task_repository(db: AsyncSession = Depends(get_async_db)) -> AsyncSQLAlchemyTaskRepository:
     """Dependency to get task repository."""
-    return SQLAlchemyTaskRepository(db)
+    return AsyncSQLAlchemyTaskRepository(db)
 
 
-def get_attachment_repository(db: Session = Depends(get_db)) -> SQLAlchemyAttachmentRepository:
+async def get_read_task_repository(db: AsyncSession = Depends(get_async_read_db)) -> AsyncSQLAlchemyTaskRepository:
+    """Dependency to get task repository for reads (replica when configured)."""
+    return AsyncSQLAlchemyTaskRepository(db)
+
+
+async def get_attachment_repository(db: AsyncSession = Depends(get_async_db)) -> AsyncSQLAlchemyAttachmentRepository:
     """Dependency to get attachment repository."""
-    return SQLAlchemyAttachmentRepository(db)
+    return AsyncSQLAlchemyAttachmentRepository(db)
 
 
-def get_storage() -> LocalFileStorage:
+async def get_storage() -> LocalFileStorage:
     """Dependency to get storage implementation."""
     return LocalFileStorage()
 
 
-def get_audit_logger(db: Session = Depends(get_db)) -> AuditLogger:
-    """Dependency to get audit logger."""
-    audit_repository = SQLAlchemyAuditRepository(db)
-    return AuditLoggerImpl(audit_repository)
+async def get_unit_of_work(db: AsyncSession = Depends(get_async_db)) -> AsyncUnitOfWork:
+    """Dependency to get the request's unit of work (commits the repositories' session)."""
+    return AsyncSQLAlchemyUnitOfWork(db)
 
 
 @router.post(
@@ -54,13 +59,14 @@ def get_audit_logger(db: Session = Depends(get_db)) -> AuditLogger:
     responses={
         400: {"description": "Validation error"},
         401: {"description": "Unauthorized"}
-    }
+    },
+    dependencies=[Depends(track_user_write)]
 )
-def create_task_endpoint(
+async def create_task_endpoint(
     request: TaskCreateRequest,
-    current_user: User = Depends(get_current_user),
-    repository: SQLAlchemyTaskRepository = Depends(get_task_repository),
-    audit_logger: AuditLogger = Depends(get_audit_logger)
+    current_user: Principal = Depends(get_current_user),
+    repository: AsyncSQLAlchemyTaskRepository = Depends(get_task_repository),
+    unit_of_work: AsyncUnitOfWork = Depends(get_unit_of_work)
 ):
     """
     Create a new task.
@@ -68,7 +74,7 @@ def create_task_endpoint(
     Requires authentication. Task owner is automatically set to the authenticated user.
     """
     try:
-        created_task = create_task(repository, request, current_user.id, audit_logger)
+        created_task = await create_task(repository, unit_of_work, request, current_user)
         return created_task
     except ValueError as e:
         raise HTTPException(
@@ -91,8 +97,9 @@ def create_task_endpoint(
         401: {"description": "Unauthorized"}
     }
 )
-def list_tasks_endpoint(
-    q: Optional[str] = Query(None, description="Search term (searches in title and description)"),
+async def list_tasks_endpoint(
+    q: Optional[str] = Query(None, description="Search term (full-text search in title and description)"),
+    search_mode: str = Query("fulltext", pattern="^(fulltext|substring)$", description="How q matches: 'fulltext' (words, stemming) or 'substring' (partial/mid-word)"),
     status: Optional[str] = Query(None, description="Filter by status (exact match)"),
     priority: Optional[str] = Query(None, description="Filter by priority (exact match)"),
     tags: Optional[str] = Query(None, description="Filter by tags (comma-separated, e.g., 'urgent,important')"),
@@ -100,11 +107,14 @@ def list_tasks_endpoint(
     due_date_from: Optional[datetime] = Query(None, description="Filter by due date range (start, ISO format)"),
     due_date_to: Optional[datetime] = Query(None, description="Filter by due date range (end, ISO format)"),
     owner_user_id: Optional[int] = Query(None, description="Filter by task owner user ID (use current user's ID for 'My Tasks')"),
-    sort: Optional[str] = Query(None, description="Sort field and direction (e.g., 'due_date:asc', 'priority:desc')"),
+    sort: Optional[str] = Query(None, description="Sort field and direction (e.g., 'due_date:asc', 'priority:desc'), or 'relevance' with q"),
     page: int = Query(1, ge=1, description="Page number (1-indexed)"),
     page_size: int = Query(20, ge=1, le=100, description="Number of items per page (max 100)"),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = Query(None, description="Keyset pagination cursor (pagination.next_cursor from the previous page)"),
+    include_total: bool = Query(True, description="Compute pagination.total (set false to skip the COUNT query; use has_next)"),
+    total_mode: str = Query("exact", pattern="^(exact|approximate)$", description="'exact' COUNT or 'approximate' (cached, invalidated by writes)"),
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     """
     List tasks with search, filtering, sorting, and pagination.
@@ -112,16 +122,20 @@ def list_tasks_endpoint(
     All authenticated users can view all tasks (no ownership filter for reads).
     
     **Query Parameters:**
-    - `q`: Search term (searches in title and description, case-insensitive partial match)
+    - `q`: Search term (full-text search in title and description, word-prefix matching with stemming)
+    - `search_mode`: `fulltext` (default) or `substring` (case-insensitive partial match, trigram-indexed)
     - `status`: Filter by status (exact match)
     - `priority`: Filter by priority (exact match)
     - `tags`: Filter by tags (comma-separated, tasks containing any tag - case-insensitive partial matching)
     - `due_date`: Filter by exact due date
     - `due_date_from`: Filter by due date range (start)
     - `due_date_to`: Filter by due date range (end)
-    - `sort`: Sort field and direction (e.g., "due_date:asc", "priority:desc")
+    - `sort`: Sort field and direction (e.g., "due_date:asc", "priority:desc"), or "relevance" (best match for `q` first)
     - `page`: Page number (default: 1)
     - `page_size`: Items per page (default: 20, max: 100)
+    - `cursor`: Keyset pagination cursor; replaces `page` (each page is an index range seek)
+    - `include_total`: Set to false to skip the COUNT query (`total`/`total_pages` are null, use `has_next`)
+    - `total_mode`: `exact` (default) or `approximate` (cached count per filter set, invalidated by task writes)
     """
     # Parse tags if provided
     tags_list = None
@@ -132,7 +146,7 @@ def list_tasks_endpoint(
     # Validate due_date range
     if due_date_from and due_date_to and due_date_from > due_date_to:
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
+            status_code=http_status.HTTP_400_BAD_REQUEST,
             detail={
                 "error": {
                     "code": "VALIDATION_ERROR",
@@ -143,22 +157,41 @@ def list_tasks_endpoint(
     
     
     # Call search use case
-    result = search_tasks(
-        db=db,
-        q=q,
-        status=status,
-        priority=priority,
-        tags=tags_list,
-        due_date=due_date,
-        due_date_from=due_date_from,
-        due_date_to=due_date_to,
-        owner_user_id=owner_user_id,
-        sort=sort,
-        page=page,
-        page_size=page_size
-    )
+    try:
+        result = await search_tasks(
+            db,
+            q=q,
+            search_mode=search_mode,
+            status=status,
+            priority=priority,
+            tags=tags_list,
+            due_date=due_date,
+            due_date_from=due_date_from,
+            due_date_to=due_date_to,
+            owner_user_id=owner_user_id,
+            sort=sort,
+            page=page,
+            page_size=page_size,
+            cursor=cursor,
+            include_total=include_total,
+            total_mode=total_mode
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=http_status.HTTP_400_BAD_REQUEST,
+            detail={
+                "error": {
+                    "code": "VALIDATION_ERROR",
+                    "message": str(e)
+                }
+            }
+        )
     
-    return result
+    # Results are built from database values; skip re-validation on this hot path
+    return json_response(PaginatedTaskResponse.model_construct(
+        tasks=result["tasks"],
+        pagination=PaginationMetadata.model_construct(**result["pagination"])
+    ))
 
 
 @router.get(
@@ -170,17 +203,21 @@ def list_tasks_endpoint(
         401: {"description": "Unauthorized"}
     }
 )
-def get_task_endpoint(
+async def get_task_endpoint(
     task_id: int,
-    current_user: User = Depends(get_current_user),
-    repository: SQLAlchemyTaskRepository = Depends(get_task_repository)
+    current_user: Principal = Depends(get_current_user),
+    repository: AsyncSQLAlchemyTaskRepository = Depends(get_read_task_repository)
 ):
     """
     Get a single task by ID.
     
     All authenticated users can view all tasks (no ownership filter for reads).
     """
-    task = get_task_by_id(repository, task_id)
+    if fast_json_enabled():
+        # Pre-encoded body from the per-task response cache (checked against updated_at)
+        task = await get_task_json(repository, task_id)
+    else:
+        task = await get_task_by_id(repository, task_id)
     
     if not task:
         raise HTTPException(
@@ -193,7 +230,7 @@ def get_task_endpoint(
             }
         )
     
-    return task
+    return json_response(task)
 
 
 @router.put(
@@ -204,14 +241,15 @@ def get_task_endpoint(
         403: {"description": "Forbidden - not the owner"},
         404: {"description": "Task not found"},
         401: {"description": "Unauthorized"}
-    }
+    },
+    dependencies=[Depends(track_user_write)]
 )
-def update_task_endpoint(
+async def update_task_endpoint(
     task_id: int,
     request: TaskUpdateRequest,
-    current_user: User = Depends(get_current_user),
-    repository: SQLAlchemyTaskRepository = Depends(get_task_repository),
-    audit_logger: AuditLogger = Depends(get_audit_logger)
+    current_user: Principal = Depends(get_current_user),
+    repository: AsyncSQLAlchemyTaskRepository = Depends(get_task_repository),
+    unit_of_work: AsyncUnitOfWork = Depends(get_unit_of_work)
 ):
     """
     Update an existing task.
@@ -219,7 +257,7 @@ def update_task_endpoint(
     Only the task owner can update the task. Requires authentication.
     """
     try:
-        updated_task = update_task(repository, task_id, request, current_user.id, audit_logger)
+        updated_task = await update_task(repository, unit_of_work, task_id, request, current_user)
         
         if not updated_task:
             raise HTTPException(
@@ -252,15 +290,16 @@ def update_task_endpoint(
         403: {"description": "Forbidden - not the owner"},
         404: {"description": "Task not found"},
         401: {"description": "Unauthorized"}
-    }
+    },
+    dependencies=[Depends(track_user_write)]
 )
-def delete_task_endpoint(
+async def delete_task_endpoint(
     task_id: int,
-    current_user: User = Depends(get_current_user),
-    repository: SQLAlchemyTaskRepository = Depends(get_task_repository),
-    attachment_repository: SQLAlchemyAttachmentRepository = Depends(get_attachment_repository),
+    current_user: Principal = Depends(get_current_user),
+    repository: AsyncSQLAlchemyTaskRepository = Depends(get_task_repository),
+    attachment_repository: AsyncSQLAlchemyAttachmentRepository = Depends(get_attachment_repository),
     storage: LocalFileStorage = Depends(get_storage),
-    audit_logger: AuditLogger = Depends(get_audit_logger)
+    unit_of_work: AsyncUnitOfWork = Depends(get_unit_of_work)
 ):
     """
     Delete a task.
@@ -269,13 +308,13 @@ def delete_task_endpoint(
     Also deletes all attachments associated with the task.
     """
     try:
-        deleted = delete_task(
-            repository, 
-            task_id, 
+        deleted = await delete_task(
+            repository,
+            unit_of_work,
+            task_id,
             current_user.id, 
             attachment_repository=attachment_repository,
-            storage=storage,
-            audit_logger=audit_logger
+            storage=storage
         )
         
         if not deleted:
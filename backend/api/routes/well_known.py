@@ -0,0 +1,31 @@
+"""Well-known endpoints for other services (JWKS)."""
+
+import hashlib
+
+from fastapi import APIRouter, Request
+from fastapi.responses import Response
+
+from infrastructure.auth.signing_keys import JWKS_MAX_AGE_SECONDS, jwks_document
+
+router = APIRouter(prefix="/.well-known", tags=["well-known"])
+
+
+@router.get("/jwks.json")
+def get_jwks(request: Request):
+    """
+    Get the public keys that verify access tokens (JWK Set, RFC 7517).
+
+    Services verify RS256/ES256 tokens locally with the key named by the
+    token's `kid` header. The document is built once per process and may be
+    cached for JWKS_MAX_AGE_SECONDS; revalidate with If-None-Match.
+    With HS256 the set is empty.
+    """
+    document = jwks_document()
+    etag = f'"{hashlib.sha256(document).hexdigest()[:32]}"'
+    headers = {
+        "Cache-Control": f"public, max-age={JWKS_MAX_AGE_SECONDS}",
+        "ETag": etag
+    }
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=document, media_type="application/json", headers=headers)
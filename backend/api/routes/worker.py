@@ -7,9 +7,10 @@ from sqlalchemy.orm import Session
 from sqlalchemy import func, and_, or_
 
 from infrastructure.database import get_db
-from domain.models.user import User
+from domain.auth.principal import Principal
 from domain.models.task import Task
 from api.middleware.auth import get_current_user
+from api.middleware.read_replica import get_read_db, track_user_write
 from worker.scheduler import get_scheduler
 from worker.jobs.reminder_job import process_reminders
 
@@ -24,7 +25,7 @@ router = APIRouter(prefix="/api/worker", tags=["worker"])
     }
 )
 def get_worker_status(
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_user)
 ):
     """
     Get worker status and information.
@@ -80,10 +81,11 @@ def get_worker_status(
     responses={
         401: {"description": "Unauthorized"},
         503: {"description": "Worker not available"}
-    }
+    },
+    dependencies=[Depends(track_user_write)]
 )
 def trigger_worker_manually(
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_user)
 ):
     """
     Manually trigger the reminder worker job.
@@ -120,8 +122,8 @@ def trigger_worker_manually(
     }
 )
 def get_worker_statistics(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(get_current_user),
+    db: Session = Depends(get_read_db)
 ):
     """
     Get worker statistics.
@@ -4,7 +4,7 @@ from .schemas import AttachmentResponse, AttachmentListResponse
 from .upload_attachment import upload_attachment
 from .list_attachments import list_attachments
 from .delete_attachment import delete_attachment
-from .repository import AttachmentRepository
+from .repository import AsyncAttachmentRepository
 from .storage_interface import AttachmentStorage
 
 __all__ = [
@@ -13,6 +13,6 @@ __all__ = [
     "upload_attachment",
     "list_attachments",
     "delete_attachment",
-    "AttachmentRepository",
+    "AsyncAttachmentRepository",
     "AttachmentStorage"
 ]
@@ -1,30 +1,37 @@
 """Delete attachment use case."""
 
 from typing import Optional
+
+import anyio.to_thread
+
 from domain.models.task import Task
 from domain.audit.audit_event import AuditActionType
-from application.attachments.repository import AttachmentRepository
+from application.attachments.repository import AsyncAttachmentRepository
 from application.attachments.storage_interface import AttachmentStorage
-from application.tasks.repository import TaskRepository
-from application.audit.audit_logger import AuditLogger
+from application.tasks.repository import AsyncTaskRepository
+from application.audit.audit_logger import AsyncAuditLogger
+from application.unit_of_work import AsyncUnitOfWork
 
 
-def delete_attachment(
-    task_repository: TaskRepository,
-    attachment_repository: AttachmentRepository,
+async def delete_attachment(
+    task_repository: AsyncTaskRepository,
+    attachment_repository: AsyncAttachmentRepository,
+    unit_of_work: AsyncUnitOfWork,
     storage: AttachmentStorage,
     attachment_id: int,
     authenticated_user_id: int,
-    audit_logger: Optional[AuditLogger] = None
+    audit_logger: Optional[AsyncAuditLogger] = None
 ) -> bool:
     """
     Delete an attachment.
     
     Only the task owner can delete attachments (inherits from task ownership).
+    The file is removed from storage once the metadata deletion is committed.
     
     Args:
         task_repository: Task repository interface
         attachment_repository: Attachment repository interface
+        unit_of_work: Commits the deletion and its audit event together
         storage: Attachment storage interface
         attachment_id: ID of the attachment to delete
         authenticated_user_id: ID of the authenticated user
@@ -36,12 +43,12 @@ def delete_attachment(
         PermissionError: If user is not the task owner
     """
     # Get attachment
-    attachment = attachment_repository.get_by_id(attachment_id)
+    attachment = await attachment_repository.get_by_id(attachment_id)
     if not attachment:
         return False
     
     # Get task to check ownership
-    task = task_repository.get_by_id(attachment.task_id)
+    task = await task_repository.get_by_id(attachment.task_id)
     if not task:
         return False
     
@@ -52,25 +59,42 @@ def delete_attachment(
     # Store attachment info for audit before deletion
     attachment_filename = attachment.filename
     attachment_task_id = attachment.task_id
-    
-    # Delete file from storage
-    storage.delete(attachment.storage_path)
+    storage_path = attachment.storage_path
     
     # Delete metadata from database
-    deleted = attachment_repository.delete(attachment_id)
+    deleted = await attachment_repository.delete(attachment_id)
     
     # Log audit event (only if deletion was successful)
     if deleted and audit_logger:
-        audit_logger.log(
-            action_type=AuditActionType.ATTACHMENT_DELETED,
-            user_id=authenticated_user_id,
-            resource_type="attachment",
-            resource_id=str(attachment_id),
-            metadata={
-                "attachment_id": attachment_id,
-                "task_id": attachment_task_id,
-                "filename": attachment_filename
-            }
-        )
+        await audit_logger.log(**_deleted_audit_event(
+            attachment_id, attachment_task_id, attachment_filename, authenticated_user_id
+        ))
+    
+    await unit_of_work.commit()
+    
+    # Delete file from storage (after commit: a rolled-back deletion keeps its file),
+    # off the event loop
+    if deleted:
+        await anyio.to_thread.run_sync(storage.delete, storage_path)
     
     return deleted
+
+
+def _deleted_audit_event(
+    attachment_id: int,
+    task_id: int,
+    filename: str,
+    authenticated_user_id: int
+) -> dict:
+    """Audit event arguments for a deleted attachment."""
+    return {
+        "action_type": AuditActionType.ATTACHMENT_DELETED,
+        "user_id": authenticated_user_id,
+        "resource_type": "attachment",
+        "resource_id": str(attachment_id),
+        "metadata": {
+            "attachment_id": attachment_id,
+            "task_id": task_id,
+            "filename": filename
+        }
+    }
@@ -2,11 +2,11 @@
 
 from typing import List
 from application.attachments.schemas import AttachmentResponse
-from application.attachments.repository import AttachmentRepository
+from application.attachments.repository import AsyncAttachmentRepository
 
 
-def list_attachments(
-    repository: AttachmentRepository,
+async def list_attachments(
+    repository: AsyncAttachmentRepository,
     task_id: int
 ) -> List[AttachmentResponse]:
     """
@@ -21,16 +21,6 @@ def list_attachments(
     Returns:
         List of AttachmentResponse objects
     """
-    attachments = repository.get_by_task_id(task_id)
+    attachments = await repository.get_by_task_id(task_id)
     
-    return [
-        AttachmentResponse(
-            id=att.id,
-            task_id=att.task_id,
-            filename=att.filename,
-            file_size=att.file_size,
-            content_type=att.content_type,
-            uploaded_at=att.uploaded_at
-        )
-        for att in attachments
-    ]
+    return [AttachmentResponse.model_validate(att) for att in attachments]
@@ -5,25 +5,30 @@ from typing import Optional, List
 from domain.models.attachment import Attachment
 
 
-class AttachmentRepository(ABC):
-    """Repository interface for attachment persistence."""
+class AsyncAttachmentRepository(ABC):
+    """Repository interface for attachment persistence (AsyncSession, used by async routes)."""
     
     @abstractmethod
-    def create(self, attachment: Attachment) -> Attachment:
+    async def create(self, attachment: Attachment) -> Attachment:
         """Create a new attachment."""
         pass
     
     @abstractmethod
-    def get_by_id(self, attachment_id: int) -> Optional[Attachment]:
+    async def get_by_id(self, attachment_id: int) -> Optional[Attachment]:
         """Get attachment by ID."""
         pass
     
     @abstractmethod
-    def get_by_task_id(self, task_id: int) -> List[Attachment]:
+    async def get_by_task_id(self, task_id: int) -> List[Attachment]:
         """Get all attachments for a task."""
         pass
     
     @abstractmethod
-    def delete(self, attachment_id: int) -> bool:
+    async def delete(self, attachment_id: int) -> bool:
         """Delete an attachment by ID. Returns True if deleted, False if not found."""
         pass
+    
+    @abstractmethod
+    async def delete_for_owned_task(self, task_id: int, owner_user_id: int) -> List[Attachment]:
+        """Delete a task's attachments if the task is owned by the user; returns the deleted rows."""
+        pass
@@ -1,17 +1,22 @@
 """Upload attachment use case."""
 
+import functools
 import re
 from typing import Optional
 from io import BytesIO
 
+import anyio.to_thread
+
 from domain.models.attachment import Attachment
 from domain.models.task import Task
 from domain.audit.audit_event import AuditActionType
 from application.attachments.schemas import AttachmentResponse
-from application.attachments.repository import AttachmentRepository
+from application.attachments.repository import AsyncAttachmentRepository
 from application.attachments.storage_interface import AttachmentStorage
-from application.tasks.repository import TaskRepository
-from application.audit.audit_logger import AuditLogger
+from application.tasks.repository import AsyncTaskRepository
+from application.tasks.serialization import stored_datetime
+from application.audit.audit_logger import AsyncAuditLogger
+from application.unit_of_work import AsyncUnitOfWork
 
 
 # Security constants
@@ -56,16 +61,17 @@ def sanitize_filename(filename: str) -> str:
     return filename
 
 
-def upload_attachment(
-    task_repository: TaskRepository,
-    attachment_repository: AttachmentRepository,
+async def upload_attachment(
+    task_repository: AsyncTaskRepository,
+    attachment_repository: AsyncAttachmentRepository,
+    unit_of_work: AsyncUnitOfWork,
     storage: AttachmentStorage,
     task_id: int,
     file: BytesIO,
     filename: str,
     content_type: Optional[str],
     authenticated_user_id: int,
-    audit_logger: Optional[AuditLogger] = None
+    audit_logger: Optional[AsyncAuditLogger] = None
 ) -> Optional[AttachmentResponse]:
     """
     Upload an attachment for a task.
@@ -75,6 +81,7 @@ def upload_attachment(
     Args:
         task_repository: Task repository interface
         attachment_repository: Attachment repository interface
+        unit_of_work: Commits the metadata and its audit event together
         storage: Attachment storage interface
         task_id: ID of the task
         file: File content (BytesIO)
@@ -90,7 +97,7 @@ def upload_attachment(
         PermissionError: If user is not task owner
     """
     # Verify task exists
-    task = task_repository.get_by_id(task_id)
+    task = await task_repository.get_by_id(task_id)
     if not task:
         return None
     
@@ -98,6 +105,30 @@ def upload_attachment(
     if task.owner_user_id != authenticated_user_id:
         raise PermissionError("You can only upload attachments to your own tasks")
     
+    # Blocking disk write (up to MAX_FILE_SIZE): run it off the event loop
+    attachment = await anyio.to_thread.run_sync(
+        functools.partial(_store_file, storage, task_id, file, filename, content_type)
+    )
+    
+    # Persist metadata
+    created_attachment = await attachment_repository.create(attachment)
+    
+    # Log audit event
+    if audit_logger:
+        await audit_logger.log(**_uploaded_audit_event(created_attachment, authenticated_user_id))
+    
+    await unit_of_work.commit()
+    return _to_response(created_attachment)
+
+
+def _store_file(
+    storage: AttachmentStorage,
+    task_id: int,
+    file: BytesIO,
+    filename: str,
+    content_type: Optional[str]
+) -> Attachment:
+    """Validate and save the file; returns the (unsaved) attachment metadata."""
     # Validate file size
     file.seek(0, 2)  # Seek to end
     file_size = file.tell()
@@ -119,37 +150,38 @@ def upload_attachment(
         raise ValueError(f"Failed to save file: {str(e)}")
     
     # Create attachment metadata
-    attachment = Attachment(
+    return Attachment(
         task_id=task_id,
         filename=sanitized_filename,
         file_size=file_size,
         storage_path=storage_path,
         content_type=content_type
     )
-    
-    # Persist metadata
-    created_attachment = attachment_repository.create(attachment)
-    
-    # Log audit event
-    if audit_logger:
-        audit_logger.log(
-            action_type=AuditActionType.ATTACHMENT_UPLOADED,
-            user_id=authenticated_user_id,
-            resource_type="attachment",
-            resource_id=str(created_attachment.id),
-            metadata={
-                "attachment_id": created_attachment.id,
-                "task_id": task_id,
-                "filename": sanitized_filename,
-                "file_size": file_size
-            }
-        )
-    
+
+
+def _uploaded_audit_event(attachment: Attachment, authenticated_user_id: int) -> dict:
+    """Audit event arguments for an uploaded attachment."""
+    return {
+        "action_type": AuditActionType.ATTACHMENT_UPLOADED,
+        "user_id": authenticated_user_id,
+        "resource_type": "attachment",
+        "resource_id": str(attachment.id),
+        "metadata": {
+            "attachment_id": attachment.id,
+            "task_id": attachment.task_id,
+            "filename": attachment.filename,
+            "file_size": attachment.file_size
+        }
+    }
+
+
+def _to_response(attachment: Attachment) -> AttachmentResponse:
+    """Build the API response for an attachment."""
     return AttachmentResponse(
-        id=created_attachment.id,
-        task_id=created_attachment.task_id,
-        filename=created_attachment.filename,
-        file_size=created_attachment.file_size,
-        content_type=created_attachment.content_type,
-        uploaded_at=created_attachment.uploaded_at
+        id=attachment.id,
+        task_id=attachment.task_id,
+        filename=attachment.filename,
+        file_size=attachment.file_size,
+        content_type=attachment.content_type,
+        uploaded_at=stored_datetime(attachment.uploaded_at)
     )
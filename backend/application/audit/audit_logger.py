@@ -34,3 +34,23 @@ class AuditLogger(ABC):
         that would break the main operation flow.
         """
         pass
+
+
+class AsyncAuditLogger(ABC):
+    """Interface for audit logging from async code (same contract as AuditLogger)."""
+    
+    @abstractmethod
+    async def log(
+        self,
+        action_type: str,
+        user_id: Optional[int],
+        resource_type: str,
+        resource_id: str,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """
+        Log an audit event.
+        
+        Like AuditLogger.log, must not raise: audit failures never break the main operation.
+        """
+        pass
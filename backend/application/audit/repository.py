@@ -14,7 +14,7 @@ class AuditRepository(ABC):
     
     @abstractmethod
     def save(self, event: AuditEvent) -> None:
-        """Save an audit event to the database."""
+        """Save an audit event in the current transaction (the caller commits)."""
         pass
     
     @abstractmethod
@@ -31,3 +31,27 @@ class AuditRepository(ABC):
     def find_by_resource(self, resource_type: str, resource_id: str) -> List[AuditEvent]:
         """Find audit events by resource type and ID."""
         pass
+
+
+class AsyncAuditRepository(ABC):
+    """Interface for audit event repository (AsyncSession, used by async routes)."""
+    
+    @abstractmethod
+    async def save(self, event: AuditEvent) -> None:
+        """Save an audit event in the current transaction (the caller commits)."""
+        pass
+    
+    @abstractmethod
+    async def find_by_action_type(self, action_type: str) -> List[AuditEvent]:
+        """Find audit events by action type."""
+        pass
+    
+    @abstractmethod
+    async def find_by_user_id(self, user_id: int) -> List[AuditEvent]:
+        """Find audit events by user ID."""
+        pass
+    
+    @abstractmethod
+    async def find_by_resource(self, resource_type: str, resource_id: str) -> List[AuditEvent]:
+        """Find audit events by resource type and ID."""
+        pass
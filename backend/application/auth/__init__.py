@@ -1,6 +1,6 @@
 """Application layer - Authentication module."""
 
-from .login import login_user, create_access_token, verify_password
+from .login import login_user, create_access_token, verify_password, hash_password
 from .change_password import change_user_password
 from .schemas import (
     LoginRequest, LoginResponse, ErrorResponse,
@@ -11,6 +11,7 @@ __all__ = [
     "login_user",
     "create_access_token",
     "verify_password",
+    "hash_password",
     "change_user_password",
     "LoginRequest",
     "LoginResponse",
@@ -1,17 +1,19 @@
 """Change password use case."""
 
 from typing import Optional
-from sqlalchemy.orm import Session
-import bcrypt
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from domain.models.user import User
-from infrastructure.auth.config import auth_config
+from infrastructure.auth.password_hashing import run_password_hashing
 from application.auth.schemas import ChangePasswordResponse
-from application.auth.login import verify_password
+from application.auth.login import hash_password, verify_password
+from infrastructure.cache.principal_cache import invalidate_principal
+from infrastructure.cache.redis_cache import run_cache_io
 
 
-def change_user_password(
-    db: Session,
+async def change_user_password(
+    db: AsyncSession,
     user_id: int,
     current_password: str,
     new_password: str
@@ -21,29 +23,29 @@ def change_user_password(
     
     Verifies current password, then updates to new password.
     Returns ChangePasswordResponse on success, None on failure.
+    
+    Raises:
+        PasswordHashingBusyError: If the password hashing queue is full
     """
-    # Get user
-    user = db.query(User).filter(User.id == user_id).first()
-    if not user:
+    # Get the user's password hash (the authenticated user in the session may
+    # be a cached principal without it)
+    result = await db.execute(select(User.hashed_password).where(User.id == user_id))
+    hashed_password = result.scalar_one_or_none()
+    if hashed_password is None:
         return None
     
-    # Verify current password
-    if not verify_password(current_password, user.hashed_password):
+    # Verify current password (bcrypt runs on the password hashing pool)
+    if not await run_password_hashing(verify_password, current_password, hashed_password):
         return None
     
     # Validate new password strength (minimum 8 characters)
     if len(new_password) < 8:
         return None
     
-    # Hash new password
-    new_password_hash = bcrypt.hashpw(
-        new_password.encode('utf-8'),
-        bcrypt.gensalt(rounds=auth_config.BCRYPT_ROUNDS)
-    ).decode('utf-8')
-    
-    # Update user password
-    user.hashed_password = new_password_hash
-    db.commit()
-    db.refresh(user)
+    # Hash new password and update the user
+    new_password_hash = await run_password_hashing(hash_password, new_password)
+    await db.execute(update(User).where(User.id == user_id).values(hashed_password=new_password_hash))
+    await db.commit()
+    await run_cache_io(invalidate_principal, user_id)
     
     return ChangePasswordResponse(message="Password changed successfully")
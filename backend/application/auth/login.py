@@ -1,13 +1,17 @@
 """Login use case."""
 
 from datetime import datetime, timedelta, UTC
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Tuple
 from jose import jwt
-from sqlalchemy.orm import Session
+from sqlalchemy import or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
 import bcrypt
 
 from domain.models.user import User
 from infrastructure.auth.config import auth_config
+from infrastructure.auth.password_hashing import run_password_hashing
+from infrastructure.auth.signing_keys import is_asymmetric, signing_key
 from application.auth.schemas import LoginResponse
 
 
@@ -19,6 +23,33 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     )
 
 
+def hash_password(password: str) -> str:
+    """Hash a password with bcrypt at BCRYPT_ROUNDS."""
+    return bcrypt.hashpw(
+        password.encode('utf-8'),
+        bcrypt.gensalt(rounds=auth_config.BCRYPT_ROUNDS)
+    ).decode('utf-8')
+
+
+def hash_cost(password_hash: str) -> Optional[int]:
+    """Cost factor of a bcrypt hash (`$2b$<cost>$...`), or None if it is not one."""
+    parts = password_hash.split('$')
+    if len(parts) < 4 or not parts[2].isdigit():
+        return None
+    return int(parts[2])
+
+
+def needs_rehash(password_hash: str) -> bool:
+    """Whether a stored hash was made at a cost other than BCRYPT_ROUNDS."""
+    return hash_cost(password_hash) != auth_config.BCRYPT_ROUNDS
+
+
+@lru_cache(maxsize=None)
+def _dummy_hash(rounds: int) -> str:
+    """Hash checked for unknown users, built once per cost factor."""
+    return bcrypt.hashpw(b"dummy", bcrypt.gensalt(rounds=rounds)).decode('utf-8')
+
+
 def create_access_token(user_id: int) -> str:
     """Create JWT access token."""
     now = datetime.now(UTC)
@@ -28,39 +59,63 @@ def create_access_token(user_id: int) -> str:
         "exp": expire,
         "iat": now
     }
+    algorithm = auth_config.get_algorithm()
+    if is_asymmetric(algorithm):
+        # Signed with the current key pair; `kid` names the JWKS key that verifies it
+        kid, key = signing_key()
+        return jwt.encode(payload, key, algorithm=algorithm, headers={"kid": kid})
     token = jwt.encode(
         payload,
         auth_config.get_secret_key(),
-        algorithm=auth_config.get_algorithm()
+        algorithm=algorithm
     )
     return token
 
 
-def login_user(db: Session, username: str, password: str) -> Optional[LoginResponse]:
+def _check_login_password(password: str, password_hash: Optional[str]) -> Tuple[bool, Optional[str]]:
+    """
+    Verify a login password (blocking; runs on the password hashing pool).
+
+    Returns whether the password matched and, when it did and the stored hash's
+    cost differs from BCRYPT_ROUNDS, a new hash of the password at BCRYPT_ROUNDS.
+    """
+    if password_hash is None:
+        # Always perform a password check (even if user doesn't exist) to prevent timing attacks,
+        # against a dummy hash at the configured cost so it takes as long as a real one
+        verify_password(password, _dummy_hash(auth_config.BCRYPT_ROUNDS))
+        return False, None
+    if not verify_password(password, password_hash):
+        return False, None
+    return True, hash_password(password) if needs_rehash(password_hash) else None
+
+
+async def login_user(db: AsyncSession, username: str, password: str) -> Optional[LoginResponse]:
     """
     Login user with username/email and password.
     
     Returns LoginResponse on success, None on failure.
     Uses generic error message to prevent user enumeration.
+    
+    Raises:
+        PasswordHashingBusyError: If the password hashing queue is full
     """
     # Try to find user by username or email
-    user = db.query(User).filter(
-        (User.username == username) | (User.email == username)
-    ).first()
-    
-    # Always perform password check (even if user doesn't exist) to prevent timing attacks
-    # Use a dummy hash if user doesn't exist
-    dummy_hash = bcrypt.hashpw(b"dummy", bcrypt.gensalt()).decode('utf-8')
-    password_hash = user.hashed_password if user else dummy_hash
+    result = await db.execute(
+        select(User).where(or_(User.username == username, User.email == username))
+    )
+    user = result.scalars().first()
     
-    # Constant-time password verification
-    if not verify_password(password, password_hash):
+    # Constant-time password verification, off the event loop
+    password_hash = user.hashed_password if user else None
+    verified, new_hash = await run_password_hashing(_check_login_password, password, password_hash)
+    if not verified or not user:
         # Generic error - don't reveal if user exists
         return None
     
-    # If we get here and user is None, password matched dummy (shouldn't happen, but be safe)
-    if not user:
-        return None
+    if new_hash:
+        # BCRYPT_ROUNDS changed since this hash was made: store it at the new cost
+        user.hashed_password = new_hash
+        await db.commit()
     
     # Create access token
     token = create_access_token(user.id)
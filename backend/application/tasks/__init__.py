@@ -8,7 +8,7 @@ from .list_tasks import list_tasks
 from .search_tasks import search_tasks
 from .update_task import update_task
 from .delete_task import delete_task
-from .repository import TaskRepository
+from .repository import AsyncTaskRepository
 
 __all__ = [
     "TaskCreateRequest",
@@ -22,5 +22,5 @@ __all__ = [
     "search_tasks",
     "update_task",
     "delete_task",
-    "TaskRepository"
+    "AsyncTaskRepository"
 ]
@@ -1,29 +1,33 @@
 """Create task use case."""
 
 from datetime import datetime, UTC
-from typing import Optional
 import json
 
+from domain.auth.principal import Principal
 from domain.models.task import Task
-from domain.audit.audit_event import AuditActionType
+from domain.audit.audit_event import AuditActionType, AuditEvent
 from application.tasks.schemas import TaskCreateRequest, TaskResponse
-from application.tasks.repository import TaskRepository
-from application.audit.audit_logger import AuditLogger
+from application.tasks.serialization import task_to_response
+from application.tasks.repository import AsyncTaskRepository
+from application.unit_of_work import AsyncUnitOfWork
+from infrastructure.cache.task_generation import bump_task_generation
+from infrastructure.cache.redis_cache import run_cache_io
 
 
-def create_task(
-    repository: TaskRepository,
+async def create_task(
+    repository: AsyncTaskRepository,
+    unit_of_work: AsyncUnitOfWork,
     request: TaskCreateRequest,
-    owner_user_id: int,
-    audit_logger: Optional[AuditLogger] = None
+    owner: Principal
 ) -> TaskResponse:
     """
     Create a new task.
     
     Args:
         repository: Task repository interface
+        unit_of_work: Commits the task and its audit event together
         request: Task creation request data
-        owner_user_id: ID of the authenticated user (set as owner)
+        owner: The authenticated user (set as owner)
     
     Returns:
         TaskResponse with created task data
@@ -31,6 +35,19 @@ def create_task(
     Raises:
         ValueError: If validation fails
     """
+    task = _build_task(request, owner.id)
+    
+    # Persist via repository, with its audit event
+    created_task = await repository.create(task, _created_audit_event(task))
+    
+    await unit_of_work.commit()
+    await run_cache_io(bump_task_generation)  # Invalidate cached search results/counts (after commit)
+    
+    return task_to_response(created_task, owner.username)
+
+
+def _build_task(request: TaskCreateRequest, owner_user_id: int) -> Task:
+    """Validate the request and build the new task entity."""
     # Validate title is not empty (Pydantic should handle this, but double-check)
     if not request.title or not request.title.strip():
         raise ValueError("Title is required and cannot be empty")
@@ -41,7 +58,7 @@ def create_task(
         tags_json = json.dumps(request.tags)
     
     # Create task entity
-    task = Task(
+    return Task(
         title=request.title.strip(),
         description=request.description.strip() if request.description else None,
         status=request.status,
@@ -52,43 +69,18 @@ def create_task(
         created_at=datetime.now(UTC),
         updated_at=datetime.now(UTC)
     )
-    
-    # Persist via repository
-    created_task = repository.create(task)
-    
-    # Log audit event
-    if audit_logger:
-        audit_logger.log(
-            action_type=AuditActionType.TASK_CREATED,
-            user_id=owner_user_id,
-            resource_type="task",
-            resource_id=str(created_task.id),
-            metadata={
-                "title": created_task.title,
-                "status": created_task.status,
-                "priority": created_task.priority
-            }
-        )
-    
-    # Convert tags JSON string back to list for response
-    tags_list = None
-    if created_task.tags:
-        try:
-            tags_list = json.loads(created_task.tags)
-        except (json.JSONDecodeError, TypeError):
-            tags_list = []
-    
-    # Return response
-    return TaskResponse(
-        id=created_task.id,
-        title=created_task.title,
-        description=created_task.description,
-        status=created_task.status,
-        priority=created_task.priority,
-        due_date=created_task.due_date,
-        tags=tags_list,
-        owner_user_id=created_task.owner_user_id,
-        owner_username=created_task.owner.username if created_task.owner else None,
-        created_at=created_task.created_at,
-        updated_at=created_task.updated_at
+
+
+def _created_audit_event(task: Task) -> AuditEvent:
+    """Audit event for a new task (resource_id is recorded by the repository: the id is not known yet)."""
+    return AuditEvent(
+        action_type=AuditActionType.TASK_CREATED,
+        user_id=task.owner_user_id,
+        resource_type="task",
+        resource_id=None,
+        metadata={
+            "title": task.title,
+            "status": task.status,
+            "priority": task.priority
+        }
     )
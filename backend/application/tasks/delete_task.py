@@ -1,35 +1,45 @@
 """Delete task use case."""
 
-from typing import Optional
-from domain.models.task import Task
-from domain.audit.audit_event import AuditActionType
-from application.tasks.repository import TaskRepository
-from application.attachments.repository import AttachmentRepository
+from typing import List, Optional
+
+import anyio.to_thread
+
+from domain.audit.audit_event import AuditActionType, AuditEvent
+from application.tasks.repository import AsyncTaskRepository
+from application.attachments.repository import AsyncAttachmentRepository
 from application.attachments.storage_interface import AttachmentStorage
-from application.audit.audit_logger import AuditLogger
+from application.tasks.update_task import check_task_not_owned
+from application.unit_of_work import AsyncUnitOfWork
+from infrastructure.cache.task_generation import bump_task_generation
+from infrastructure.cache.redis_cache import run_cache_io
+from infrastructure.cache import task_response_cache
 
 
-def delete_task(
-    repository: TaskRepository,
+async def delete_task(
+    repository: AsyncTaskRepository,
+    unit_of_work: AsyncUnitOfWork,
     task_id: int,
     authenticated_user_id: int,
-    attachment_repository: Optional[AttachmentRepository] = None,
-    storage: Optional[AttachmentStorage] = None,
-    audit_logger: Optional[AuditLogger] = None
+    attachment_repository: Optional[AsyncAttachmentRepository] = None,
+    storage: Optional[AttachmentStorage] = None
 ) -> bool:
     """
     Delete a task.
     
-    Only the task owner can delete the task (ownership check).
-    Also deletes all attachments associated with the task.
+    Only the task owner can delete the task: ownership is checked by the
+    DELETE statements themselves, and the task is looked up only when no row
+    matched (404 vs 403). Also deletes all attachments associated with the
+    task. The task, its attachment rows and the audit event are committed
+    together; attachment files are removed from storage once the commit
+    succeeded.
     
     Args:
         repository: Task repository interface
+        unit_of_work: Commits the deletion and its audit event together
         task_id: ID of the task to delete
         authenticated_user_id: ID of the authenticated user
         attachment_repository: Attachment repository interface (optional, for deleting attachments)
         storage: Attachment storage interface (optional, for deleting files)
-        audit_logger: Audit logger (optional, for logging deletion)
     
     Returns:
         True if task was deleted, False if task not found
@@ -37,46 +47,46 @@ def delete_task(
     Raises:
         PermissionError: If user is not the owner
     """
-    # Get task
-    task = repository.get_by_id(task_id)
-    if not task:
-        return False
-    
-    # Check ownership (defense in depth)
-    if task.owner_user_id != authenticated_user_id:
-        raise PermissionError("You can only modify your own tasks")
-    
-    # Store task title for audit before deletion
-    task_title = task.title
-    
-    # Delete all attachments for this task first
+    # Delete the task's attachment rows, then the task: both statements
+    # check ownership themselves (nothing is deleted for a non-owner)
+    storage_paths = []
     if attachment_repository and storage:
-        attachments = attachment_repository.get_by_task_id(task_id)
-        for attachment in attachments:
-            try:
-                # Delete file from storage
-                storage.delete(attachment.storage_path)
-                # Delete attachment metadata
-                attachment_repository.delete(attachment.id)
-            except Exception:
-                # Log error but continue with task deletion
-                # (don't fail task deletion if attachment deletion fails)
-                pass
+        deleted_attachments = await attachment_repository.delete_for_owned_task(task_id, authenticated_user_id)
+        storage_paths = [attachment.storage_path for attachment in deleted_attachments]
     
-    # Delete task
-    deleted = repository.delete(task_id)
+    deleted_task = await repository.delete_owned(
+        task_id, authenticated_user_id, _deleted_audit_event(task_id, authenticated_user_id)
+    )
+    if deleted_task is None:
+        # No row matched: tell a missing task from someone else's
+        check_task_not_owned(await repository.get_owner_id(task_id))
+        return False
     
-    # Log audit event (only if deletion was successful)
-    if deleted and audit_logger:
-        audit_logger.log(
-            action_type=AuditActionType.TASK_DELETED,
-            user_id=authenticated_user_id,
-            resource_type="task",
-            resource_id=str(task_id),
-            metadata={
-                "task_id": task_id,
-                "title": task_title
-            }
-        )
+    await unit_of_work.commit()
+    await run_cache_io(bump_task_generation)  # Invalidate cached search results/counts (after commit)
+    await run_cache_io(task_response_cache.invalidate, [task_id])
+    if storage_paths:
+        await anyio.to_thread.run_sync(_delete_files, storage, storage_paths)  # Blocking unlinks: off the event loop
     
-    return deleted
+    return True
+
+
+def _delete_files(storage: Optional[AttachmentStorage], storage_paths: List[str]) -> None:
+    """Remove deleted attachments' files (best effort: the rows are already gone)."""
+    for storage_path in storage_paths:
+        try:
+            storage.delete(storage_path)
+        except Exception:
+            # Don't fail task deletion if a file cannot be removed
+            pass
+
+
+def _deleted_audit_event(task_id: int, authenticated_user_id: int) -> AuditEvent:
+    """Audit event for a deletion (the repository adds the deleted task's title)."""
+    return AuditEvent(
+        action_type=AuditActionType.TASK_DELETED,
+        user_id=authenticated_user_id,
+        resource_type="task",
+        resource_id=str(task_id),
+        metadata={"task_id": task_id}
+    )
@@ -1,15 +1,18 @@
 """Get task by ID use case."""
 
-from typing import Optional
-import json
+from datetime import datetime
+from typing import Optional, Dict, List, Tuple
 
 from domain.models.task import Task
 from application.tasks.schemas import TaskResponse
-from application.tasks.repository import TaskRepository
+from application.tasks.serialization import task_to_response, encode_task_response
+from application.tasks.repository import AsyncTaskRepository
+from infrastructure.cache import task_response_cache
+from infrastructure.cache.redis_cache import run_cache_io
 
 
-def get_task_by_id(
-    repository: TaskRepository,
+async def get_task_by_id(
+    repository: AsyncTaskRepository,
     task_id: int
 ) -> Optional[TaskResponse]:
     """
@@ -24,29 +27,82 @@ def get_task_by_id(
     Returns:
         TaskResponse if task exists, None otherwise
     """
-    task = repository.get_by_id(task_id)
+    task = await repository.get_by_id(task_id)
     
     if not task:
         return None
     
-    # Convert tags JSON string back to list for response
-    tags_list = None
-    if task.tags:
-        try:
-            tags_list = json.loads(task.tags)
-        except (json.JSONDecodeError, TypeError):
-            tags_list = []
-    
-    return TaskResponse(
-        id=task.id,
-        title=task.title,
-        description=task.description,
-        status=task.status,
-        priority=task.priority,
-        due_date=task.due_date,
-        tags=tags_list,
-        owner_user_id=task.owner_user_id,
-        owner_username=task.owner.username if task.owner else None,
-        created_at=task.created_at,
-        updated_at=task.updated_at
-    )
+    return task_to_response(task)
+
+
+async def get_task_json(
+    repository: AsyncTaskRepository,
+    task_id: int
+) -> Optional[bytes]:
+    """
+    Get a single task as pre-encoded TaskResponse JSON.
+    
+    Reads only the task's updated_at from the database; the body comes from
+    the per-task response cache when it was encoded from that version.
+    
+    Args:
+        repository: Task repository interface
+        task_id: ID of the task to retrieve
+    
+    Returns:
+        JSON body if task exists, None otherwise
+    """
+    versions = await repository.get_updated_at_many([task_id])
+    return (await get_task_json_many(repository, versions)).get(task_id)
+
+
+async def get_task_json_many(
+    repository: AsyncTaskRepository,
+    versions: Dict[int, Optional[datetime]]
+) -> Dict[int, bytes]:
+    """
+    Get several tasks as pre-encoded TaskResponse JSON (multi-get).
+    
+    List endpoints select ids and updated_at in SQL and pass them here:
+    cached bodies are returned for tasks at those versions, the rest are
+    loaded in one query, encoded and cached.
+    
+    Args:
+        repository: Task repository interface
+        versions: Task id -> updated_at as read from the database
+    
+    Returns:
+        Task id -> JSON body (tasks deleted meanwhile are omitted)
+    """
+    # In-process hits are served inline; Redis is read and written off the event loop
+    cache_versions = _cache_versions(versions)
+    bodies = task_response_cache.get_local_many(cache_versions)
+    if len(bodies) < len(cache_versions):
+        bodies.update(await run_cache_io(task_response_cache.get_many, {
+            task_id: version for task_id, version in cache_versions.items() if task_id not in bodies
+        }))
+    
+    missing = [task_id for task_id in versions if task_id not in bodies]
+    if missing:
+        loaded = _encode(await repository.get_by_ids(missing), bodies)
+        await run_cache_io(task_response_cache.put_many, loaded)
+    
+    return bodies
+
+
+def _cache_versions(versions: Dict[int, Optional[datetime]]) -> Dict[int, bytes]:
+    """Cache versions for tasks by their updated_at."""
+    return {
+        task_id: task_response_cache.make_version(updated_at)
+        for task_id, updated_at in versions.items()
+    }
+
+
+def _encode(tasks: List[Task], bodies: Dict[int, bytes]) -> Dict[int, Tuple[bytes, bytes]]:
+    """Encode loaded tasks into bodies; returns the response cache entries for them."""
+    loaded = {}
+    for task in tasks:
+        response = task_to_response(task)
+        bodies[task.id] = body = encode_task_response(response)
+        loaded[task.id] = (task_response_cache.make_version(response.updated_at), body)
+    return loaded
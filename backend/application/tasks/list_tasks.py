@@ -1,15 +1,15 @@
 """List tasks use case."""
 
 from typing import List
-import json
 
 from domain.models.task import Task
 from application.tasks.schemas import TaskResponse
-from application.tasks.repository import TaskRepository
+from application.tasks.serialization import task_to_response
+from application.tasks.repository import AsyncTaskRepository
 
 
-def list_tasks(
-    repository: TaskRepository
+async def list_tasks(
+    repository: AsyncTaskRepository
 ) -> List[TaskResponse]:
     """
     List all tasks.
@@ -23,31 +23,6 @@ def list_tasks(
     Returns:
         List of TaskResponse objects
     """
-    tasks = repository.get_all()
+    tasks = await repository.get_all()
     
-    # Convert to response models
-    result = []
-    for task in tasks:
-        # Convert tags JSON string back to list for response
-        tags_list = None
-        if task.tags:
-            try:
-                tags_list = json.loads(task.tags)
-            except (json.JSONDecodeError, TypeError):
-                tags_list = []
-        
-        result.append(TaskResponse(
-            id=task.id,
-            title=task.title,
-            description=task.description,
-            status=task.status,
-            priority=task.priority,
-            due_date=task.due_date,
-            tags=tags_list,
-            owner_user_id=task.owner_user_id,
-            owner_username=task.owner.username if task.owner else None,
-            created_at=task.created_at,
-            updated_at=task.updated_at
-        ))
-    
-    return result
+    return [task_to_response(task) for task in tasks]
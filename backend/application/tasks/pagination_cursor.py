@@ -0,0 +1,122 @@
+"""Keyset (cursor) pagination helpers for task search.
+
+A cursor encodes the sort field, direction, the last row's sort value and
+its id. The next page is then a range seek on the (sort column, id) order
+instead of an OFFSET scan that walks and discards every skipped row.
+
+Cursors are opaque to clients (URL-safe base64 JSON). They only carry
+values that are bound as query parameters, so a tampered cursor can at
+worst produce a different page, never different SQL.
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, Optional, Tuple
+
+from sqlalchemy import and_, or_
+from sqlalchemy.sql.elements import ColumnElement
+
+# Sort fields whose cursor values are serialized as ISO 8601 strings
+DATETIME_SORT_FIELDS = ["due_date", "created_at", "updated_at"]
+
+
+def encode_cursor(sort_field: str, sort_direction: str, value: Any, task_id: int) -> str:
+    """
+    Encode the position after a row as an opaque cursor.
+
+    Args:
+        sort_field: Sort field name (from the search_tasks whitelist)
+        sort_direction: "asc" or "desc"
+        value: The row's value for the sort field (may be None)
+        task_id: The row's id (tie-breaker)
+
+    Returns:
+        URL-safe cursor string
+    """
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    payload = {"s": sort_field, "d": sort_direction, "v": value, "id": task_id}
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_field: str, sort_direction: str) -> Tuple[Any, int]:
+    """
+    Decode a cursor produced by encode_cursor for the given sort.
+
+    Args:
+        cursor: Cursor string from the client
+        sort_field: Sort field of the current request
+        sort_direction: Sort direction of the current request
+
+    Returns:
+        Tuple of (last sort value, last task id)
+
+    Raises:
+        ValueError: If the cursor is malformed or was issued for a different sort
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        value, task_id = payload["v"], int(payload["id"])
+        issued_for = (payload["s"], payload["d"])
+    except (ValueError, KeyError, TypeError, UnicodeEncodeError):
+        raise ValueError("Invalid cursor")
+
+    if issued_for != (sort_field, sort_direction):
+        raise ValueError("Cursor does not match the requested sort")
+
+    if value is not None and sort_field in DATETIME_SORT_FIELDS:
+        try:
+            value = datetime.fromisoformat(value)
+        except (ValueError, TypeError):
+            raise ValueError("Invalid cursor")
+
+    return value, task_id
+
+
+def build_keyset_condition(
+    sort_column: ColumnElement,
+    id_column: ColumnElement,
+    sort_direction: str,
+    value: Optional[Any],
+    last_id: int,
+    nulls_high: bool
+) -> ColumnElement:
+    """
+    Build the WHERE condition selecting rows after (value, last_id).
+
+    The order is (sort_column, id_column) in sort_direction. NULL sort
+    values are placed where the database puts them natively so the order
+    stays index-backed: highest on PostgreSQL (nulls_high=True), lowest
+    on SQLite.
+
+    Args:
+        sort_column: Column the page is ordered by
+        id_column: Unique tie-breaker column
+        sort_direction: "asc" or "desc"
+        value: Last row's sort value (None if it was NULL)
+        last_id: Last row's id
+        nulls_high: Whether NULL sorts above every value on this database
+
+    Returns:
+        SQLAlchemy condition for the next page
+    """
+    ascending = sort_direction != "desc"
+    # Do NULLs come after non-NULL values in this scan direction?
+    nulls_after = nulls_high if ascending else not nulls_high
+
+    id_after = id_column > last_id if ascending else id_column < last_id
+
+    if value is None:
+        condition = and_(sort_column.is_(None), id_after)
+        if not nulls_after:
+            condition = or_(condition, sort_column.isnot(None))
+        return condition
+
+    value_after = sort_column > value if ascending else sort_column < value
+    condition = or_(value_after, and_(sort_column == value, id_after))
+    if nulls_after:
+        condition = or_(condition, sort_column.is_(None))
+    return condition
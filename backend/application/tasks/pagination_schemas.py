@@ -1,6 +1,6 @@
 """Pagination schemas for task search/filter responses."""
 
-from typing import List
+from typing import List, Optional
 from pydantic import BaseModel, Field
 from application.tasks.schemas import TaskResponse
 
@@ -10,8 +10,19 @@ class PaginationMetadata(BaseModel):
     
     page: int = Field(..., description="Current page number (1-indexed)")
     page_size: int = Field(..., description="Number of items per page")
-    total: int = Field(..., description="Total number of tasks matching the query")
-    total_pages: int = Field(..., description="Total number of pages")
+    total: Optional[int] = Field(
+        ...,
+        description="Total number of tasks matching the query (null when include_total=false)"
+    )
+    total_pages: Optional[int] = Field(
+        ...,
+        description="Total number of pages (null when include_total=false)"
+    )
+    has_next: bool = Field(False, description="Whether another page follows this one")
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Opaque cursor for the next page (pass as `cursor`); null on the last page"
+    )
 
 
 class PaginatedTaskResponse(BaseModel):
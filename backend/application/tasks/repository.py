@@ -1,34 +1,80 @@
 """Task repository interface (Clean Architecture)."""
 
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from domain.audit.audit_event import AuditEvent
 from domain.models.task import Task
 
 
-class TaskRepository(ABC):
-    """Repository interface for task persistence."""
+class AsyncTaskRepository(ABC):
+    """Repository interface for task persistence (AsyncSession, used by async routes).
+    
+    Write methods take the write's audit event and record it with the task,
+    in the same statement where the database allows it. The event's
+    resource_id is the written task's id. Written tasks are returned without
+    their owner loaded.
+    """
     
     @abstractmethod
-    def create(self, task: Task) -> Task:
-        """Create a new task."""
+    async def create(self, task: Task, audit: Optional[AuditEvent] = None) -> Task:
+        """Create a new task (and its audit event); returns the created task."""
         pass
     
     @abstractmethod
-    def get_by_id(self, task_id: int) -> Optional[Task]:
+    async def get_by_id(self, task_id: int) -> Optional[Task]:
         """Get task by ID."""
         pass
     
     @abstractmethod
-    def get_all(self) -> List[Task]:
+    async def get_by_ids(self, task_ids: List[int]) -> List[Task]:
+        """Get tasks by IDs (owner loaded, unordered; missing IDs are skipped)."""
+        pass
+    
+    @abstractmethod
+    async def get_updated_at_many(self, task_ids: List[int]) -> Dict[int, Optional[datetime]]:
+        """Get updated_at for existing tasks by ID (cheap version check for caches)."""
+        pass
+    
+    @abstractmethod
+    async def get_all(self) -> List[Task]:
         """Get all tasks (no ownership filter for reads)."""
         pass
     
     @abstractmethod
-    def update(self, task: Task) -> Task:
-        """Update an existing task."""
+    async def get_owner_id(self, task_id: int) -> Optional[int]:
+        """Get the owner of a task (None if the task does not exist)."""
+        pass
+    
+    @abstractmethod
+    async def update_owned(
+        self,
+        task_id: int,
+        owner_user_id: int,
+        values: Dict[str, Any],
+        previous: Sequence[str] = (),
+        audit: Optional[AuditEvent] = None
+    ) -> Optional[Tuple[Task, Dict[str, Any]]]:
+        """
+        Update a task only if owned by the user (one ownership-checked UPDATE).
+        
+        Returns the updated task and the pre-update values of the `previous`
+        columns, or None if no task matched (missing or not owned).
+        The audit event records, in metadata["changes"], `{"old", "new"}` for
+        each `previous` column the update changed.
+        """
         pass
     
     @abstractmethod
-    def delete(self, task_id: int) -> bool:
-        """Delete a task by ID. Returns True if deleted, False if not found."""
+    async def delete_owned(
+        self,
+        task_id: int,
+        owner_user_id: int,
+        audit: Optional[AuditEvent] = None
+    ) -> Optional[Task]:
+        """
+        Delete a task only if owned by the user; returns the deleted row, or None if no task matched.
+        
+        The audit event records the deleted task's title in metadata["title"].
+        """
         pass
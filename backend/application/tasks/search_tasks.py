@@ -1,20 +1,93 @@
 """Search and list tasks use case with search, filters, sorting, and pagination."""
 
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import or_, and_, func
-import json
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy import or_
 import math
 
-from domain.models.task import Task
-from application.tasks.schemas import TaskResponse
-from application.tasks.repository import TaskRepository
+from domain.models.task import Task, status_rank, priority_rank, UNKNOWN_RANK
+from domain.models.user import User
+from application.tasks.serialization import row_to_response
+from application.tasks.pagination_schemas import PaginatedTaskResponse, PaginationMetadata
+from application.tasks.pagination_cursor import (
+    encode_cursor,
+    decode_cursor,
+    build_keyset_condition
+)
+from infrastructure.search.full_text import build_full_text_match
+from infrastructure.search.trigram import build_substring_match, build_tag_match
+from infrastructure.cache.count_cache import get_or_compute_count
+from infrastructure.cache.redis_cache import run_cache_io
+from infrastructure.cache.search_cache import lookup_search, store_search
 
+# Columns needed for TaskResponse (owner username is joined separately)
+TASK_LIST_COLUMNS = (
+    Task.id,
+    Task.title,
+    Task.description,
+    Task.status,
+    Task.priority,
+    Task.due_date,
+    Task.tags,
+    Task.owner_user_id,
+    Task.created_at,
+    Task.updated_at,
+    Task.priority_rank,  # Sort key for sort=priority (cursor value)
+)
 
-def search_tasks(
-    db: Session,
+# Sortable fields (whitelist) and default sort: newest first
+ALLOWED_SORT_FIELDS = ["due_date", "priority", "created_at", "updated_at", "title"]
+DEFAULT_SORT = ("created_at", "desc")
+
+# Column each sort field orders by (priority sorts by rank: low < medium < high)
+SORT_COLUMNS = {
+    "due_date": Task.due_date,
+    "priority": Task.priority_rank,
+    "created_at": Task.created_at,
+    "updated_at": Task.updated_at,
+    "title": Task.title,
+}
+
+# ORDER BY for each sort, built once (stable: id breaks ties so pages never overlap or skip rows)
+SORT_ORDERINGS = {
+    **{(field, "asc"): (column.asc(), Task.id.asc()) for field, column in SORT_COLUMNS.items()},
+    **{(field, "desc"): (column.desc(), Task.id.desc()) for field, column in SORT_COLUMNS.items()},
+}
+
+# Owner username column and its join condition, built once
+OWNER_USERNAME = User.username.label("owner_username")
+OWNER_JOIN = User.id == Task.owner_user_id
+
+
+def _parse_sort(sort: Optional[str]) -> Tuple[str, str]:
+    """
+    Parse the sort parameter (format: "field:direction").
+    
+    Returns ("relevance", "desc") for relevance sorting; invalid fields or
+    formats fall back to the default sort.
+    """
+    if not sort:
+        return DEFAULT_SORT
+    
+    parts = sort.split(":")
+    if parts[0].strip() == "relevance":
+        return "relevance", "desc"
+    
+    if len(parts) == 2:
+        sort_field, sort_direction = parts[0].strip(), parts[1].strip().lower()
+        # Validate sort field
+        if sort_field in ALLOWED_SORT_FIELDS:
+            return sort_field, "desc" if sort_direction == "desc" else "asc"
+    
+    return DEFAULT_SORT
+
+
+async def search_tasks(
+    db: AsyncSession,
     q: Optional[str] = None,
+    search_mode: str = "fulltext",
     status: Optional[str] = None,
     priority: Optional[str] = None,
     tags: Optional[List[str]] = None,
@@ -24,16 +97,25 @@ def search_tasks(
     owner_user_id: Optional[int] = None,
     sort: Optional[str] = None,
     page: int = 1,
-    page_size: int = 20
+    page_size: int = 20,
+    cursor: Optional[str] = None,
+    include_total: bool = True,
+    total_mode: str = "exact"
 ) -> Dict[str, Any]:
     """
     Search and list tasks with filters, sorting, and pagination.
     
     All authenticated users can search/filter all tasks (no ownership filter for reads).
+    Results are cached in Redis per parameter set (see infrastructure/cache/search_cache.py)
+    and invalidated by every task write. The cache is read and written off the
+    event loop (run_cache_io); the query itself (run_search, built on the ORM
+    Query API) runs on the session's connection via run_sync.
     
     Args:
         db: Database session
-        q: Search term (searches in title and description)
+        q: Search term (full-text search in title and description)
+        search_mode: "fulltext" (word/stem matching) or "substring" (partial words,
+            mid-word matches; served by the trigram index when available)
         status: Filter by status (exact match)
         priority: Filter by priority (exact match)
         tags: Filter by tags (tasks containing any of the specified tags)
@@ -41,36 +123,140 @@ def search_tasks(
         due_date_from: Filter by due date range (start)
         due_date_to: Filter by due date range (end)
         owner_user_id: Filter by task owner user ID
-        sort: Sort field and direction (e.g., "due_date:asc", "priority:desc")
-        page: Page number (1-indexed)
+        sort: Sort field and direction (e.g., "due_date:asc", "priority:desc"),
+            or "relevance" to rank full-text matches for q
+        page: Page number (1-indexed, ignored when cursor is given)
         page_size: Number of items per page (max 100)
+        cursor: Opaque keyset cursor (pagination.next_cursor of the previous page)
+        include_total: Run the COUNT query (False: total/total_pages are None,
+            use has_next to detect further pages)
+        total_mode: "exact" (COUNT every time) or "approximate" (cached count per
+            filter set, invalidated by task writes and expired after a TTL)
     
     Returns:
         Dictionary with "tasks" and "pagination" keys matching PaginatedTaskResponse schema
+    
+    Raises:
+        ValueError: If the cursor is invalid or used with sort=relevance
     """
     # Validate and limit page_size
     page_size = min(page_size, 100)  # Max 100 to prevent DoS
     page = max(page, 1)  # Min 1
     
-    # Start with base query - eager load owner relationship for username
-    query = db.query(Task).options(joinedload(Task.owner))
+    params = {
+        "q": q,
+        "search_mode": search_mode,
+        "status": status,
+        "priority": priority,
+        "tags": tags,
+        "due_date": due_date,
+        "due_date_from": due_date_from,
+        "due_date_to": due_date_to,
+        "owner_user_id": owner_user_id,
+        "sort": sort,
+        "page": page,
+        "page_size": page_size,
+        "cursor": cursor,
+        "include_total": include_total,
+        "total_mode": total_mode
+    }
+    
+    # Identical filter/sort/page combinations are served from the result
+    # cache until the next task write (or TTL). Read-your-writes sessions skip
+    # the lookup: an entry may have been computed on a lagging replica.
+    cache_params = dict(params)
+    cache_params["tags"] = sorted({tag.strip().lower() for tag in tags if tag and tag.strip()}) if tags else None
+    payload, generation = await run_cache_io(
+        lookup_search, cache_params, db.info.get("read_your_writes", False)
+    )
+    if payload is not None:
+        return _decode_result(payload)
+    
+    result = await db.run_sync(run_search, **params)
+    if generation is not None:
+        await run_cache_io(store_search, cache_params, generation, _encode_result(result))
+    return result
+
+
+def _encode_result(result: Dict[str, Any]) -> bytes:
+    """Encode a search result for the result cache."""
+    response = PaginatedTaskResponse.model_construct(
+        tasks=result["tasks"],
+        pagination=PaginationMetadata.model_construct(**result["pagination"])
+    )
+    return response.model_dump_json().encode("utf-8")
+
+
+def _decode_result(payload: bytes) -> Dict[str, Any]:
+    """Decode a cached search result back to the search_tasks result shape."""
+    response = PaginatedTaskResponse.model_validate_json(payload)
+    return {"tasks": response.tasks, "pagination": response.pagination.model_dump()}
+
+
+def run_search(
+    db: Session,
+    q: Optional[str] = None,
+    search_mode: str = "fulltext",
+    status: Optional[str] = None,
+    priority: Optional[str] = None,
+    tags: Optional[List[str]] = None,
+    due_date: Optional[datetime] = None,
+    due_date_from: Optional[datetime] = None,
+    due_date_to: Optional[datetime] = None,
+    owner_user_id: Optional[int] = None,
+    sort: Optional[str] = None,
+    page: int = 1,
+    page_size: int = 20,
+    cursor: Optional[str] = None,
+    include_total: bool = True,
+    total_mode: str = "exact"
+) -> Dict[str, Any]:
+    """
+    Run the search against the database, bypassing the result cache.
+    
+    Takes the search_tasks arguments (page and page_size already bounded);
+    search_tasks calls it through AsyncSession.run_sync.
+    """
+    # Base query: task columns only (plain rows, no ORM identity map or instrumentation
+    # per task); the owner username is joined after filtering and paging
+    query = db.query(*TASK_LIST_COLUMNS)
     
     # Apply search (q parameter)
+    relevance = None
     if q:
-        search_term = f"%{q}%"
-        # Build OR condition for title and description
-        conditions = [Task.title.ilike(search_term)]
-        # Add description condition only if description field exists (not None check per row)
-        # SQLAlchemy will handle None values in description field
-        conditions.append(Task.description.ilike(search_term))
-        query = query.filter(or_(*conditions))
+        # Prefer the search indexes: trigram for substring mode, otherwise
+        # full-text (FTS5 on SQLite, tsvector on PostgreSQL)
+        if search_mode == "substring":
+            matches = build_substring_match(db, q)
+        else:
+            matches = build_full_text_match(db, q)
+        if matches is not None:
+            query = query.join(matches, matches.c.task_id == Task.id)
+            relevance = matches.c.relevance
+        else:
+            # Fallback: substring match (no index available or no word tokens in q)
+            search_term = f"%{q}%"
+            # Build OR condition for title and description
+            conditions = [Task.title.ilike(search_term)]
+            # Add description condition only if description field exists (not None check per row)
+            # SQLAlchemy will handle None values in description field
+            conditions.append(Task.description.ilike(search_term))
+            query = query.filter(or_(*conditions))
     
     # Apply filters
+    # Status/priority filter on the integer rank columns (compact indexes);
+    # values outside the known set share rank 0 and are narrowed by the string
     if status:
-        query = query.filter(Task.status == status)
+        rank = status_rank(status)
+        query = query.filter(Task.status_rank == rank)
+        if rank == UNKNOWN_RANK:
+            query = query.filter(Task.status == status)
     
     if priority:
-        query = query.filter(Task.priority == priority)
+        rank = priority_rank(priority)
+        query = query.filter(Task.priority_rank == rank)
+        if rank == UNKNOWN_RANK:
+            query = query.filter(Task.priority == priority)
     
     if owner_user_id is not None:
         # Ensure owner_user_id is an integer for comparison
@@ -79,9 +265,6 @@ def search_tasks(
         # Apply filter directly
         query = query.filter(Task.owner_user_id == owner_id)
     
-    # Tags filter will be applied in Python after fetching (for SQLite JSON string storage)
-    # Note: This is less efficient but works for SQLite. For PostgreSQL, could use JSONB operators.
-    
     if due_date:
         query = query.filter(Task.due_date == due_date)
     
@@ -91,128 +274,87 @@ def search_tasks(
     if due_date_to:
         query = query.filter(Task.due_date <= due_date_to)
     
-    # Apply sorting (before getting count, for consistency)
-    if sort:
-        # Parse sort parameter (format: "field:direction")
-        parts = sort.split(":")
-        if len(parts) == 2:
-            sort_field, sort_direction = parts[0].strip(), parts[1].strip().lower()
-            
-            # Validate sort field
-            allowed_fields = ["due_date", "priority", "created_at", "updated_at", "title"]
-            if sort_field in allowed_fields:
-                sort_attr = getattr(Task, sort_field)
-                if sort_direction == "desc":
-                    query = query.order_by(sort_attr.desc())
-                else:
-                    query = query.order_by(sort_attr.asc())
-            else:
-                # Invalid field, use default
-                query = query.order_by(Task.created_at.desc())
-        else:
-            # Invalid format, use default
-            query = query.order_by(Task.created_at.desc())
-    else:
-        # Default sort: newest first
-        query = query.order_by(Task.created_at.desc())
-    
-    # For tags filter with SQLite JSON storage, we need to filter in Python
-    # This requires fetching all matching tasks first, then filtering by tags, then paginating
+    # Tags filter runs in SQL against the normalized task_tags table
+    # (case-insensitive partial matching, tags are stored lowercased).
     # Filter out empty tags from the filter list first
     valid_filter_tags = None
     if tags and len(tags) > 0:
-        valid_filter_tags = [tag.strip() for tag in tags if tag and tag.strip()]
-    
-    if valid_filter_tags and len(valid_filter_tags) > 0:
-        # Fetch all tasks matching other filters (before tags filter)
-        all_tasks = query.all()
-        
-        # Filter by tags in Python (case-insensitive partial matching)
-        def tag_matches(filter_tag: str, task_tags: list) -> bool:
-            """Check if filter_tag is a substring of any task tag (case-insensitive)."""
-            filter_lower = filter_tag.lower().strip()
-            # Skip empty filter tags (empty string matches everything)
-            if not filter_lower:
-                return False
-            return any(filter_lower in task_tag.lower() for task_tag in task_tags)
-        
-        filtered_tasks = []
-        for task in all_tasks:
-            if task.tags:
-                try:
-                    task_tags = json.loads(task.tags) if isinstance(task.tags, str) else task.tags
-                    if isinstance(task_tags, list):
-                        # Check if any filter tag matches any task tag (case-insensitive partial match)
-                        if any(tag_matches(filter_tag, task_tags) for filter_tag in valid_filter_tags):
-                            filtered_tasks.append(task)
-                except (json.JSONDecodeError, TypeError):
-                    pass
-        
-        # Get total count after tags filter
-        total = len(filtered_tasks)
-        
-        # Apply sorting to filtered list
-        if sort:
-            parts = sort.split(":")
-            if len(parts) == 2:
-                sort_field, sort_direction = parts[0].strip(), parts[1].strip().lower()
-                allowed_fields = ["due_date", "priority", "created_at", "updated_at", "title"]
-                if sort_field in allowed_fields:
-                    reverse = (sort_direction == "desc")
-                    filtered_tasks.sort(key=lambda t: getattr(t, sort_field) or "", reverse=reverse)
-        else:
-            # Default sort: newest first
-            filtered_tasks.sort(key=lambda t: t.created_at or "", reverse=True)
-        
-        # Apply pagination
-        offset = (page - 1) * page_size
-        tasks = filtered_tasks[offset:offset + page_size]
-        
-        # Verify and enforce owner filter if it was applied
-        if owner_user_id is not None:
-            expected_owner = int(owner_user_id)
-            # Always re-filter in Python to ensure correctness (safety measure)
-            tasks = [t for t in tasks if t.owner_user_id == expected_owner]
+        valid_filter_tags = [tag.strip().lower() for tag in tags if tag and tag.strip()]
+    
+    if valid_filter_tags:
+        # Semi-join on tasks with a tag containing any term, served by the tag
+        # trigram index (see infrastructure/search/trigram.py)
+        query = query.filter(Task.id.in_(build_tag_match(db, valid_filter_tags)))
+    
+    # Get total count (before sorting and pagination)
+    if not include_total:
+        total = None
+    elif total_mode == "approximate":
+        count_filters = {
+            "q": q,
+            "search_mode": search_mode if q else None,
+            "status": status,
+            "priority": priority,
+            "tags": sorted(set(valid_filter_tags)) if valid_filter_tags else None,
+            "due_date": due_date,
+            "due_date_from": due_date_from,
+            "due_date_to": due_date_to,
+            "owner_user_id": owner_user_id,
+        }
+        total = get_or_compute_count(count_filters, query.count)
     else:
-        # No tags filter or all tags were empty - can use SQL pagination
-        # No tags filter - can use SQL pagination
-        # Get total count (before pagination)
         total = query.count()
-        
-        # Apply pagination
-        offset = (page - 1) * page_size
-        tasks = query.offset(offset).limit(page_size).all()
-        
-        # Verify and enforce owner filter if it was applied
-        if owner_user_id is not None:
-            expected_owner = int(owner_user_id)
-            # Always re-filter in Python to ensure correctness (safety measure)
-            tasks = [t for t in tasks if t.owner_user_id == expected_owner]
-    
-    # Convert to response models
-    result = []
-    for task in tasks:
-        # Convert tags JSON string back to list for response
-        tags_list = None
-        if task.tags:
-            try:
-                tags_list = json.loads(task.tags) if isinstance(task.tags, str) else task.tags
-            except (json.JSONDecodeError, TypeError):
-                tags_list = []
-        
-        result.append(TaskResponse(
-            id=task.id,
-            title=task.title,
-            description=task.description,
-            status=task.status,
-            priority=task.priority,
-            due_date=task.due_date,
-            tags=tags_list,
-            owner_user_id=task.owner_user_id,
-            owner_username=task.owner.username if task.owner else None,
-            created_at=task.created_at,
-            updated_at=task.updated_at
+    
+    # Owner username via a join on the primary key (only users.username is read)
+    query = query.outerjoin(User, OWNER_JOIN).add_columns(OWNER_USERNAME)
+    
+    # Apply sorting (stable: id breaks ties so pages never overlap or skip rows)
+    sort_field, sort_direction = _parse_sort(sort)
+    if sort_field == "relevance" and relevance is None:
+        # Relevance sort (best match first) only applies to indexed searches
+        sort_field, sort_direction = DEFAULT_SORT
+    
+    if sort_field == "relevance":
+        if cursor:
+            raise ValueError("Cursor pagination is not supported with sort=relevance")
+        query = query.order_by(relevance.desc(), Task.created_at.desc(), Task.id.desc())
+    else:
+        query = query.order_by(*SORT_ORDERINGS[(sort_field, sort_direction)])
+    
+    # Apply pagination: keyset seek after the cursor row, or offset for page numbers
+    if cursor:
+        last_value, last_id = decode_cursor(cursor, sort_field, sort_direction)
+        query = query.filter(build_keyset_condition(
+            SORT_COLUMNS[sort_field],
+            Task.id,
+            sort_direction,
+            last_value,
+            last_id,
+            nulls_high=db.get_bind().dialect.name == "postgresql"
         ))
+    else:
+        offset = (page - 1) * page_size
+        query = query.offset(offset)
+    
+    # Fetch one extra row to know whether another page follows
+    tasks = query.limit(page_size + 1).all()
+    has_more = len(tasks) > page_size
+    tasks = tasks[:page_size]
+    
+    next_cursor = None
+    if has_more and sort_field != "relevance":
+        last_task = tasks[-1]
+        sort_value = getattr(last_task, SORT_COLUMNS[sort_field].key)
+        next_cursor = encode_cursor(sort_field, sort_direction, sort_value, last_task.id)
+    
+    # Verify and enforce owner filter if it was applied
+    if owner_user_id is not None:
+        expected_owner = int(owner_user_id)
+        # Always re-filter in Python to ensure correctness (safety measure)
+        tasks = [t for t in tasks if t.owner_user_id == expected_owner]
+    
+    # Convert rows to response models
+    result = [row_to_response(row) for row in tasks]
     
     # Return dictionary matching PaginatedTaskResponse schema
     return {
@@ -221,6 +363,8 @@ def search_tasks(
             "page": page,
             "page_size": page_size,
             "total": total,
-            "total_pages": math.ceil(total / page_size) if page_size > 0 else 0
+            "total_pages": (math.ceil(total / page_size) if page_size > 0 else 0) if total is not None else None,
+            "has_next": has_more,
+            "next_cursor": next_cursor
         }
     }
@@ -0,0 +1,86 @@
+"""Task response mapping.
+
+Single place where tasks are turned into TaskResponse objects. Values come
+straight from the database (already typed by SQLAlchemy), so responses are
+built with `model_construct` (no per-field validation) and serialized once
+by Pydantic's compiled serializer (see api/responses.py).
+"""
+
+import json
+from datetime import datetime, UTC
+from typing import List, Optional
+
+from sqlalchemy.engine import Row
+
+from domain.models.task import Task
+from application.tasks.schemas import TaskResponse
+
+
+def parse_tags(tags: Optional[str]) -> Optional[List[str]]:
+    """Convert the stored tags JSON string back to a list (invalid JSON -> [])."""
+    if not tags:
+        return None
+    try:
+        tags_list = json.loads(tags) if isinstance(tags, str) else tags
+    except (json.JSONDecodeError, TypeError):
+        return []
+    return tags_list if isinstance(tags_list, list) else []
+
+
+def stored_datetime(value: Optional[datetime]) -> Optional[datetime]:
+    """
+    Normalize a datetime to how the database returns it (naive UTC).
+    
+    Objects written in a request are not reloaded after commit, so they may
+    still hold the timezone-aware values they were given.
+    """
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(UTC).replace(tzinfo=None)
+
+
+def task_to_response(task: Task, owner_username: Optional[str] = None) -> TaskResponse:
+    """
+    Map a Task ORM object to TaskResponse.
+    
+    The owner's username is `owner_username` when given (tasks the request
+    wrote: their owner is the authenticated user, not loaded), otherwise it
+    comes from the loaded owner relationship.
+    """
+    if owner_username is None and task.owner is not None:
+        owner_username = task.owner.username
+    return TaskResponse.model_construct(
+        id=task.id,
+        title=task.title,
+        description=task.description,
+        status=task.status,
+        priority=task.priority,
+        due_date=stored_datetime(task.due_date),
+        tags=parse_tags(task.tags),
+        owner_user_id=task.owner_user_id,
+        owner_username=owner_username,
+        created_at=stored_datetime(task.created_at),
+        updated_at=stored_datetime(task.updated_at)
+    )
+
+
+def encode_task_response(response: TaskResponse) -> bytes:
+    """Encode a TaskResponse to JSON bytes with Pydantic's compiled serializer."""
+    return TaskResponse.__pydantic_serializer__.to_json(response)
+
+
+def row_to_response(row: Row) -> TaskResponse:
+    """Map a projected task row (task columns + owner_username) to TaskResponse."""
+    return TaskResponse.model_construct(
+        id=row.id,
+        title=row.title,
+        description=row.description,
+        status=row.status,
+        priority=row.priority,
+        due_date=row.due_date,
+        tags=parse_tags(row.tags),
+        owner_user_id=row.owner_user_id,
+        owner_username=row.owner_username,
+        created_at=row.created_at,
+        updated_at=row.updated_at
+    )
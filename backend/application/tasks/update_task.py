@@ -1,115 +1,115 @@
 """Update task use case."""
 
-from typing import Optional
+from datetime import datetime, UTC
+from typing import Any, Dict, Optional, Tuple
 import json
 
-from domain.models.task import Task
-from domain.audit.audit_event import AuditActionType
+from domain.auth.principal import Principal
+from domain.models.task import status_rank, priority_rank
+from domain.audit.audit_event import AuditActionType, AuditEvent
 from application.tasks.schemas import TaskUpdateRequest, TaskResponse
-from application.tasks.repository import TaskRepository
-from application.audit.audit_logger import AuditLogger
-from api.middleware.authorization import check_ownership
+from application.tasks.serialization import task_to_response
+from application.tasks.repository import AsyncTaskRepository
+from application.unit_of_work import AsyncUnitOfWork
+from infrastructure.cache.task_generation import bump_task_generation
+from infrastructure.cache.redis_cache import run_cache_io
+from infrastructure.cache import task_response_cache
 
 
-def update_task(
-    repository: TaskRepository,
+async def update_task(
+    repository: AsyncTaskRepository,
+    unit_of_work: AsyncUnitOfWork,
     task_id: int,
     request: TaskUpdateRequest,
-    authenticated_user_id: int,
-    audit_logger: Optional[AuditLogger] = None
+    authenticated_user: Principal
 ) -> Optional[TaskResponse]:
     """
     Update an existing task.
     
-    Only the task owner can update the task (ownership check).
+    Only the task owner can update the task. Ownership is checked by the
+    UPDATE itself (WHERE id AND owner_user_id); the task is looked up only
+    when no row matched, to tell a missing task from someone else's.
     
     Args:
         repository: Task repository interface
+        unit_of_work: Commits the update and its audit event together
         task_id: ID of the task to update
         request: Update request data (partial fields)
-        authenticated_user_id: ID of the authenticated user
+        authenticated_user: The authenticated user
     
     Returns:
-        TaskResponse with updated task data, or None if task not found or not owner
+        TaskResponse with updated task data, or None if task not found
     
     Raises:
         PermissionError: If user is not the owner
     """
-    # Get task
-    task = repository.get_by_id(task_id)
-    if not task:
+    values = _update_values(request)
+    
+    # Persist via repository (single ownership-checked UPDATE), with its audit event
+    result = await repository.update_owned(
+        task_id, authenticated_user.id, values, _audited_previous(values),
+        _updated_audit_event(task_id, values, authenticated_user.id)
+    )
+    if result is None:
+        check_task_not_owned(await repository.get_owner_id(task_id))
         return None
+    updated_task, _ = result
     
-    # Check ownership (defense in depth)
-    if task.owner_user_id != authenticated_user_id:
-        raise PermissionError("You can only modify your own tasks")
+    await unit_of_work.commit()
+    await run_cache_io(bump_task_generation)  # Invalidate cached search results/counts (after commit)
+    await run_cache_io(task_response_cache.invalidate, [task_id])
     
-    # Store old values for audit metadata
-    old_status = task.status
-    old_priority = task.priority
+    return task_to_response(updated_task, authenticated_user.username)  # Updated tasks are the user's own
+
+
+def _update_values(request: TaskUpdateRequest) -> Dict[str, Any]:
+    """Column values for the provided fields (derived ranks and updated_at included)."""
+    values: Dict[str, Any] = {"updated_at": datetime.now(UTC)}
     
     # Update fields (only provided fields)
     if request.title is not None:
-        task.title = request.title.strip()
+        values["title"] = request.title.strip()
     if request.description is not None:
-        task.description = request.description.strip() if request.description else None
+        values["description"] = request.description.strip() if request.description else None
     if request.status is not None:
-        task.status = request.status
+        values["status"] = request.status
+        values["status_rank"] = status_rank(request.status)
     if request.priority is not None:
-        task.priority = request.priority
+        values["priority"] = request.priority
+        values["priority_rank"] = priority_rank(request.priority)
     if request.due_date is not None:
-        task.due_date = request.due_date
+        values["due_date"] = request.due_date
     if request.tags is not None:
         # Convert tags list to JSON string
-        task.tags = json.dumps(request.tags) if request.tags else None
-    
-    # Update timestamp
-    from datetime import datetime, UTC
-    task.updated_at = datetime.now(UTC)
-    
-    # Persist via repository
-    updated_task = repository.update(task)
-    
-    # Log audit event
-    if audit_logger:
-        # Build changes metadata
-        changes = {}
-        if request.status is not None and old_status != updated_task.status:
-            changes["status"] = {"old": old_status, "new": updated_task.status}
-        if request.priority is not None and old_priority != updated_task.priority:
-            changes["priority"] = {"old": old_priority, "new": updated_task.priority}
-        if request.title is not None:
-            changes["title"] = {"new": updated_task.title}
-        
-        audit_logger.log(
-            action_type=AuditActionType.TASK_UPDATED,
-            user_id=authenticated_user_id,
-            resource_type="task",
-            resource_id=str(task_id),
-            metadata={
-                "task_id": task_id,
-                "changes": changes
-            }
-        )
+        values["tags"] = json.dumps(request.tags) if request.tags else None
     
-    # Convert tags JSON string back to list for response
-    tags_list = None
-    if updated_task.tags:
-        try:
-            tags_list = json.loads(updated_task.tags)
-        except (json.JSONDecodeError, TypeError):
-            tags_list = []
+    return values
+
+
+def _audited_previous(values: Dict[str, Any]) -> Tuple[str, ...]:
+    """Columns whose old values the audit event records (status/priority transitions)."""
+    return tuple(name for name in ("status", "priority") if name in values)
+
+
+def check_task_not_owned(owner_user_id: Optional[int]) -> None:
+    """After an ownership-checked write matched no row: raise if the task exists (not the owner)."""
+    if owner_user_id is not None:
+        raise PermissionError("You can only modify your own tasks")
+
+
+def _updated_audit_event(task_id: int, values: Dict[str, Any], authenticated_user_id: int) -> AuditEvent:
+    """Audit event for an update (the repository adds the status/priority transitions to `changes`)."""
+    changes = {}
+    if "title" in values:
+        changes["title"] = {"new": values["title"]}
     
-    return TaskResponse(
-        id=updated_task.id,
-        title=updated_task.title,
-        description=updated_task.description,
-        status=updated_task.status,
-        priority=updated_task.priority,
-        due_date=updated_task.due_date,
-        tags=tags_list,
-        owner_user_id=updated_task.owner_user_id,
-        owner_username=updated_task.owner.username if updated_task.owner else None,
-        created_at=updated_task.created_at,
-        updated_at=updated_task.updated_at
+    return AuditEvent(
+        action_type=AuditActionType.TASK_UPDATED,
+        user_id=authenticated_user_id,
+        resource_type="task",
+        resource_id=str(task_id),
+        metadata={
+            "task_id": task_id,
+            "changes": changes
+        }
     )
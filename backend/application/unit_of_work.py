@@ -0,0 +1,27 @@
+"""Unit of work interface (port in Clean Architecture).
+
+Repositories stage changes (add/flush) in the current transaction but never
+commit. The use case that owns a request or job commits once through its unit
+of work, so a write and the audit event recording it are persisted together
+(or not at all), with one commit per operation.
+"""
+
+from abc import ABC, abstractmethod
+
+
+class AsyncUnitOfWork(ABC):
+    """Transaction boundary shared by the async repositories of one operation.
+
+    This is the port (interface) in Clean Architecture.
+    Implementations should be in the infrastructure layer.
+    """
+
+    @abstractmethod
+    async def commit(self) -> None:
+        """Commit every change staged by the repositories."""
+        pass
+
+    @abstractmethod
+    async def rollback(self) -> None:
+        """Discard every change staged by the repositories."""
+        pass
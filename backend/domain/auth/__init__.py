@@ -0,0 +1 @@
+"""Auth domain module."""
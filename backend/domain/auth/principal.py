@@ -0,0 +1,24 @@
+"""Authenticated principal (the user behind a token)."""
+
+from dataclasses import dataclass
+
+from domain.models.user import User
+
+
+@dataclass(frozen=True, slots=True)
+class Principal:
+    """The authenticated user as request handlers see it.
+    
+    An immutable value, not an ORM object: it is shared across requests by
+    the principal cache and never attached to a session. It holds no
+    password hash.
+    """
+    
+    id: int
+    username: str
+    email: str
+    
+    @classmethod
+    def of(cls, user: User) -> "Principal":
+        """Build the principal of a loaded user."""
+        return cls(id=user.id, username=user.username, email=user.email)
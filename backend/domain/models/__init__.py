@@ -2,7 +2,8 @@
 
 from .user import User, Base
 from .task import Task
+from .task_tag import TaskTag
 from .attachment import Attachment
 from infrastructure.persistence.models.audit_event import AuditEvent
 
-__all__ = ["User", "Task", "Attachment", "Base", "AuditEvent"]
+__all__ = ["User", "Task", "TaskTag", "Attachment", "Base", "AuditEvent"]
@@ -18,8 +18,9 @@ Storage path format: {task_id}/{filename} (relative to uploads directory)
 """
 
 from datetime import datetime, UTC
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, ForeignKey
 from sqlalchemy.orm import relationship
+from domain.models.types import UTCDateTime
 from domain.models.user import Base
 
 
@@ -31,6 +32,8 @@ class Attachment(Base):
     """
     
     __tablename__ = "attachments"
+    # Server-generated values are fetched by the INSERT/UPDATE itself (RETURNING), not a later SELECT
+    __mapper_args__ = {"eager_defaults": True}
     
     # Primary key
     id = Column(Integer, primary_key=True, index=True)
@@ -47,9 +50,9 @@ class Attachment(Base):
     content_type = Column(String)  # MIME type (e.g., "image/png", "application/pdf")
     
     # System fields
-    uploaded_at = Column(DateTime, default=lambda: datetime.now(UTC))
-    created_at = Column(DateTime, default=lambda: datetime.now(UTC))
-    updated_at = Column(DateTime, default=lambda: datetime.now(UTC), onupdate=lambda: datetime.now(UTC))
+    uploaded_at = Column(UTCDateTime, default=lambda: datetime.now(UTC))
+    created_at = Column(UTCDateTime, default=lambda: datetime.now(UTC))
+    updated_at = Column(UTCDateTime, default=lambda: datetime.now(UTC), onupdate=lambda: datetime.now(UTC))
     
     # Relationship
     task = relationship("Task", backref="attachments")
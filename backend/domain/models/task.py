@@ -6,10 +6,14 @@ Task fields per requirements:
 - status (string, optional) - Task status (e.g., "todo", "in_progress", "done")
 - priority (string, optional) - Task priority (e.g., "low", "medium", "high")
 - due_date (datetime, optional) - Task due date
-- tags (string/JSON, optional) - Task tags (stored as JSON string for SQLite compatibility)
+- tags (string/JSON, optional) - Task tags (stored as JSON string for SQLite compatibility,
+  mirrored into the normalized `task_tags` table for indexed filtering)
 
 System fields:
 - id (integer, auto-generated) - Primary key
+- status_rank / priority_rank (smallint) - Integer sort/filter keys derived from
+  status/priority (see STATUS_RANKS / PRIORITY_RANKS): known values map to
+  their rank, other values to 0, NULL stays NULL
 - owner_user_id (integer, required) - Foreign key to users table (for authorization)
 - created_at (datetime, auto-set) - Creation timestamp
 - updated_at (datetime, auto-updated) - Last update timestamp
@@ -17,14 +21,41 @@ System fields:
 Indexes:
 - owner_user_id: For authorization queries and filtering
 - due_date: For filtering and sorting by due date
+- (owner_user_id | status_rank | priority_rank, created_at | due_date): Filter + sort composites
+- (priority_rank, id): Semantic priority sort
+- (created_at, id), (updated_at, id): Unfiltered sorts (created_at is the default)
+- task_tags (tag, task_id): For tag filtering (see domain/models/task_tag.py)
 - Full-text search on title/description: For search functionality (Task 5)
 """
 
 from datetime import datetime, UTC
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Index
-from sqlalchemy.orm import relationship
+from typing import Optional
+from sqlalchemy import Column, Integer, SmallInteger, String, ForeignKey, Text, Index
+from sqlalchemy.orm import relationship, validates
+from domain.models.types import UTCDateTime
 from domain.models.user import Base
 
+# Rank of each known value (higher = later in the workflow / more important)
+STATUS_RANKS = {"todo": 1, "in_progress": 2, "done": 3}
+PRIORITY_RANKS = {"low": 1, "medium": 2, "high": 3}
+
+# Rank of values outside the known set (kept, filtered by rank + string)
+UNKNOWN_RANK = 0
+
+
+def status_rank(status: Optional[str]) -> Optional[int]:
+    """Get the integer rank for a status value (None for no status)."""
+    if status is None:
+        return None
+    return STATUS_RANKS.get(status, UNKNOWN_RANK)
+
+
+def priority_rank(priority: Optional[str]) -> Optional[int]:
+    """Get the integer rank for a priority value (None for no priority)."""
+    if priority is None:
+        return None
+    return PRIORITY_RANKS.get(priority, UNKNOWN_RANK)
+
 
 class Task(Base):
     """Task domain model.
@@ -34,6 +65,8 @@ class Task(Base):
     """
     
     __tablename__ = "tasks"
+    # Server-generated values are fetched by the INSERT/UPDATE itself (RETURNING), not a later SELECT
+    __mapper_args__ = {"eager_defaults": True}
     
     # Primary key
     id = Column(Integer, primary_key=True, index=True)
@@ -45,22 +78,47 @@ class Task(Base):
     # Optional fields from requirements
     status = Column(String)  # e.g., "todo", "in_progress", "done"
     priority = Column(String)  # e.g., "low", "medium", "high"
-    due_date = Column(DateTime, index=True)  # Indexed for filtering/sorting
+    due_date = Column(UTCDateTime, index=True)  # Indexed for filtering/sorting
+    status_rank = Column(SmallInteger)  # Derived from status (filter key)
+    priority_rank = Column(SmallInteger)  # Derived from priority (filter + semantic sort key)
     tags = Column(String)  # JSON string: ["tag1", "tag2"] (SQLite compatible)
     
     # System fields (for authorization and tracking)
     owner_user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
-    created_at = Column(DateTime, default=lambda: datetime.now(UTC))
-    updated_at = Column(DateTime, default=lambda: datetime.now(UTC), onupdate=lambda: datetime.now(UTC))
-    reminder_sent_at = Column(DateTime, nullable=True, index=True)  # For idempotency tracking
+    created_at = Column(UTCDateTime, default=lambda: datetime.now(UTC))
+    updated_at = Column(UTCDateTime, default=lambda: datetime.now(UTC), onupdate=lambda: datetime.now(UTC))
+    reminder_sent_at = Column(UTCDateTime, nullable=True, index=True)  # For idempotency tracking
     
-    # Relationship
+    # Relationships
     owner = relationship("User", backref="tasks")
+    tag_entries = relationship("TaskTag", cascade="all, delete-orphan")  # Normalized tags for filtering
     
-    # Indexes for search/filter operations (Task 5)
+    # Indexes for search/filter operations (Task 5), matched to the search_tasks
+    # sort whitelist: (equality filter, sort column) so a filtered page is an
+    # index range scan already in sort order; id breaks ties like the ORDER BY
     __table_args__ = (
         Index('idx_task_owner_due_date', 'owner_user_id', 'due_date'),  # Composite index for filtering
+        Index('idx_task_owner_created_at', 'owner_user_id', 'created_at'),  # "My Tasks", default sort
+        Index('idx_task_status_rank_due_date', 'status_rank', 'due_date'),
+        Index('idx_task_status_rank_created_at', 'status_rank', 'created_at'),
+        Index('idx_task_priority_rank_due_date', 'priority_rank', 'due_date'),
+        Index('idx_task_priority_rank_created_at', 'priority_rank', 'created_at'),
+        Index('idx_task_priority_rank_id', 'priority_rank', 'id'),  # sort=priority
+        Index('idx_task_created_at_id', 'created_at', 'id'),  # Default sort (created_at desc)
+        Index('idx_task_updated_at_id', 'updated_at', 'id'),
     )
     
+    @validates("status")
+    def _sync_status_rank(self, key, value):
+        """Keep status_rank in sync whenever status is assigned."""
+        self.status_rank = status_rank(value)
+        return value
+    
+    @validates("priority")
+    def _sync_priority_rank(self, key, value):
+        """Keep priority_rank in sync whenever priority is assigned."""
+        self.priority_rank = priority_rank(value)
+        return value
+    
     def __repr__(self):
         return f"<Task(id={self.id}, title={self.title}, owner_user_id={self.owner_user_id})>"
@@ -0,0 +1,69 @@
+"""Task tag domain model.
+
+Normalized tag storage used for filtering:
+- task_id (integer, required) - Foreign key to tasks table
+- tag (string, required) - Tag value, stripped and lowercased
+
+`Task.tags` (JSON string) stays the source of truth for the API response;
+`task_tags` mirrors it row-per-tag so tag filtering, counting and pagination
+run in SQL instead of in Python. Partial tag matches are served by the tag
+trigram index (infrastructure/search/trigram.py).
+
+Indexes:
+- Primary key (task_id, tag): One row per distinct tag per task
+- (tag, task_id): Covering index for tag lookups (Task 5)
+"""
+
+import json
+from typing import List, Optional, Union
+from sqlalchemy import Column, Integer, String, ForeignKey, Index
+from domain.models.user import Base
+
+
+def normalize_tags(tags: Optional[Union[str, List[str]]]) -> List[str]:
+    """
+    Normalize task tags for indexed storage.
+
+    Accepts either the JSON string stored on `Task.tags` or a list of tags.
+    Returns distinct, stripped, lowercased tags (order preserved).
+    Invalid JSON is treated as no tags.
+    """
+    if not tags:
+        return []
+
+    if isinstance(tags, str):
+        try:
+            tags = json.loads(tags)
+        except (json.JSONDecodeError, TypeError):
+            return []
+
+    if not isinstance(tags, list):
+        return []
+
+    normalized = []
+    for tag in tags:
+        if not isinstance(tag, str):
+            continue
+        value = tag.strip().lower()
+        if value and value not in normalized:
+            normalized.append(value)
+    return normalized
+
+
+class TaskTag(Base):
+    """Task tag domain model.
+
+    One row per (task, tag) pair, kept in sync with `Task.tags`.
+    """
+
+    __tablename__ = "task_tags"
+
+    task_id = Column(Integer, ForeignKey("tasks.id", ondelete="CASCADE"), primary_key=True)
+    tag = Column(String, primary_key=True)  # Normalized (stripped, lowercase)
+
+    __table_args__ = (
+        Index('idx_task_tag_tag_task', 'tag', 'task_id'),  # Covering index for tag filters
+    )
+
+    def __repr__(self):
+        return f"<TaskTag(task_id={self.task_id}, tag={self.tag})>"
@@ -0,0 +1,24 @@
+"""Column types shared by the models."""
+
+from datetime import UTC
+
+from sqlalchemy import DateTime
+from sqlalchemy.types import TypeDecorator
+
+
+class UTCDateTime(TypeDecorator):
+    """
+    DateTime stored as naive UTC (timestamp without time zone).
+
+    Timezone-aware values are converted to UTC and stored without their
+    offset. asyncpg rejects aware values for these columns, and SQLite and
+    psycopg2 would silently drop the offset without converting.
+    """
+
+    impl = DateTime
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is not None and value.tzinfo is not None:
+            return value.astimezone(UTC).replace(tzinfo=None)
+        return value
@@ -9,7 +9,7 @@ and single-tenant requirements. See docs/technology.md section 3.1 for rationale
 """
 
 import os
-from typing import Optional
+from typing import List, Optional
 from jose import jwt
 
 
@@ -21,20 +21,30 @@ class AuthConfig:
     JWT_ALGORITHM: str = os.getenv("JWT_ALGORITHM", "HS256")
     JWT_ACCESS_TOKEN_EXPIRE_HOURS: int = int(os.getenv("JWT_ACCESS_TOKEN_EXPIRE_HOURS", "24"))
     
+    # Key pair signing (RS256/ES256, see infrastructure/auth/signing_keys.py)
+    JWT_SIGNING_KEY_FILE: str = os.getenv("JWT_SIGNING_KEY_FILE", "")
+    JWT_PUBLISHED_KEY_FILES: str = os.getenv("JWT_PUBLISHED_KEY_FILES", "")
+    
     # Password Hashing
     BCRYPT_ROUNDS: int = int(os.getenv("BCRYPT_ROUNDS", "12"))
     
     @classmethod
     def validate(cls) -> None:
         """Validate that required configuration is present."""
+        if cls.JWT_ALGORITHM not in ["HS256", "RS256", "ES256"]:
+            raise ValueError(f"JWT_ALGORITHM must be one of: HS256, RS256, ES256")
+        
+        if cls.JWT_ALGORITHM != "HS256":
+            # Key pair algorithms sign with JWT_SIGNING_KEY_FILE; load it now to fail at startup
+            from infrastructure.auth.signing_keys import signing_key
+            signing_key()
+            return
+        
         if not cls.JWT_SECRET_KEY:
             raise ValueError("JWT_SECRET_KEY environment variable is required")
         
         if len(cls.JWT_SECRET_KEY) < 32:
             raise ValueError("JWT_SECRET_KEY must be at least 32 characters long for security")
-        
-        if cls.JWT_ALGORITHM not in ["HS256", "RS256"]:
-            raise ValueError(f"JWT_ALGORITHM must be one of: HS256, RS256")
     
     @classmethod
     def get_secret_key(cls) -> str:
@@ -46,6 +56,11 @@ class AuthConfig:
         """Get JWT algorithm."""
         return cls.JWT_ALGORITHM
     
+    @classmethod
+    def get_published_key_files(cls) -> List[str]:
+        """Get the key files published next to the signing key (comma-separated)."""
+        return [path.strip() for path in cls.JWT_PUBLISHED_KEY_FILES.split(",") if path.strip()]
+    
     @classmethod
     def get_token_expire_hours(cls) -> int:
         """Get token expiration time in hours."""
@@ -0,0 +1,80 @@
+"""Password hashing on a dedicated, bounded thread pool.
+
+bcrypt takes hundreds of milliseconds of CPU per hash or check. Run on the
+event loop it would stall every request; run on the AnyIO threadpool shared
+by the sync endpoints, a burst of logins would take all its threads. The
+auth use cases instead await run_password_hashing(), which runs the work on
+this module's own pool (bcrypt releases the GIL, so threads hash in
+parallel):
+
+- PASSWORD_HASHING_WORKERS threads hash at once (default: CPU count, max 4)
+- up to PASSWORD_HASHING_MAX_QUEUE more jobs wait for a thread (default 32)
+- beyond that, PasswordHashingBusyError is raised at once (routes answer 503)
+  instead of queueing requests that would time out anyway
+
+Metrics: password_hashing_queue_depth (jobs waiting for a thread),
+password_hashing_rejected_total (jobs refused with the queue full).
+"""
+
+import asyncio
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, TypeVar
+
+from infrastructure.metrics.registry import (
+    PASSWORD_HASHING_QUEUE_DEPTH,
+    PASSWORD_HASHING_REJECTED_TOTAL
+)
+
+PASSWORD_HASHING_WORKERS = int(os.getenv("PASSWORD_HASHING_WORKERS", str(min(4, os.cpu_count() or 1))))
+PASSWORD_HASHING_MAX_QUEUE = int(os.getenv("PASSWORD_HASHING_MAX_QUEUE", "32"))
+
+T = TypeVar("T")
+
+_executor = ThreadPoolExecutor(max_workers=PASSWORD_HASHING_WORKERS, thread_name_prefix="password-hashing")
+_pending = 0  # Jobs submitted and not finished (running + waiting)
+_lock = threading.Lock()
+
+
+class PasswordHashingBusyError(Exception):
+    """Raised when the password hashing queue is full."""
+
+
+def _report_queue_depth() -> None:
+    """Export the number of jobs waiting for a thread (caller holds _lock)."""
+    PASSWORD_HASHING_QUEUE_DEPTH.set(max(_pending - PASSWORD_HASHING_WORKERS, 0))
+
+
+async def run_password_hashing(function: Callable[..., T], *args) -> T:
+    """
+    Run a password hashing function on the hashing pool.
+
+    Args:
+        function: Blocking function doing the bcrypt work
+        *args: Arguments for the function
+
+    Returns:
+        The function's result
+
+    Raises:
+        PasswordHashingBusyError: If PASSWORD_HASHING_MAX_QUEUE jobs are already waiting
+    """
+    global _pending
+    with _lock:
+        if _pending >= PASSWORD_HASHING_WORKERS + PASSWORD_HASHING_MAX_QUEUE:
+            PASSWORD_HASHING_REJECTED_TOTAL.inc()
+            raise PasswordHashingBusyError("Password hashing queue is full")
+        _pending += 1
+        _report_queue_depth()
+    future = _executor.submit(function, *args)
+    # Counted until the job itself ends, even if the awaiting request is cancelled
+    future.add_done_callback(_job_done)
+    return await asyncio.wrap_future(future)
+
+
+def _job_done(future) -> None:
+    global _pending
+    with _lock:
+        _pending -= 1
+        _report_queue_depth()
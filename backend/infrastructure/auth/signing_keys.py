@@ -0,0 +1,123 @@
+"""Asymmetric JWT signing keys and the JWKS that publishes them.
+
+With JWT_ALGORITHM=RS256 or ES256, access tokens are signed with the private
+key in JWT_SIGNING_KEY_FILE (PEM) and carry its `kid` header. The public
+keys are served as a JWK Set at /.well-known/jwks.json, so other services
+verify tokens locally instead of sharing JWT_SECRET_KEY or calling this API.
+
+Each key's `kid` is its RFC 7638 thumbprint, so it never has to be
+configured and stays the same when a key moves from signing to published.
+
+Rotation (JWT_PUBLISHED_KEY_FILES: comma-separated PEM files, public or
+private, published and accepted next to the signing key):
+1. Publish the new key in JWT_PUBLISHED_KEY_FILES and wait
+   JWKS_MAX_AGE_SECONDS, so verifiers have fetched it before it signs.
+2. Make it JWT_SIGNING_KEY_FILE and move the old key to
+   JWT_PUBLISHED_KEY_FILES.
+3. Remove the old key once JWT_ACCESS_TOKEN_EXPIRE_HOURS have passed and
+   no token it signed is still valid.
+
+Keys are parsed once (at startup validation or first use) and reused;
+reload_signing_keys() re-reads the files.
+"""
+
+import base64
+import hashlib
+import json
+import os
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+from jose import jwk
+from jose.backends.base import Key
+from jose.exceptions import JWKError
+
+from infrastructure.auth.config import auth_config
+
+ASYMMETRIC_ALGORITHMS = ("RS256", "ES256")
+
+JWKS_MAX_AGE_SECONDS = int(os.getenv("JWKS_MAX_AGE_SECONDS", "300"))
+
+# JWK members of the RFC 7638 thumbprint, per key type
+_THUMBPRINT_MEMBERS = {"RSA": ("e", "kty", "n"), "EC": ("crv", "kty", "x", "y")}
+
+
+def is_asymmetric(algorithm: str) -> bool:
+    """Whether tokens of this algorithm are signed with a key pair (and published in the JWKS)."""
+    return algorithm in ASYMMETRIC_ALGORITHMS
+
+
+def read_key(path: str, algorithm: str) -> Key:
+    """Parse a PEM key file for the algorithm."""
+    try:
+        with open(path, "rb") as key_file:
+            return jwk.construct(key_file.read(), algorithm)
+    except (OSError, JWKError) as e:
+        raise ValueError(f"Cannot load {algorithm} key from {path}: {e}") from e
+
+
+def key_id(key: Key) -> str:
+    """A key's `kid`: the RFC 7638 thumbprint (SHA-256, base64url) of its public JWK."""
+    public_jwk = key.public_key().to_dict()
+    members = {name: public_jwk[name] for name in _THUMBPRINT_MEMBERS[public_jwk["kty"]]}
+    canonical = json.dumps(members, separators=(",", ":"), sort_keys=True).encode("utf-8")
+    return base64.urlsafe_b64encode(hashlib.sha256(canonical).digest()).rstrip(b"=").decode("ascii")
+
+
+@lru_cache(maxsize=1)
+def _load_keys() -> Tuple[str, Key, Dict[str, Key]]:
+    """Load the signing key and the public keys (kid -> key) of all configured files."""
+    algorithm = auth_config.get_algorithm()
+    if not auth_config.JWT_SIGNING_KEY_FILE:
+        raise ValueError(f"JWT_SIGNING_KEY_FILE environment variable is required for {algorithm}")
+
+    signing = read_key(auth_config.JWT_SIGNING_KEY_FILE, algorithm)
+    if signing.is_public():
+        raise ValueError("JWT_SIGNING_KEY_FILE must contain a private key")
+
+    public_keys: Dict[str, Key] = {}
+    for key in [signing] + [read_key(path, algorithm) for path in auth_config.get_published_key_files()]:
+        public_keys[key_id(key)] = key.public_key()
+    return key_id(signing), signing, public_keys
+
+
+def signing_key() -> Tuple[str, Key]:
+    """
+    Get the key that signs new tokens.
+
+    Returns:
+        Tuple of (kid, private key)
+
+    Raises:
+        ValueError: If the key files are missing or invalid
+    """
+    kid, key, _ = _load_keys()
+    return kid, key
+
+
+def verification_key(kid: Optional[str]) -> Optional[Key]:
+    """
+    Get the public key for a token's `kid` header.
+
+    Returns:
+        The signing or a published key with that kid, or None if there is none
+    """
+    return _load_keys()[2].get(kid)
+
+
+@lru_cache(maxsize=1)
+def jwks_document() -> bytes:
+    """
+    Serialized JWK Set of the public keys (empty for HS256: the secret is never published).
+    """
+    keys = []
+    if is_asymmetric(auth_config.get_algorithm()):
+        for kid, key in _load_keys()[2].items():
+            keys.append({**key.to_dict(), "kid": kid, "use": "sig"})
+    return json.dumps({"keys": keys}, separators=(",", ":")).encode("utf-8")
+
+
+def reload_signing_keys() -> None:
+    """Forget the parsed keys; the next use reads the key files again."""
+    _load_keys.cache_clear()
+    jwks_document.cache_clear()
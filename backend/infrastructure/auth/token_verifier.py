@@ -0,0 +1,85 @@
+"""Access token verification with a verified-token cache.
+
+Clients send the same bearer token on every request until it expires.
+Verifying it (signature check and JSON parsing) once per token instead of
+once per request, the claims of a verified token are cached under the
+token's SHA-256 digest until the token's `exp`. Only tokens that passed
+verification are cached, so a forged or altered token (different digest)
+is always verified in full.
+
+The cache is in-process and bounded (VERIFIED_TOKEN_CACHE_MAX_ENTRIES,
+least recently used evicted first). JWT settings are read at startup, so
+changing the secret key restarts the process and empties the cache. With
+RS256/ES256, the token's `kid` header selects the public key (signing or
+published key, see signing_keys.py); once a retired key is removed from
+the configuration, the tokens it signed fail verification.
+"""
+
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Tuple
+
+from jose import JWTError, jwt
+
+from infrastructure.auth.config import auth_config
+from infrastructure.auth.signing_keys import is_asymmetric, verification_key
+
+VERIFIED_TOKEN_CACHE_MAX_ENTRIES = int(os.getenv("VERIFIED_TOKEN_CACHE_MAX_ENTRIES", "10000"))
+
+# token digest -> (exp, claims), least recently used first
+_verified: "OrderedDict[bytes, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+_lock = threading.Lock()
+
+
+def _verification_key(token: str, algorithm: str) -> Any:
+    """Key verifying a token: the shared secret, or the public key named by its `kid` header."""
+    if not is_asymmetric(algorithm):
+        return auth_config.get_secret_key()
+    key = verification_key(jwt.get_unverified_header(token).get("kid"))
+    if key is None:
+        raise JWTError("Token signed with an unknown key")
+    return key
+
+
+def verify_access_token(token: str) -> Dict[str, Any]:
+    """
+    Verify an access token and return its claims.
+
+    Args:
+        token: Encoded JWT (bearer token)
+
+    Returns:
+        The token's claims (shared with the cache: do not modify)
+
+    Raises:
+        JWTError: If the signature is invalid or the token has expired
+    """
+    digest = hashlib.sha256(token.encode("utf-8")).digest()
+    now = time.time()
+    with _lock:
+        entry = _verified.get(digest)
+        if entry is not None:
+            if entry[0] > now:
+                _verified.move_to_end(digest)
+                return entry[1]
+            del _verified[digest]
+
+    algorithm = auth_config.get_algorithm()
+    claims = jwt.decode(token, _verification_key(token, algorithm), algorithms=[algorithm])
+    expires_at = claims.get("exp")
+    if isinstance(expires_at, (int, float)) and VERIFIED_TOKEN_CACHE_MAX_ENTRIES > 0:
+        with _lock:
+            _verified[digest] = (float(expires_at), claims)
+            _verified.move_to_end(digest)
+            while len(_verified) > VERIFIED_TOKEN_CACHE_MAX_ENTRIES:
+                _verified.popitem(last=False)
+    return claims
+
+
+def clear_verified_tokens() -> None:
+    """Drop all cached verifications."""
+    with _lock:
+        _verified.clear()
@@ -0,0 +1,17 @@
+"""Infrastructure layer - Cache module."""
+
+from .task_generation import get_task_generation, bump_task_generation
+from .count_cache import get_or_compute_count, clear_count_cache
+from .search_cache import lookup_search, store_search, invalidate_search_cache
+from . import task_response_cache
+
+__all__ = [
+    "get_task_generation",
+    "bump_task_generation",
+    "get_or_compute_count",
+    "clear_count_cache",
+    "lookup_search",
+    "store_search",
+    "invalidate_search_cache",
+    "task_response_cache"
+]
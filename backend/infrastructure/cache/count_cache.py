@@ -0,0 +1,67 @@
+"""Cached total counts for task search (approximate count mode).
+
+Keyed by a hash of the normalized search filters. Entries are dropped when
+the task generation changes (any task write in this process) or after a
+TTL, which also bounds staleness for writes made by other processes.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Tuple
+
+from infrastructure.cache.task_generation import get_task_generation
+
+COUNT_CACHE_TTL_SECONDS = float(os.getenv("TASK_COUNT_CACHE_TTL_SECONDS", "60"))
+COUNT_CACHE_MAX_ENTRIES = int(os.getenv("TASK_COUNT_CACHE_MAX_ENTRIES", "1024"))
+
+# key -> (generation, expires_at, count), least recently used first
+_entries: "OrderedDict[str, Tuple[int, float, int]]" = OrderedDict()
+_lock = threading.Lock()
+
+
+def make_count_key(filters: Dict[str, Any]) -> str:
+    """Build a stable cache key from normalized filter values."""
+    raw = json.dumps(filters, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def get_or_compute_count(filters: Dict[str, Any], compute: Callable[[], int]) -> int:
+    """
+    Get the cached count for the filters, computing and storing it on a miss.
+
+    Args:
+        filters: Normalized filter values identifying the result set
+        compute: Callable running the exact COUNT query
+
+    Returns:
+        Total number of matching tasks
+    """
+    key = make_count_key(filters)
+    generation = get_task_generation()
+    now = time.monotonic()
+
+    with _lock:
+        entry = _entries.get(key)
+        if entry and entry[0] == generation and entry[1] > now:
+            _entries.move_to_end(key)
+            return entry[2]
+
+    count = compute()
+
+    with _lock:
+        _entries[key] = (generation, now + COUNT_CACHE_TTL_SECONDS, count)
+        _entries.move_to_end(key)
+        while len(_entries) > COUNT_CACHE_MAX_ENTRIES:
+            _entries.popitem(last=False)
+
+    return count
+
+
+def clear_count_cache() -> None:
+    """Drop all cached counts."""
+    with _lock:
+        _entries.clear()
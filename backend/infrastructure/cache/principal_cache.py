@@ -0,0 +1,172 @@
+"""Cache of authenticated principals (the user behind a token).
+
+get_current_user runs on every authenticated request; with the principal
+cached it needs no database query. Entries are Principal values (the user
+fields handlers read), keyed by user id, never the password hash.
+
+Two tiers:
+- in-process LRU (PRINCIPAL_CACHE_MAX_ENTRIES entries), each entry kept for
+  PRINCIPAL_CACHE_TTL_SECONDS
+- shared Redis (`principal:<id>`, same TTL), bypassed while Redis is unavailable
+
+Password changes and password resets call invalidate_principal(), which
+drops the entry from this process's tier and from Redis; users deleted
+through the ORM are invalidated once their deletion commits. Other API
+processes keep their in-process entry until it expires, so the TTL bounds
+how long they may still accept a deleted user.
+
+get_local_principal() reads only the in-process tier, so async callers can
+serve hits on the event loop and call get_principal() through run_cache_io()
+on a miss.
+"""
+
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict
+from typing import Optional, Tuple
+
+import redis
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from domain.auth.principal import Principal
+from domain.models.user import User
+from infrastructure.cache.redis_cache import get_cache_client, mark_cache_client_unavailable
+from infrastructure.metrics.registry import (
+    PRINCIPAL_CACHE_HITS_TOTAL,
+    PRINCIPAL_CACHE_MISSES_TOTAL
+)
+
+PRINCIPAL_CACHE_ENABLED = os.getenv("PRINCIPAL_CACHE_ENABLED", "true").lower() == "true"
+PRINCIPAL_CACHE_MAX_ENTRIES = int(os.getenv("PRINCIPAL_CACHE_MAX_ENTRIES", "10000"))
+PRINCIPAL_CACHE_TTL_SECONDS = int(os.getenv("PRINCIPAL_CACHE_TTL_SECONDS", "60"))
+
+KEY_PREFIX = "principal:"
+
+# user_id -> (expires_at monotonic, principal), least recently used first
+_entries: "OrderedDict[int, Tuple[float, Principal]]" = OrderedDict()
+_lock = threading.Lock()
+
+# Session.info key: ids of users deleted in the session's transaction
+_DELETED_USERS_KEY = "principal_cache_deleted_user_ids"
+
+
+def _remember(principal: Principal) -> None:
+    """Store an entry in the in-process tier (caller holds _lock)."""
+    user_id = principal.id
+    _entries[user_id] = (time.monotonic() + PRINCIPAL_CACHE_TTL_SECONDS, principal)
+    _entries.move_to_end(user_id)
+    while len(_entries) > PRINCIPAL_CACHE_MAX_ENTRIES:
+        _entries.popitem(last=False)
+
+
+def get_local_principal(user_id: int) -> Optional[Principal]:
+    """Get the cached principal of a user from the in-process tier only (no Redis I/O)."""
+    if not PRINCIPAL_CACHE_ENABLED:
+        return None
+
+    with _lock:
+        entry = _entries.get(user_id)
+        if entry is not None:
+            if entry[0] > time.monotonic():
+                _entries.move_to_end(user_id)
+                PRINCIPAL_CACHE_HITS_TOTAL.labels(tier="memory").inc()
+                return entry[1]
+            del _entries[user_id]
+    return None
+
+
+def get_principal(user_id: int) -> Optional[Principal]:
+    """
+    Get the cached principal of a user.
+
+    Args:
+        user_id: User id (the token subject)
+
+    Returns:
+        The user's principal, or None if not cached
+    """
+    if not PRINCIPAL_CACHE_ENABLED:
+        return None
+
+    principal = get_local_principal(user_id)
+    if principal is not None:
+        return principal
+
+    client = get_cache_client()
+    if client is not None:
+        try:
+            value = client.get(f"{KEY_PREFIX}{user_id}")
+        except redis.RedisError as e:
+            mark_cache_client_unavailable(e)
+            value = None
+        if value:
+            principal = Principal(**json.loads(value))
+            with _lock:
+                _remember(principal)
+            PRINCIPAL_CACHE_HITS_TOTAL.labels(tier="redis").inc()
+            return principal
+
+    PRINCIPAL_CACHE_MISSES_TOTAL.inc()
+    return None
+
+
+def put_principal(principal: Principal) -> None:
+    """Store a principal in both tiers."""
+    if not PRINCIPAL_CACHE_ENABLED:
+        return
+
+    with _lock:
+        _remember(principal)
+
+    client = get_cache_client()
+    if client is None:
+        return
+    try:
+        client.set(f"{KEY_PREFIX}{principal.id}", json.dumps(asdict(principal)), ex=PRINCIPAL_CACHE_TTL_SECONDS)
+    except redis.RedisError as e:
+        mark_cache_client_unavailable(e)
+
+
+def invalidate_principal(user_id: int) -> None:
+    """Drop a user's cached principal from this process and from Redis."""
+    with _lock:
+        _entries.pop(user_id, None)
+
+    client = get_cache_client() if PRINCIPAL_CACHE_ENABLED else None
+    if client is None:
+        return
+    try:
+        client.delete(f"{KEY_PREFIX}{user_id}")
+    except redis.RedisError as e:
+        mark_cache_client_unavailable(e)
+
+
+def clear_principal_cache() -> None:
+    """Drop all entries from the in-process tier."""
+    with _lock:
+        _entries.clear()
+
+
+@event.listens_for(Session, "after_flush")
+def _record_deleted_users(session: Session, flush_context) -> None:
+    """Remember the users a flush deleted (no I/O: the transaction may still roll back)."""
+    user_ids = [instance.id for instance in session.deleted if isinstance(instance, User)]
+    if user_ids:
+        session.info.setdefault(_DELETED_USERS_KEY, set()).update(user_ids)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_deleted_users(session: Session) -> None:
+    """Deleting a user through the ORM drops their cached principal once committed."""
+    for user_id in session.info.pop(_DELETED_USERS_KEY, ()):
+        invalidate_principal(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_deleted_users(session: Session) -> None:
+    """A rolled-back deletion keeps the user's cached principal."""
+    session.info.pop(_DELETED_USERS_KEY, None)
@@ -0,0 +1,121 @@
+"""Shared Redis client for the application caches.
+
+Caches must never fail a request: while Redis is unreachable
+get_cache_client() returns None (callers bypass the cache) and reconnection
+is retried at most every CACHE_REDIS_RETRY_SECONDS. Caches that depend on
+invalidations sent while Redis was down register a reconnect hook.
+
+Cache commands are not retried, so one call takes at most
+CACHE_REDIS_TIMEOUT_SECONDS. A reconnect (with its hooks) runs in the
+calling thread without holding the lock: other callers get None meanwhile.
+
+The client is blocking (redis-py). Async code calls cache functions through
+run_cache_io(), which runs them in a worker thread, so a slow or unreachable
+Redis (up to CACHE_REDIS_TIMEOUT_SECONDS per call) never stalls the event loop.
+"""
+
+import functools
+import logging
+import os
+import threading
+import time
+from typing import Callable, List, Optional, TypeVar
+
+import anyio.to_thread
+import redis
+
+from infrastructure.rate_limiting.redis_client import create_redis_client
+
+logger = logging.getLogger(__name__)
+
+CACHE_REDIS_RETRY_SECONDS = float(os.getenv("CACHE_REDIS_RETRY_SECONDS", "30"))
+# Short timeout: a slow cache must not be slower than the query it replaces
+CACHE_REDIS_TIMEOUT_SECONDS = float(os.getenv("CACHE_REDIS_TIMEOUT_SECONDS", "0.2"))
+
+_client: Optional[redis.Redis] = None
+_retry_at = 0.0
+_connecting = False  # A thread is connecting (and running the reconnect hooks)
+_lock = threading.Lock()
+_reconnect_hooks: List[Callable[[redis.Redis], None]] = []
+
+T = TypeVar("T")
+
+
+def register_reconnect_hook(hook: Callable[[redis.Redis], None]) -> None:
+    """Run hook(client) on every (re)connect, before the client is handed out."""
+    _reconnect_hooks.append(hook)
+
+
+def get_cache_client() -> Optional[redis.Redis]:
+    """Get the cache Redis client (bytes responses), or None while Redis is unavailable."""
+    global _client, _retry_at, _connecting
+    if _client is not None:
+        return _client
+
+    with _lock:
+        if _client is not None:
+            return _client
+        if _connecting or time.monotonic() < _retry_at:
+            return None
+        _connecting = True
+
+    connected = None
+    try:
+        client = create_redis_client(
+            decode_responses=False,
+            socket_timeout=CACHE_REDIS_TIMEOUT_SECONDS,
+            retries=0
+        )
+        for hook in _reconnect_hooks:
+            hook(client)
+        connected = client
+    except redis.RedisError as e:
+        logger.warning(f"Redis unavailable for caching: {e}. Caches bypassed.")
+    finally:
+        with _lock:
+            _connecting = False
+            if connected is None:
+                _retry_at = time.monotonic() + CACHE_REDIS_RETRY_SECONDS
+            else:
+                _client = connected
+    return connected
+
+
+def cache_client_backing_off() -> bool:
+    """Whether get_cache_client() returns None without contacting Redis (waiting to retry, or connecting)."""
+    return _client is None and (_connecting or time.monotonic() < _retry_at)
+
+
+async def run_cache_io(function: Callable[..., T], *args) -> T:
+    """
+    Call a cache function that may talk to Redis from async code.
+
+    It runs in a worker thread, off the event loop. While Redis is known to
+    be unavailable the function only touches in-process state, so it runs
+    inline instead.
+    """
+    if cache_client_backing_off():
+        return function(*args)
+    return await anyio.to_thread.run_sync(functools.partial(function, *args))
+
+
+def mark_cache_client_unavailable(error: Exception) -> None:
+    """Drop the client after a Redis error; retry after CACHE_REDIS_RETRY_SECONDS."""
+    global _client, _retry_at
+    logger.warning(f"Cache Redis error: {error}. Caches bypassed.")
+    with _lock:
+        _client = None
+        _retry_at = time.monotonic() + CACHE_REDIS_RETRY_SECONDS
+
+
+def reset_cache_client() -> None:
+    """Drop the client and retry state (reconnects on next use)."""
+    global _client, _retry_at
+    with _lock:
+        if _client is not None:
+            try:
+                _client.close()
+            except Exception:
+                pass
+        _client = None
+        _retry_at = 0.0
@@ -0,0 +1,152 @@
+"""Redis-backed result cache for task search.
+
+Entries are keyed by a hash of the normalized search parameters and tagged
+with the shared task generation (`task_search:generation` in Redis) that was
+current when the query started. Task writes INCR that counter (see
+bump_task_generation), so every cached page becomes stale at once in O(1),
+in every API process. Entries also expire after SEARCH_CACHE_TTL_SECONDS,
+at most SEARCH_CACHE_MAX_ENTRIES are kept (oldest evicted first) and results
+larger than SEARCH_CACHE_MAX_ENTRY_BYTES are not cached.
+
+If Redis is disabled or unreachable the cache is bypassed and queries run
+against the database; reconnection is retried every CACHE_REDIS_RETRY_SECONDS
+(see infrastructure/cache/redis_cache.py).
+Since writes made during an outage could not bump the generation, it is
+bumped again on reconnect before any entry is served.
+
+Lookups and stores are separate calls (lookup_search, store_search) so async
+callers can run each through run_cache_io() and the query in between on the
+database session.
+"""
+
+import hashlib
+import json
+import os
+import time
+from typing import Any, Dict, Optional, Tuple
+
+import redis
+
+from infrastructure.cache.redis_cache import (
+    get_cache_client,
+    mark_cache_client_unavailable,
+    register_reconnect_hook
+)
+from infrastructure.metrics.registry import (
+    TASK_SEARCH_CACHE_HITS_TOTAL,
+    TASK_SEARCH_CACHE_MISSES_TOTAL,
+    TASK_SEARCH_CACHE_BYPASS_TOTAL
+)
+
+SEARCH_CACHE_ENABLED = os.getenv("SEARCH_CACHE_ENABLED", "true").lower() == "true"
+SEARCH_CACHE_TTL_SECONDS = int(os.getenv("SEARCH_CACHE_TTL_SECONDS", "30"))
+SEARCH_CACHE_MAX_ENTRIES = int(os.getenv("SEARCH_CACHE_MAX_ENTRIES", "10000"))
+SEARCH_CACHE_MAX_ENTRY_BYTES = int(os.getenv("SEARCH_CACHE_MAX_ENTRY_BYTES", "262144"))
+
+KEY_PREFIX = "task_search:result:"
+GENERATION_KEY = "task_search:generation"
+INDEX_KEY = "task_search:index"  # Sorted set of entry keys by insertion time (size bound)
+
+
+def make_search_key(params: Dict[str, Any]) -> str:
+    """Build a stable cache key from normalized search parameters."""
+    raw = json.dumps(params, sort_keys=True, default=str, separators=(",", ":"))
+    return KEY_PREFIX + hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _bump_generation_on_reconnect(client: redis.Redis) -> None:
+    """Writes during a Redis outage could not invalidate cached pages."""
+    client.incr(GENERATION_KEY)
+
+
+register_reconnect_hook(_bump_generation_on_reconnect)
+
+
+def _get_client() -> Optional[redis.Redis]:
+    """Get the cache client, or None while disabled or Redis is unavailable."""
+    if not SEARCH_CACHE_ENABLED:
+        return None
+    return get_cache_client()
+
+
+def _store(client: redis.Redis, key: str, generation: bytes, payload: bytes) -> None:
+    """Store an entry and evict the oldest entries beyond SEARCH_CACHE_MAX_ENTRIES."""
+    pipe = client.pipeline(transaction=False)
+    pipe.set(key, generation + b":" + payload, ex=SEARCH_CACHE_TTL_SECONDS)
+    pipe.zadd(INDEX_KEY, {key: time.time()})
+    pipe.zcard(INDEX_KEY)
+    size = pipe.execute()[-1]
+
+    if size > SEARCH_CACHE_MAX_ENTRIES:
+        evicted = client.zpopmin(INDEX_KEY, size - SEARCH_CACHE_MAX_ENTRIES)
+        if evicted:
+            client.delete(*[member for member, _ in evicted])
+
+
+def lookup_search(params: Dict[str, Any], refresh: bool = False) -> Tuple[Optional[bytes], Optional[bytes]]:
+    """
+    Look up the cached search result for the parameters.
+
+    On a miss, compute the result and pass it to store_search() with the
+    returned generation. The generation is read before the query runs, so a
+    write racing with the query leaves the stored entry already stale.
+
+    Args:
+        params: Normalized search parameters identifying the result page
+        refresh: Skip the lookup (always a miss) but still return the generation
+
+    Returns:
+        Tuple of (cached payload or None, generation to store a computed
+        result under, or None if the cache is bypassed)
+    """
+    client = _get_client()
+    if client is None:
+        TASK_SEARCH_CACHE_BYPASS_TOTAL.inc()
+        return None, None
+
+    try:
+        # One round trip for the generation and the entry
+        generation, entry = client.mget(GENERATION_KEY, make_search_key(params))
+    except redis.RedisError as e:
+        mark_cache_client_unavailable(e)
+        TASK_SEARCH_CACHE_BYPASS_TOTAL.inc()
+        return None, None
+
+    generation = generation or b"0"
+    if entry and not refresh:
+        entry_generation, _, payload = entry.partition(b":")
+        if entry_generation == generation:
+            TASK_SEARCH_CACHE_HITS_TOTAL.inc()
+            return payload, generation
+
+    TASK_SEARCH_CACHE_MISSES_TOTAL.inc()
+    return None, generation
+
+
+def store_search(params: Dict[str, Any], generation: bytes, payload: bytes) -> None:
+    """
+    Store a computed search result (skipped if larger than SEARCH_CACHE_MAX_ENTRY_BYTES).
+
+    Args:
+        params: Normalized search parameters, as passed to lookup_search
+        generation: Generation returned by lookup_search before the query ran
+        payload: Encoded search result
+    """
+    client = _get_client()
+    if client is None or len(payload) > SEARCH_CACHE_MAX_ENTRY_BYTES:
+        return
+    try:
+        _store(client, make_search_key(params), generation, payload)
+    except redis.RedisError as e:
+        mark_cache_client_unavailable(e)
+
+
+def invalidate_search_cache() -> None:
+    """Invalidate every cached search result (O(1): bumps the shared generation)."""
+    client = _get_client()
+    if client is None:
+        return  # Reconnecting bumps the generation
+    try:
+        client.incr(GENERATION_KEY)
+    except redis.RedisError as e:
+        mark_cache_client_unavailable(e)
@@ -0,0 +1,35 @@
+"""Task data generation counter for cache invalidation.
+
+Every task write (create, update, delete) bumps the generation. Cache
+entries remember the generation they were computed at and are ignored
+once it has moved on, so invalidation is O(1) regardless of how many
+entries exist. The in-process counter covers the count cache; the Redis
+search result cache keeps a shared counter bumped alongside it.
+"""
+
+import threading
+
+from infrastructure.cache.search_cache import invalidate_search_cache
+
+_generation = 0
+_lock = threading.Lock()
+
+
+def get_task_generation() -> int:
+    """Get the current task data generation."""
+    return _generation
+
+
+def bump_task_generation() -> int:
+    """
+    Invalidate all cached task query results.
+
+    Returns:
+        The new generation
+    """
+    global _generation
+    with _lock:
+        _generation += 1
+        generation = _generation
+    invalidate_search_cache()
+    return generation
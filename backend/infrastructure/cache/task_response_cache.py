@@ -0,0 +1,161 @@
+"""Per-task cache of pre-encoded TaskResponse JSON bodies.
+
+Entries are keyed by task id and versioned by the task's `updated_at`:
+callers pass the version they read from the database and only a body
+encoded from that exact version is returned, so a task changed by any
+writer is never served stale. Update/delete use cases also drop entries
+explicitly.
+
+Two tiers:
+- in-process LRU (TASK_RESPONSE_CACHE_MAX_ENTRIES entries)
+- shared Redis (`task_response:<id>`, expires after TASK_RESPONSE_CACHE_TTL_SECONDS),
+  bypassed while Redis is unavailable
+
+Lookups are multi-gets (one MGET for every id missing from memory), so list
+endpoints can read ids/versions from SQL and bodies from the cache.
+get_local_many() reads only the in-process tier, so async callers can serve
+hits on the event loop and call get_many() through run_cache_io() for the rest.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Iterable, Optional, Tuple
+
+import redis
+
+from infrastructure.cache.redis_cache import get_cache_client, mark_cache_client_unavailable
+from infrastructure.metrics.registry import (
+    TASK_RESPONSE_CACHE_HITS_TOTAL,
+    TASK_RESPONSE_CACHE_MISSES_TOTAL
+)
+
+TASK_RESPONSE_CACHE_ENABLED = os.getenv("TASK_RESPONSE_CACHE_ENABLED", "true").lower() == "true"
+TASK_RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("TASK_RESPONSE_CACHE_MAX_ENTRIES", "10000"))
+TASK_RESPONSE_CACHE_TTL_SECONDS = int(os.getenv("TASK_RESPONSE_CACHE_TTL_SECONDS", "300"))
+
+KEY_PREFIX = "task_response:"
+
+# task_id -> (version, body), least recently used first
+_entries: "OrderedDict[int, Tuple[bytes, bytes]]" = OrderedDict()
+_lock = threading.Lock()
+
+
+def make_version(updated_at: Optional[datetime]) -> bytes:
+    """Build the cache version for a task from its updated_at."""
+    return updated_at.isoformat().encode("ascii") if updated_at else b""
+
+
+def _remember(task_id: int, version: bytes, body: bytes) -> None:
+    """Store an entry in the in-process tier (caller holds _lock)."""
+    _entries[task_id] = (version, body)
+    _entries.move_to_end(task_id)
+    while len(_entries) > TASK_RESPONSE_CACHE_MAX_ENTRIES:
+        _entries.popitem(last=False)
+
+
+def get_local_many(versions: Dict[int, bytes]) -> Dict[int, bytes]:
+    """Get cached bodies from the in-process tier only (no Redis I/O); see get_many."""
+    if not TASK_RESPONSE_CACHE_ENABLED:
+        return {}
+
+    found: Dict[int, bytes] = {}
+    with _lock:
+        for task_id, version in versions.items():
+            entry = _entries.get(task_id)
+            if entry and entry[0] == version:
+                _entries.move_to_end(task_id)
+                found[task_id] = entry[1]
+    if found:
+        TASK_RESPONSE_CACHE_HITS_TOTAL.labels(tier="memory").inc(len(found))
+    return found
+
+
+def get_many(versions: Dict[int, bytes]) -> Dict[int, bytes]:
+    """
+    Get cached bodies for tasks at the given versions.
+
+    Args:
+        versions: Task id -> version (make_version of the current updated_at)
+
+    Returns:
+        Task id -> JSON body for every id cached at exactly that version
+    """
+    if not TASK_RESPONSE_CACHE_ENABLED:
+        return {}
+
+    found = get_local_many(versions)
+    missing = [task_id for task_id in versions if task_id not in found]
+    client = get_cache_client() if missing else None
+    if client is not None:
+        try:
+            values = client.mget([f"{KEY_PREFIX}{task_id}" for task_id in missing])
+        except redis.RedisError as e:
+            mark_cache_client_unavailable(e)
+            values = []
+        redis_hits = 0
+        with _lock:
+            for task_id, value in zip(missing, values):
+                if not value:
+                    continue
+                version, _, body = value.partition(b"\n")
+                if version == versions[task_id]:
+                    found[task_id] = body
+                    _remember(task_id, version, body)
+                    redis_hits += 1
+        if redis_hits:
+            TASK_RESPONSE_CACHE_HITS_TOTAL.labels(tier="redis").inc(redis_hits)
+
+    misses = len(versions) - len(found)
+    if misses:
+        TASK_RESPONSE_CACHE_MISSES_TOTAL.inc(misses)
+    return found
+
+
+def put_many(entries: Dict[int, Tuple[bytes, bytes]]) -> None:
+    """
+    Store encoded bodies in both tiers.
+
+    Args:
+        entries: Task id -> (version, JSON body)
+    """
+    if not TASK_RESPONSE_CACHE_ENABLED or not entries:
+        return
+
+    with _lock:
+        for task_id, (version, body) in entries.items():
+            _remember(task_id, version, body)
+
+    client = get_cache_client()
+    if client is None:
+        return
+    try:
+        pipe = client.pipeline(transaction=False)
+        for task_id, (version, body) in entries.items():
+            pipe.set(f"{KEY_PREFIX}{task_id}", version + b"\n" + body, ex=TASK_RESPONSE_CACHE_TTL_SECONDS)
+        pipe.execute()
+    except redis.RedisError as e:
+        mark_cache_client_unavailable(e)
+
+
+def invalidate(task_ids: Iterable[int]) -> None:
+    """Drop cached bodies for the tasks from both tiers."""
+    task_ids = list(task_ids)
+    with _lock:
+        for task_id in task_ids:
+            _entries.pop(task_id, None)
+
+    client = get_cache_client() if TASK_RESPONSE_CACHE_ENABLED and task_ids else None
+    if client is None:
+        return
+    try:
+        client.delete(*[f"{KEY_PREFIX}{task_id}" for task_id in task_ids])
+    except redis.RedisError as e:
+        mark_cache_client_unavailable(e)
+
+
+def clear_task_response_cache() -> None:
+    """Drop all entries from the in-process tier."""
+    with _lock:
+        _entries.clear()
@@ -1,20 +1,149 @@
-"""Database infrastructure module."""
+"""Database infrastructure module.
 
+Two engines share the same database:
+- `engine`/`SessionLocal`/`get_db`: synchronous sessions (worker, scripts,
+  health checks)
+- `async_engine`/`AsyncSessionLocal`/`get_async_db`: AsyncSession on
+  asyncpg/aiosqlite for the async route handlers (tasks, attachments, auth;
+  bcrypt runs on infrastructure/auth/password_hashing.py's own pool), so
+  request concurrency is bounded by the connection pool rather than by
+  threadpool size
+
+With DATABASE_REPLICA_URLS set, read endpoints that tolerate replication lag
+use replica_session()/async_replica_session() (round-robin across replicas);
+see api/middleware/read_replica.py for routing and read-your-writes.
+"""
+
+import itertools
 import os
+from typing import AsyncIterator
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
 from domain.models import Base  # This imports all models and Base
+from infrastructure.database.pool import pool_options, instrument_pool
+from infrastructure.database.statement_cache import statement_cache_options
+from infrastructure.database.sqlite import (
+    uses_sqlite_profile,
+    apply_sqlite_pragmas,
+    writer_engine_options,
+    routing_session_class
+)
+import infrastructure.search  # noqa: F401 - registers full-text index DDL on the tasks table
 
 # Database URL from environment variable (defaults to SQLite for development)
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./task_tracker.db")
 
+# Async driver for each backend (the sync URL may name a sync driver, e.g. postgresql+psycopg2).
+# POSTGRES_ASYNC_DRIVER=psycopg uses psycopg 3 instead of asyncpg for the async engines
+ASYNC_DRIVERS = {
+    "postgresql": os.getenv("POSTGRES_ASYNC_DRIVER", "asyncpg"),
+    "sqlite": "aiosqlite",
+}
+
+
+def to_async_url(url: str) -> str:
+    """Convert a database URL to the same database on its async driver."""
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    driver = ASYNC_DRIVERS.get(backend)
+    if driver is None:
+        raise ValueError(f"No async driver configured for database backend '{backend}'")
+    if driver == "asyncpg" and "sslmode" in parsed.query:
+        # asyncpg takes libpq's sslmode values as `ssl`
+        parsed = parsed.update_query_dict({"ssl": parsed.query["sslmode"]}).difference_update_query(["sslmode"])
+    return parsed.set(drivername=f"{backend}+{driver}").render_as_string(hide_password=False)
+
+
+# Override when the async URL needs different options than DATABASE_URL
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL", to_async_url(DATABASE_URL))
+
+# Read replicas (optional, comma-separated sync URLs; async URLs are derived)
+DATABASE_REPLICA_URLS = [
+    url.strip() for url in os.getenv("DATABASE_REPLICA_URLS", "").split(",") if url.strip()
+]
+
 # SQLite-specific connection args (only apply to SQLite)
 connect_args = {}
 if DATABASE_URL.startswith("sqlite"):
     connect_args = {"check_same_thread": False}
 
-engine = create_engine(DATABASE_URL, connect_args=connect_args)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+engine = create_engine(
+    DATABASE_URL, **statement_cache_options(DATABASE_URL, connect_args), **pool_options(DATABASE_URL, "sync")
+)
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    **statement_cache_options(ASYNC_DATABASE_URL), **pool_options(ASYNC_DATABASE_URL, "async")
+)
+instrument_pool(engine, "sync")
+instrument_pool(async_engine, "async")
+
+# expire_on_commit=False: objects written in a request stay usable after its
+# commit without a reload (and attributes cannot lazy-load under asyncio)
+async_writer_engine = None
+if uses_sqlite_profile(DATABASE_URL):
+    # WAL + pragmas; writes go through one writer connection per stack (see sqlite.py)
+    writer_engine = create_engine(
+        DATABASE_URL, **statement_cache_options(DATABASE_URL, connect_args), **writer_engine_options("sqlite_writer")
+    )
+    async_writer_engine = create_async_engine(
+        ASYNC_DATABASE_URL,
+        **statement_cache_options(ASYNC_DATABASE_URL), **writer_engine_options("async_sqlite_writer")
+    )
+    instrument_pool(writer_engine, "sqlite_writer")
+    instrument_pool(async_writer_engine, "async_sqlite_writer")
+    for sqlite_engine in (engine, writer_engine, async_engine.sync_engine, async_writer_engine.sync_engine):
+        apply_sqlite_pragmas(sqlite_engine)
+    SessionLocal = sessionmaker(
+        autocommit=False, autoflush=False, expire_on_commit=False,
+        class_=routing_session_class(engine, writer_engine)
+    )
+    AsyncSessionLocal = async_sessionmaker(
+        autoflush=False, expire_on_commit=False,
+        sync_session_class=routing_session_class(async_engine.sync_engine, async_writer_engine.sync_engine)
+    )
+else:
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
+    AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+replica_engines = [
+    create_engine(url, **statement_cache_options(url, connect_args), **pool_options(url, f"replica{i}"))
+    for i, url in enumerate(DATABASE_REPLICA_URLS)
+]
+async_replica_engines = [
+    create_async_engine(
+        to_async_url(url),
+        **statement_cache_options(to_async_url(url)), **pool_options(url, f"async_replica{i}")
+    )
+    for i, url in enumerate(DATABASE_REPLICA_URLS)
+]
+for i, (replica_engine, async_replica_engine) in enumerate(zip(replica_engines, async_replica_engines)):
+    instrument_pool(replica_engine, f"replica{i}")
+    instrument_pool(async_replica_engine, f"async_replica{i}")
+_replica_turn = itertools.count()  # next() is atomic under the GIL
+
+
+def replicas_configured() -> bool:
+    """Whether read replicas are configured (DATABASE_REPLICA_URLS)."""
+    return bool(replica_engines)
+
+
+def replica_session() -> Session:
+    """Open a session on the next read replica (round-robin); caller closes it."""
+    return SessionLocal(bind=replica_engines[next(_replica_turn) % len(replica_engines)])
+
+
+def async_replica_session() -> AsyncSession:
+    """Open an async session on the next read replica (round-robin); use as a context manager."""
+    return AsyncSessionLocal(bind=async_replica_engines[next(_replica_turn) % len(async_replica_engines)])
+
+
+async def dispose_async_engines() -> None:
+    """Close pooled connections of every async engine (application shutdown)."""
+    for pooled_engine in [async_engine, async_writer_engine, *async_replica_engines]:
+        if pooled_engine is not None:
+            await pooled_engine.dispose()
 
 
 def init_db():
@@ -29,3 +158,9 @@ def get_db() -> Session:
         yield db
     finally:
         db.close()
+
+
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    """Get async database session (holds a pooled connection only while in a transaction)."""
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -0,0 +1,109 @@
+"""Database connection pool configuration and metrics.
+
+Pool sizing comes from the environment (DB_POOL_SIZE, DB_MAX_OVERFLOW,
+DB_POOL_TIMEOUT_SECONDS, DB_POOL_RECYCLE_SECONDS, DB_POOL_PRE_PING) and applies
+to every engine built with pool_options(). instrument_pool() exports those
+pools' saturation to Prometheus, labelled by pool name, from the public pool
+events, so latency from waiting for a connection can be told apart from slow SQL:
+
+- db_pool_size: configured pool_size
+- db_pool_checked_out / db_pool_overflow: connections in use / in use beyond pool_size
+  (a starved pool sits at pool_size + max_overflow)
+- db_pool_connection_held_seconds: time from checkout to checkin (how long
+  a connection is kept, which is what other checkouts wait for)
+- db_pool_connect_seconds: time to open a new connection
+"""
+
+import os
+import time
+from typing import Any, Dict, Union
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import QueuePool
+
+from infrastructure.metrics.registry import (
+    DB_POOL_SIZE,
+    DB_POOL_CHECKED_OUT,
+    DB_POOL_OVERFLOW,
+    DB_POOL_CONNECTION_HELD_SECONDS,
+    DB_POOL_CONNECT_SECONDS
+)
+
+DB_POOL_SIZE_SETTING = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT_SECONDS = float(os.getenv("DB_POOL_TIMEOUT_SECONDS", "30"))
+# Recycle before server/proxy idle timeouts close connections under us (-1 disables)
+DB_POOL_RECYCLE_SECONDS = int(os.getenv("DB_POOL_RECYCLE_SECONDS", "1800"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+
+
+def pool_options(url: str, name: str) -> Dict[str, Any]:
+    """
+    Build create_engine/create_async_engine pool arguments for a database URL.
+
+    Args:
+        url: Database URL the engine connects to
+        name: Pool name (the `pool` label of the pool metrics, see instrument_pool)
+
+    Returns:
+        Keyword arguments for the engine (empty for in-memory SQLite, which
+        keeps SQLAlchemy's single-connection pool)
+    """
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "sqlite" and parsed.database in (None, "", ":memory:"):
+        return {}
+    return {
+        "pool_size": DB_POOL_SIZE_SETTING,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT_SECONDS,
+        "pool_recycle": DB_POOL_RECYCLE_SECONDS,
+        "pool_pre_ping": DB_POOL_PRE_PING,
+        "pool_logging_name": name,
+    }
+
+
+def instrument_pool(engine: Union[Engine, AsyncEngine], name: str) -> None:
+    """
+    Export an engine's pool metrics, labelled `name`, from the pool events.
+
+    Only queue pools (engines built with pool_options() or
+    writer_engine_options()) are instrumented; other pools are left alone.
+    """
+    pool = engine.pool
+    if not isinstance(pool, QueuePool):
+        return
+    size = pool.size()
+    DB_POOL_SIZE.labels(pool=name).set(size)
+    checked_out_gauge = DB_POOL_CHECKED_OUT.labels(pool=name)
+    overflow_gauge = DB_POOL_OVERFLOW.labels(pool=name)
+    held_seconds = DB_POOL_CONNECTION_HELD_SECONDS.labels(pool=name)
+    connect_seconds = DB_POOL_CONNECT_SECONDS.labels(pool=name)
+
+    def report(checked_out: int) -> None:
+        checked_out_gauge.set(checked_out)
+        overflow_gauge.set(max(checked_out - size, 0))
+
+    @event.listens_for(engine.sync_engine if isinstance(engine, AsyncEngine) else engine, "do_connect")
+    def start_connect(dialect, connection_record, cargs, cparams) -> None:
+        connection_record.info["connect_started_at"] = time.perf_counter()
+
+    @event.listens_for(pool, "connect")
+    def connected(dbapi_connection, connection_record) -> None:
+        started_at = connection_record.info.pop("connect_started_at", None)
+        if started_at is not None:
+            connect_seconds.observe(time.perf_counter() - started_at)
+
+    @event.listens_for(pool, "checkout")
+    def checked_out(dbapi_connection, connection_record, connection_proxy) -> None:
+        connection_record.info["checked_out_at"] = time.perf_counter()
+        report(pool.checkedout())
+
+    @event.listens_for(pool, "checkin")
+    def checked_in(dbapi_connection, connection_record) -> None:
+        # Fires before the connection is back in the pool: it still counts as checked out
+        report(max(pool.checkedout() - 1, 0))
+        checked_out_at = connection_record.info.pop("checked_out_at", None)
+        if checked_out_at is not None:
+            held_seconds.observe(time.perf_counter() - checked_out_at)
@@ -0,0 +1,64 @@
+"""Read-your-writes window for replica routing.
+
+After a user writes, their reads go to the primary for
+REPLICA_STICKY_SECONDS (longer than the expected replication lag), so they
+see their own changes immediately while other users keep reading from
+replicas.
+
+The window is recorded in-process and in Redis (`db:sticky_primary:<user_id>`)
+so it holds across API processes. If Redis is unavailable, every read goes
+to the primary: a replica read could miss a write made through another
+process.
+"""
+
+import os
+import threading
+import time
+from typing import Dict
+
+import redis
+
+from infrastructure.cache.redis_cache import get_cache_client, mark_cache_client_unavailable
+
+REPLICA_STICKY_SECONDS = float(os.getenv("REPLICA_STICKY_SECONDS", "5"))
+
+KEY_PREFIX = "db:sticky_primary:"
+
+# user_id -> monotonic deadline of the window
+_sticky_until: Dict[int, float] = {}
+_lock = threading.Lock()
+
+
+def mark_user_write(user_id: int) -> None:
+    """Start (or extend) the user's read-from-primary window."""
+    now = time.monotonic()
+    with _lock:
+        _sticky_until[user_id] = now + REPLICA_STICKY_SECONDS
+        # Drop expired windows so the map stays bounded by recent writers
+        if len(_sticky_until) > 10000:
+            for expired in [uid for uid, until in _sticky_until.items() if until <= now]:
+                del _sticky_until[expired]
+
+    client = get_cache_client()
+    if client is None:
+        return
+    try:
+        client.set(f"{KEY_PREFIX}{user_id}", b"1", px=int(REPLICA_STICKY_SECONDS * 1000))
+    except redis.RedisError as e:
+        mark_cache_client_unavailable(e)
+
+
+def must_read_primary(user_id: int) -> bool:
+    """Whether the user's reads must go to the primary (recent write, or window state unknown)."""
+    with _lock:
+        if _sticky_until.get(user_id, 0.0) > time.monotonic():
+            return True
+
+    client = get_cache_client()
+    if client is None:
+        return True
+    try:
+        return bool(client.exists(f"{KEY_PREFIX}{user_id}"))
+    except redis.RedisError as e:
+        mark_cache_client_unavailable(e)
+        return True
@@ -0,0 +1,109 @@
+"""SQLite production profile: WAL, connection pragmas and a single writer.
+
+With a file database and SQLITE_PROFILE=production (the default):
+
+- Every connection is opened with journal_mode=WAL (readers never block the
+  writer and vice versa), synchronous=SQLITE_SYNCHRONOUS (NORMAL: durable
+  across application crashes, fsync at checkpoints only), mmap_size,
+  cache_size and busy_timeout.
+- Writes go through a dedicated writer engine holding a single connection.
+  Its pool is the write queue: concurrent writers wait for the connection
+  (up to SQLITE_WRITE_TIMEOUT_SECONDS; how long each write holds it is
+  db_pool_connection_held_seconds{pool="sqlite_writer"}) instead of failing
+  with "database is locked". Reads use the regular pool.
+
+Sessions route with SQLiteRoutingSession: once a session flushes or executes
+INSERT/UPDATE/DELETE, it stays on the writer connection until the
+transaction ends, so it reads its own uncommitted writes.
+
+The sync and async stacks each have their own writer connection (as does
+every process); contention between them is absorbed by busy_timeout.
+"""
+
+import os
+from typing import Any, Dict
+
+from sqlalchemy import event, Delete, Insert, Update
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.orm import Session
+
+SQLITE_PROFILE = os.getenv("SQLITE_PROFILE", "production")  # "production" or "basic"
+SQLITE_SYNCHRONOUS = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+SQLITE_MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+SQLITE_CACHE_SIZE_KB = int(os.getenv("SQLITE_CACHE_SIZE_KB", "65536"))
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+SQLITE_WRITE_TIMEOUT_SECONDS = float(os.getenv("SQLITE_WRITE_TIMEOUT_SECONDS", "30"))
+
+_WRITER_KEY = "sqlite_writer"  # Session.info flag: transaction is on the writer connection
+
+
+def uses_sqlite_profile(url: str) -> bool:
+    """Whether the production SQLite profile applies to a database URL."""
+    parsed = make_url(url)
+    return (
+        SQLITE_PROFILE == "production"
+        and parsed.get_backend_name() == "sqlite"
+        and parsed.database not in (None, "", ":memory:")
+    )
+
+
+def apply_sqlite_pragmas(engine: Engine) -> None:
+    """Set the profile's pragmas on every new connection of the engine (sync engine or AsyncEngine.sync_engine)."""
+
+    @event.listens_for(engine, "connect")
+    def set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute(f"PRAGMA synchronous={SQLITE_SYNCHRONOUS}")
+        cursor.execute(f"PRAGMA mmap_size={SQLITE_MMAP_SIZE}")
+        cursor.execute(f"PRAGMA cache_size=-{SQLITE_CACHE_SIZE_KB}")  # Negative: KiB, not pages
+        cursor.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}")
+        cursor.close()
+
+
+def writer_engine_options(name: str) -> Dict[str, Any]:
+    """Engine arguments for the single-connection writer (its pool is the write queue)."""
+    return {
+        "pool_size": 1,
+        "max_overflow": 0,
+        "pool_timeout": SQLITE_WRITE_TIMEOUT_SECONDS,
+        "pool_logging_name": name,
+    }
+
+
+class SQLiteRoutingSession(Session):
+    """Session reading through `reader_engine` and writing through `writer_engine`."""
+
+    reader_engine: Engine
+    writer_engine: Engine
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is not None or self.bind is not None:
+            # Explicitly bound (e.g. a replica session): no routing
+            return super().get_bind(mapper, clause=clause, bind=bind, **kwargs)
+        if self.info.get(_WRITER_KEY) or isinstance(clause, (Insert, Update, Delete)):
+            self.info[_WRITER_KEY] = True
+            return self.writer_engine
+        return self.reader_engine
+
+
+@event.listens_for(SQLiteRoutingSession, "before_flush")
+def _enter_writer(session: Session, flush_context, instances) -> None:
+    """Send a flush (and the rest of its transaction) to the writer connection."""
+    session.info[_WRITER_KEY] = True
+
+
+@event.listens_for(SQLiteRoutingSession, "after_transaction_end")
+def _leave_writer(session: Session, transaction) -> None:
+    """Route reads back to the reader pool once the outermost transaction ends."""
+    if transaction.parent is None:
+        session.info.pop(_WRITER_KEY, None)
+
+
+def routing_session_class(reader_engine: Engine, writer_engine: Engine) -> type:
+    """Build a SQLiteRoutingSession subclass bound to the given sync engines."""
+    return type(
+        "BoundSQLiteRoutingSession",
+        (SQLiteRoutingSession,),
+        {"reader_engine": reader_engine, "writer_engine": writer_engine}
+    )
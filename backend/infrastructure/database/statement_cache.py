@@ -0,0 +1,49 @@
+"""Statement cache configuration.
+
+Two caches keep repeated query shapes cheap:
+
+- SQLAlchemy's compiled statement cache (per engine): SQL strings compiled
+  from statement constructs, keyed by the statement's shape. Search requests
+  compose their filters, sort and pagination per call, so every filter/sort
+  combination is its own entry; DB_STATEMENT_CACHE_SIZE (default 1200, above
+  SQLAlchemy's 500) keeps them from evicting each other.
+- Prepared statements (per PostgreSQL connection): statements are prepared
+  server-side once per connection and then executed by name, skipping
+  parsing and planning. asyncpg keeps ASYNCPG_PREPARED_STATEMENT_CACHE_SIZE
+  of them (default 500; 0 disables the cache, e.g. behind a pooler in
+  transaction mode that cannot keep prepared statements). psycopg 3
+  (POSTGRES_ASYNC_DRIVER=psycopg, or a postgresql+psycopg URL) prepares a
+  statement once it has run PSYCOPG_PREPARE_THRESHOLD times on a connection
+  (default 5; empty disables).
+"""
+
+import os
+from typing import Any, Dict, Optional
+
+from sqlalchemy.engine import make_url
+
+DB_STATEMENT_CACHE_SIZE = int(os.getenv("DB_STATEMENT_CACHE_SIZE", "1200"))
+ASYNCPG_PREPARED_STATEMENT_CACHE_SIZE = int(os.getenv("ASYNCPG_PREPARED_STATEMENT_CACHE_SIZE", "500"))
+_psycopg_prepare_threshold = os.getenv("PSYCOPG_PREPARE_THRESHOLD", "5")
+PSYCOPG_PREPARE_THRESHOLD = int(_psycopg_prepare_threshold) if _psycopg_prepare_threshold else None
+
+
+def statement_cache_options(url: str, connect_args: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Build create_engine/create_async_engine statement cache arguments for a database URL.
+
+    Args:
+        url: Database URL the engine connects to
+        connect_args: Other driver connect arguments of the engine
+
+    Returns:
+        Keyword arguments for the engine: the compiled statement cache size and
+        connect_args, with the prepared statement settings of asyncpg/psycopg URLs
+    """
+    connect_args = dict(connect_args or {})
+    driver = make_url(url).get_driver_name()
+    if driver == "asyncpg":
+        connect_args["prepared_statement_cache_size"] = ASYNCPG_PREPARED_STATEMENT_CACHE_SIZE
+    elif driver == "psycopg":
+        connect_args["prepare_threshold"] = PSYCOPG_PREPARE_THRESHOLD
+    return {"query_cache_size": DB_STATEMENT_CACHE_SIZE, "connect_args": connect_args}
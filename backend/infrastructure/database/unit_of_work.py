@@ -0,0 +1,20 @@
+"""Unit of work implementation (SQLAlchemy session transaction)."""
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from application.unit_of_work import AsyncUnitOfWork
+
+
+class AsyncSQLAlchemyUnitOfWork(AsyncUnitOfWork):
+    """Commits the AsyncSession shared by the operation's repositories."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def commit(self) -> None:
+        """Commit the session's transaction."""
+        await self.db.commit()
+
+    async def rollback(self) -> None:
+        """Roll back the session's transaction."""
+        await self.db.rollback()
@@ -1,6 +1,6 @@
 """Metrics registry for Prometheus metrics."""
 
-from prometheus_client import Counter, Histogram, REGISTRY, generate_latest, CONTENT_TYPE_LATEST
+from prometheus_client import Counter, Gauge, Histogram, REGISTRY, generate_latest, CONTENT_TYPE_LATEST
 
 # Request metrics
 HTTP_REQUESTS_TOTAL = Counter(
@@ -29,6 +29,88 @@ REMINDERS_PROCESSED_TOTAL = Counter(
     ['status']  # 'success' or 'failure'
 )
 
+# Cache metrics
+TASK_SEARCH_CACHE_HITS_TOTAL = Counter(
+    'task_search_cache_hits_total',
+    'Total number of task search requests served from the result cache'
+)
+
+TASK_SEARCH_CACHE_MISSES_TOTAL = Counter(
+    'task_search_cache_misses_total',
+    'Total number of task search requests not found in the result cache'
+)
+
+TASK_SEARCH_CACHE_BYPASS_TOTAL = Counter(
+    'task_search_cache_bypass_total',
+    'Total number of task search requests that skipped the result cache (disabled or Redis unavailable)'
+)
+
+TASK_RESPONSE_CACHE_HITS_TOTAL = Counter(
+    'task_response_cache_hits_total',
+    'Total number of task bodies served from the per-task response cache',
+    ['tier']  # 'memory' or 'redis'
+)
+
+TASK_RESPONSE_CACHE_MISSES_TOTAL = Counter(
+    'task_response_cache_misses_total',
+    'Total number of task bodies not found in the per-task response cache'
+)
+
+PRINCIPAL_CACHE_HITS_TOTAL = Counter(
+    'principal_cache_hits_total',
+    'Total number of authenticated requests whose user was served from the principal cache',
+    ['tier']  # 'memory' or 'redis'
+)
+
+PRINCIPAL_CACHE_MISSES_TOTAL = Counter(
+    'principal_cache_misses_total',
+    'Total number of authenticated requests whose user was loaded from the database'
+)
+
+# Password hashing pool metrics (see infrastructure/auth/password_hashing.py)
+PASSWORD_HASHING_QUEUE_DEPTH = Gauge(
+    'password_hashing_queue_depth',
+    'Number of password hashing jobs waiting for a hashing thread'
+)
+
+PASSWORD_HASHING_REJECTED_TOTAL = Counter(
+    'password_hashing_rejected_total',
+    'Total number of password hashing jobs rejected because the hashing queue was full'
+)
+
+# Database connection pool metrics (see infrastructure/database/pool.py)
+DB_POOL_SIZE = Gauge(
+    'db_pool_size',
+    'Configured number of persistent connections in the pool',
+    ['pool']
+)
+
+DB_POOL_CHECKED_OUT = Gauge(
+    'db_pool_checked_out',
+    'Number of pool connections currently checked out',
+    ['pool']
+)
+
+DB_POOL_OVERFLOW = Gauge(
+    'db_pool_overflow',
+    'Number of connections checked out beyond pool_size (up to max_overflow)',
+    ['pool']
+)
+
+DB_POOL_CONNECTION_HELD_SECONDS = Histogram(
+    'db_pool_connection_held_seconds',
+    'Time a pool connection stays checked out in seconds',
+    ['pool'],
+    buckets=[0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0]
+)
+
+DB_POOL_CONNECT_SECONDS = Histogram(
+    'db_pool_connect_seconds',
+    'Time spent opening a new pool connection in seconds',
+    ['pool'],
+    buckets=[0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0]
+)
+
 
 def get_metrics_text() -> str:
     """
@@ -2,9 +2,10 @@
 
 from datetime import datetime, UTC
 from typing import Optional, Dict, Any
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Index, JSON
+from sqlalchemy import Column, Integer, String, ForeignKey, Text, Index, JSON
 from sqlalchemy.orm import relationship
 
+from domain.models.types import UTCDateTime
 from domain.models.user import Base
 
 
@@ -16,6 +17,8 @@ class AuditEvent(Base):
     """
     
     __tablename__ = "audit_events"
+    # Server-generated values are fetched by the INSERT/UPDATE itself (RETURNING), not a later SELECT
+    __mapper_args__ = {"eager_defaults": True}
     
     # Primary key
     id = Column(Integer, primary_key=True, index=True)
@@ -23,7 +26,7 @@ class AuditEvent(Base):
     # Required fields
     action_type = Column(String, nullable=False, index=True)  # e.g., "task_created", "attachment_uploaded"
     user_id = Column(Integer, ForeignKey("users.id"), nullable=True, index=True)  # NULL for system actions
-    timestamp = Column(DateTime, default=lambda: datetime.now(UTC), nullable=False, index=True)
+    timestamp = Column(UTCDateTime, default=lambda: datetime.now(UTC), nullable=False, index=True)
     
     # Resource identification
     resource_type = Column(String, nullable=False, index=True)  # e.g., "task", "attachment", "reminder"
@@ -1,6 +1,9 @@
 """Infrastructure persistence repositories."""
 
-from .task_repository import SQLAlchemyTaskRepository
-from .attachment_repository import SQLAlchemyAttachmentRepository
+from .task_repository import AsyncSQLAlchemyTaskRepository
+from .attachment_repository import AsyncSQLAlchemyAttachmentRepository
 
-__all__ = ["SQLAlchemyTaskRepository", "SQLAlchemyAttachmentRepository"]
+__all__ = [
+    "AsyncSQLAlchemyTaskRepository",
+    "AsyncSQLAlchemyAttachmentRepository"
+]
@@ -1,40 +1,55 @@
 """Attachment repository implementation (SQLAlchemy)."""
 
 from typing import Optional, List
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from domain.models.attachment import Attachment
-from application.attachments.repository import AttachmentRepository
+from application.attachments.repository import AsyncAttachmentRepository
+from infrastructure.persistence.repositories.task_repository import owned_task_ids
 
 
-class SQLAlchemyAttachmentRepository(AttachmentRepository):
-    """SQLAlchemy implementation of AttachmentRepository."""
+def _delete_for_owned_task_statement(task_id: int, owner_user_id: int):
+    """DELETE a task's attachments only if the user owns the task, RETURNING the deleted rows."""
+    return (
+        delete(Attachment)
+        .where(Attachment.task_id.in_(owned_task_ids(task_id, owner_user_id)))
+        .returning(Attachment)
+        .execution_options(synchronize_session=False)
+    )
+
+
+class AsyncSQLAlchemyAttachmentRepository(AsyncAttachmentRepository):
+    """SQLAlchemy AsyncSession implementation of AsyncAttachmentRepository."""
     
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
     
-    def create(self, attachment: Attachment) -> Attachment:
+    async def create(self, attachment: Attachment) -> Attachment:
         """Create a new attachment."""
         self.db.add(attachment)
-        self.db.commit()
-        self.db.refresh(attachment)
+        await self.db.flush()  # Committed by the caller's unit of work; id from the INSERT
         return attachment
     
-    def get_by_id(self, attachment_id: int) -> Optional[Attachment]:
+    async def get_by_id(self, attachment_id: int) -> Optional[Attachment]:
         """Get attachment by ID."""
-        attachment = self.db.query(Attachment).filter(Attachment.id == attachment_id).first()
-        return attachment
+        return await self.db.get(Attachment, attachment_id)
     
-    def get_by_task_id(self, task_id: int) -> List[Attachment]:
+    async def get_by_task_id(self, task_id: int) -> List[Attachment]:
         """Get all attachments for a task."""
-        attachments = self.db.query(Attachment).filter(Attachment.task_id == task_id).all()
-        return attachments
+        result = await self.db.execute(select(Attachment).where(Attachment.task_id == task_id))
+        return list(result.scalars())
     
-    def delete(self, attachment_id: int) -> bool:
+    async def delete(self, attachment_id: int) -> bool:
         """Delete an attachment by ID."""
-        attachment = self.db.query(Attachment).filter(Attachment.id == attachment_id).first()
+        attachment = await self.db.get(Attachment, attachment_id)
         if attachment:
-            self.db.delete(attachment)
-            self.db.commit()
+            await self.db.delete(attachment)
+            await self.db.flush()
             return True
         return False
+    
+    async def delete_for_owned_task(self, task_id: int, owner_user_id: int) -> List[Attachment]:
+        """Delete a task's attachments if the user owns the task (one statement)."""
+        result = await self.db.execute(_delete_for_owned_task_statement(task_id, owner_user_id))
+        return list(result.scalars())
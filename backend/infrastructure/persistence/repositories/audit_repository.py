@@ -1,10 +1,12 @@
 """Audit repository implementation (SQLAlchemy)."""
 
 from typing import List
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from domain.audit.audit_event import AuditEvent
-from application.audit.repository import AuditRepository
+from application.audit.repository import AuditRepository, AsyncAuditRepository
 from infrastructure.persistence.models.audit_event import AuditEvent as AuditEventModel
 
 
@@ -16,7 +18,7 @@ class SQLAlchemyAuditRepository(AuditRepository):
         self.db = db
     
     def save(self, event: AuditEvent) -> None:
-        """Save an audit event to the database."""
+        """Save an audit event in the current transaction (committed by the caller's unit of work)."""
         audit_model = AuditEventModel(
             action_type=event.action_type,
             user_id=event.user_id,
@@ -27,10 +29,9 @@ class SQLAlchemyAuditRepository(AuditRepository):
         )
         
         self.db.add(audit_model)
-        self.db.commit()
-        self.db.refresh(audit_model)
+        self.db.flush()
         
-        # Update domain entity with database ID
+        # Update domain entity with database ID (assigned on flush)
         event.id = audit_model.id
     
     def find_by_action_type(self, action_type: str) -> List[AuditEvent]:
@@ -60,12 +61,65 @@ class SQLAlchemyAuditRepository(AuditRepository):
     
     def _to_domain_event(self, model: AuditEventModel) -> AuditEvent:
         """Convert ORM model to domain entity."""
-        return AuditEvent(
-            id=model.id,
-            action_type=model.action_type,
-            user_id=model.user_id,
-            resource_type=model.resource_type,
-            resource_id=model.resource_id,
-            metadata=getattr(model, 'event_metadata', None) or {},
-            timestamp=model.timestamp
+        return to_domain_event(model)
+
+
+def to_domain_event(model: AuditEventModel) -> AuditEvent:
+    """Convert ORM model to domain entity."""
+    return AuditEvent(
+        id=model.id,
+        action_type=model.action_type,
+        user_id=model.user_id,
+        resource_type=model.resource_type,
+        resource_id=model.resource_id,
+        metadata=getattr(model, 'event_metadata', None) or {},
+        timestamp=model.timestamp
+    )
+
+
+
+class AsyncSQLAlchemyAuditRepository(AsyncAuditRepository):
+    """SQLAlchemy AsyncSession implementation of AsyncAuditRepository."""
+    
+    def __init__(self, db: AsyncSession):
+        """Initialize repository with async database session."""
+        self.db = db
+    
+    async def save(self, event: AuditEvent) -> None:
+        """Save an audit event in the current transaction (committed by the caller's unit of work)."""
+        audit_model = AuditEventModel(
+            action_type=event.action_type,
+            user_id=event.user_id,
+            resource_type=event.resource_type,
+            resource_id=str(event.resource_id),
+            event_metadata=event.metadata,
+            timestamp=event.timestamp
+        )
+        
+        self.db.add(audit_model)
+        await self.db.flush()
+        
+        # Update domain entity with database ID (assigned on flush)
+        event.id = audit_model.id
+    
+    async def _find(self, *criteria) -> List[AuditEvent]:
+        """Find audit events matching the criteria, newest first."""
+        result = await self.db.execute(
+            select(AuditEventModel).where(*criteria).order_by(AuditEventModel.timestamp.desc())
+        )
+        return [to_domain_event(model) for model in result.scalars()]
+    
+    async def find_by_action_type(self, action_type: str) -> List[AuditEvent]:
+        """Find audit events by action type."""
+        return await self._find(AuditEventModel.action_type == action_type)
+    
+    async def find_by_user_id(self, user_id: int) -> List[AuditEvent]:
+        """Find audit events by user ID."""
+        return await self._find(AuditEventModel.user_id == user_id)
+    
+    async def find_by_resource(self, resource_type: str, resource_id: str) -> List[AuditEvent]:
+        """Find audit events by resource type and ID."""
+        return await self._find(
+            AuditEventModel.resource_type == resource_type,
+            AuditEventModel.resource_id == str(resource_id)
         )
@@ -1,57 +1,363 @@
 """Task repository implementation (SQLAlchemy)."""
 
-from typing import Optional, List
-from sqlalchemy.orm import Session, joinedload
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from sqlalchemy import (
+    JSON, Select, String, case, cast, column, delete, func, insert, literal, select, true, update, values
+)
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased, joinedload
 
+from domain.audit.audit_event import AuditEvent
 from domain.models.task import Task
-from application.tasks.repository import TaskRepository
+from domain.models.task_tag import TaskTag, normalize_tags
+from application.tasks.repository import AsyncTaskRepository
+from infrastructure.persistence.models.audit_event import AuditEvent as AuditEventModel
+from infrastructure.persistence.statements import (
+    TASK_BY_ID,
+    TASKS_BY_IDS,
+    TASK_UPDATED_AT_BY_IDS,
+    TASK_OWNER_ID
+)
 import json
 
 
-class SQLAlchemyTaskRepository(TaskRepository):
-    """SQLAlchemy implementation of TaskRepository."""
+def sync_task_tags(task: Task) -> None:
+    """
+    Mirror `task.tags` (JSON string) into the normalized `task_tags` rows.
     
-    def __init__(self, db: Session):
+    Existing rows for tags that are still present are kept; removed tags are
+    deleted via the delete-orphan cascade and new tags are inserted on flush.
+    """
+    wanted = normalize_tags(task.tags)
+    existing = {entry.tag: entry for entry in task.tag_entries}
+    task.tag_entries = [existing.get(tag) or TaskTag(tag=tag) for tag in wanted]
+
+
+def _owned(task_id: int, owner_user_id: int) -> tuple:
+    """WHERE criteria matching a task only if the user owns it."""
+    return (Task.id == task_id, Task.owner_user_id == owner_user_id)
+
+
+def owned_task_ids(task_id: int, owner_user_id: int) -> Select:
+    """Subquery of the task's id if the user owns it (ownership check for child-row statements)."""
+    return select(Task.id).where(*_owned(task_id, owner_user_id))
+
+
+def _previous_values_query(task_id: int, owner_user_id: int, previous: Sequence[str]) -> Select:
+    """Read the pre-update values of columns (when UPDATE ... RETURNING cannot return them)."""
+    return select(*(Task.__table__.c[name] for name in previous)).where(*_owned(task_id, owner_user_id))
+
+
+def _delete_owned_tags_statement(task_id: int, owner_user_id: int):
+    """Ownership-checked delete of a task's normalized tag rows."""
+    return (
+        delete(TaskTag)
+        .where(TaskTag.task_id.in_(owned_task_ids(task_id, owner_user_id)))
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _update_owned_statement(
+    task_id: int,
+    owner_user_id: int,
+    values: Dict[str, Any],
+    previous: Sequence[str],
+    returns_previous: bool,
+    clear_tags: bool = False,
+    audit: Optional[AuditEvent] = None
+):
+    """
+    Build the ownership-checked UPDATE ... RETURNING for a task.
+    
+    With `returns_previous` (see _returns_previous), the task is joined to
+    itself so RETURNING also yields the pre-update values of the `previous`
+    columns. With `clear_tags` (see _batches_statements), the statement also
+    deletes the task's tag rows. With `audit` (PostgreSQL only), the UPDATE
+    becomes a CTE that the audit event is inserted from (see
+    _updated_audit_metadata), and the statement SELECTs the updated row.
+    """
+    statement = update(Task).where(*_owned(task_id, owner_user_id)).values(**values)
+    old_columns = []
+    if returns_previous:
+        old = Task.__table__.alias("old")
+        statement = statement.where(old.c.id == Task.id)
+        old_columns = [old.c[name] for name in previous]
+    if audit is not None:
+        updated = statement.returning(
+            *Task.__table__.c, *(old_column.label(f"old_{old_column.name}") for old_column in old_columns)
+        ).cte("updated_task")
+        previous_columns = [updated.c[f"old_{name}"] for name in previous] if returns_previous else []
+        metadata = _updated_audit_metadata(audit, updated, dict(zip(previous, previous_columns)))
+        statement = select(aliased(Task, updated), *previous_columns).add_cte(
+            _audit_insert_from(audit, updated, metadata).cte("audit")
+        )
+    else:
+        statement = statement.returning(Task, *old_columns)
+    if clear_tags:
+        statement = statement.add_cte(_delete_owned_tags_statement(task_id, owner_user_id).cte("deleted_tags"))
+    return statement.execution_options(populate_existing=True, synchronize_session=False)
+
+
+def _returns_previous(session: AsyncSession, previous: Sequence[str]) -> bool:
+    """
+    Whether UPDATE ... RETURNING can return the `previous` values itself.
+    
+    PostgreSQL returns columns of UPDATE ... FROM tables (the pre-update row);
+    SQLite's RETURNING only sees the updated table, so old values are read first.
+    """
+    return bool(previous) and session.get_bind().dialect.name == "postgresql"
+
+
+def _batches_statements(session: AsyncSession) -> bool:
+    """
+    Whether a task's dependent tag rows can be written by the task's statement.
+    
+    PostgreSQL runs DELETEs inside WITH (data-modifying CTEs), so the UPDATE or
+    DELETE of a task also deletes its tag rows: one round trip instead of two.
+    SQLite only allows SELECT in WITH; there they are separate statements.
+    """
+    return session.get_bind().dialect.name == "postgresql"
+
+
+def _replace_tags_statements(task_id: int, tags_json: Optional[str], cleared: bool = False) -> list:
+    """Statements rewriting a task's normalized tag rows from its tags JSON (`cleared`: old rows already deleted)."""
+    statements = []
+    if not cleared:
+        statements.append(
+            delete(TaskTag).where(TaskTag.task_id == task_id).execution_options(synchronize_session=False)
+        )
+    wanted = normalize_tags(tags_json)
+    if wanted:
+        statements.append(insert(TaskTag).values([{"task_id": task_id, "tag": tag} for tag in wanted]))
+    return statements
+
+
+def _delete_owned_statements(
+    task_id: int,
+    owner_user_id: int,
+    batched: bool,
+    audit: Optional[AuditEvent] = None
+) -> list:
+    """
+    Ownership-checked deletes of a task's tag rows and of the task.
+    
+    The last statement RETURNs the task; `batched` (see _batches_statements)
+    folds the tag delete into it, and the insert of `audit` if given (the
+    DELETE becomes a CTE and the statement SELECTs the deleted row).
+    """
+    delete_tags = _delete_owned_tags_statement(task_id, owner_user_id)
+    delete_task = delete(Task).where(*_owned(task_id, owner_user_id))
+    if not batched:
+        return [delete_tags, delete_task.returning(Task).execution_options(synchronize_session=False)]
+    if audit is not None:
+        deleted = delete_task.returning(*Task.__table__.c).cte("deleted_task")
+        metadata = _audit_metadata(audit).op("||", return_type=JSONB)(func.jsonb_build_object("title", deleted.c.title))
+        delete_task = select(aliased(Task, deleted)).add_cte(_audit_insert_from(audit, deleted, metadata).cte("audit"))
+    else:
+        delete_task = delete_task.returning(Task)
+    return [delete_task.add_cte(delete_tags.cte("deleted_tags")).execution_options(synchronize_session=False)]
+
+
+def _insert_statement(task: Task, audit: Optional[AuditEvent]):
+    """
+    One INSERT of a new task, its tag rows and its audit event (PostgreSQL).
+    
+    The task INSERT ... RETURNING is a CTE that the tag rows and the audit
+    event are inserted from; the statement SELECTs the new row.
+    """
+    row = {name: getattr(task, name) for name in Task.__table__.c.keys() if getattr(task, name) is not None}
+    created = insert(Task).values(**row).returning(*Task.__table__.c).cte("created_task")
+    statement = select(aliased(Task, created))
+    wanted = normalize_tags(task.tags)
+    if wanted:
+        tags = values(column("tag", String), name="wanted_tags").data([(tag,) for tag in wanted])
+        statement = statement.add_cte(
+            insert(TaskTag)
+            .from_select(["task_id", "tag"], select(created.c.id, tags.c.tag).join_from(created, tags, true()))
+            .cte("created_tags")
+        )
+    if audit is not None:
+        statement = statement.add_cte(_audit_insert_from(audit, created, _audit_metadata(audit)).cte("audit"))
+    return statement
+
+
+def _audit_metadata(audit: AuditEvent):
+    """The event's metadata as a JSONB expression (extended by the written row in SQL)."""
+    return literal(audit.metadata, JSONB)
+
+
+def _updated_audit_metadata(audit: AuditEvent, updated, previous: Dict[str, Any]):
+    """
+    Metadata of an update's audit event, completed from the written row in SQL.
+    
+    For each `previous` column (old value expression) that changed, adds
+    `{"old": ..., "new": ...}` to metadata["changes"], as _updated_metadata()
+    does in Python.
+    """
+    changes = literal(audit.metadata.get("changes", {}), JSONB)
+    for name, old_value in previous.items():
+        new_value = updated.c[name]
+        changes = changes.op("||", return_type=JSONB)(case(
+            (
+                old_value.is_distinct_from(new_value),
+                func.jsonb_build_object(name, func.jsonb_build_object("old", old_value, "new", new_value))
+            ),
+            else_=literal({}, JSONB)
+        ))
+    return _audit_metadata(audit).op("||", return_type=JSONB)(func.jsonb_build_object("changes", changes))
+
+
+def _updated_metadata(metadata: Dict[str, Any], task: Task, previous: Dict[str, Any]) -> Dict[str, Any]:
+    """Metadata of an update's audit event: metadata["changes"] plus the transitions of changed `previous` columns."""
+    changes = dict(metadata.get("changes", {}))
+    for name, old_value in previous.items():
+        new_value = getattr(task, name)
+        if old_value != new_value:
+            changes[name] = {"old": old_value, "new": new_value}
+    return {**metadata, "changes": changes}
+
+
+def _audit_insert(audit: AuditEvent, resource_id: int, metadata: Dict[str, Any]):
+    """INSERT of a task's audit event (resource_id: the written task's id)."""
+    return insert(AuditEventModel).values(
+        action_type=audit.action_type,
+        user_id=audit.user_id,
+        timestamp=audit.timestamp,
+        resource_type=audit.resource_type,
+        resource_id=str(resource_id),
+        event_metadata=metadata
+    )
+
+
+def _audit_insert_from(audit: AuditEvent, written, metadata):
+    """INSERT ... SELECT of a task's audit event from the written row (CTE), one event per row written."""
+    columns = AuditEventModel.__table__.c
+    return insert(AuditEventModel).from_select(
+        ["action_type", "user_id", "timestamp", "resource_type", "resource_id", "event_metadata"],
+        select(
+            literal(audit.action_type, columns.action_type.type),
+            literal(audit.user_id, columns.user_id.type),
+            literal(audit.timestamp, columns.timestamp.type),
+            literal(audit.resource_type, columns.resource_type.type),
+            cast(written.c.id, String),
+            cast(metadata, JSON)
+        ).select_from(written)
+    )
+
+
+class AsyncSQLAlchemyTaskRepository(AsyncTaskRepository):
+    """SQLAlchemy AsyncSession implementation of AsyncTaskRepository.
+    
+    Relationships cannot lazy-load under asyncio, so every task read has its
+    owner loaded. Written tasks are returned as flushed (the session does
+    not expire them on commit), without reloading and without their owner:
+    only owner_user_id is set (the caller knows who the owner is).
+    """
+    
+    def __init__(self, db: AsyncSession):
         self.db = db
     
-    def create(self, task: Task) -> Task:
-        """Create a new task."""
+    async def create(self, task: Task, audit: Optional[AuditEvent] = None) -> Task:
+        """Create a new task (PostgreSQL: task, tag rows and audit event in one statement)."""
         # Convert tags list to JSON string if provided
         if task.tags and isinstance(task.tags, list):
             task.tags = json.dumps(task.tags)
-        elif task.tags is None:
-            task.tags = None
+        if _batches_statements(self.db):
+            return (await self.db.execute(_insert_statement(task, audit))).scalar_one()
         
+        sync_task_tags(task)  # New object: tag_entries starts empty, no load needed
         self.db.add(task)
-        self.db.commit()
-        self.db.refresh(task)
+        await self.db.flush()  # Committed by the caller's unit of work
+        if audit is not None:
+            await self.db.execute(_audit_insert(audit, task.id, audit.metadata))
         return task
     
-    def get_by_id(self, task_id: int) -> Optional[Task]:
+    async def get_by_id(self, task_id: int) -> Optional[Task]:
         """Get task by ID."""
-        task = self.db.query(Task).options(joinedload(Task.owner)).filter(Task.id == task_id).first()
-        return task
+        result = await self.db.execute(TASK_BY_ID, {"task_id": task_id})
+        return result.scalar_one_or_none()
+    
+    async def get_by_ids(self, task_ids: List[int]) -> List[Task]:
+        """Get tasks by IDs (owner loaded, unordered; missing IDs are skipped)."""
+        if not task_ids:
+            return []
+        result = await self.db.execute(TASKS_BY_IDS, {"task_ids": task_ids})
+        return list(result.scalars())
+    
+    async def get_updated_at_many(self, task_ids: List[int]) -> Dict[int, Optional[datetime]]:
+        """Get updated_at for existing tasks by ID (primary key lookup, no join)."""
+        if not task_ids:
+            return {}
+        result = await self.db.execute(TASK_UPDATED_AT_BY_IDS, {"task_ids": task_ids})
+        return {task_id: updated_at for task_id, updated_at in result}
     
-    def get_all(self) -> List[Task]:
+    async def get_all(self) -> List[Task]:
         """Get all tasks (no ownership filter for reads)."""
-        tasks = self.db.query(Task).options(joinedload(Task.owner)).all()
-        return tasks
+        result = await self.db.execute(select(Task).options(joinedload(Task.owner)))
+        return list(result.scalars())
     
-    def update(self, task: Task) -> Task:
-        """Update an existing task."""
-        # Convert tags list to JSON string if provided
-        if task.tags and isinstance(task.tags, list):
-            task.tags = json.dumps(task.tags)
+    async def get_owner_id(self, task_id: int) -> Optional[int]:
+        """Get the owner of a task (None if the task does not exist)."""
+        result = await self.db.execute(TASK_OWNER_ID, {"task_id": task_id})
+        return result.scalar_one_or_none()
+    
+    async def update_owned(
+        self,
+        task_id: int,
+        owner_user_id: int,
+        values: Dict[str, Any],
+        previous: Sequence[str] = (),
+        audit: Optional[AuditEvent] = None
+    ) -> Optional[Tuple[Task, Dict[str, Any]]]:
+        """Update a task only if owned by the user (one UPDATE ... WHERE id AND owner RETURNING)."""
+        returns_previous = _returns_previous(self.db, previous)
+        clear_tags = "tags" in values and _batches_statements(self.db)
+        # PostgreSQL inserts the audit event from the UPDATE's statement
+        statement_audit = audit if _batches_statements(self.db) else None
+        previous_values: Dict[str, Any] = {}
+        if previous and not returns_previous:
+            row = (await self.db.execute(_previous_values_query(task_id, owner_user_id, previous))).first()
+            if row is None:
+                return None
+            previous_values = dict(row._mapping)
         
-        self.db.commit()
-        self.db.refresh(task)
-        return task
+        row = (await self.db.execute(
+            _update_owned_statement(
+                task_id, owner_user_id, values, previous, returns_previous, clear_tags, statement_audit
+            )
+        )).first()
+        if row is None:
+            return None
+        task = row[0]
+        if returns_previous:
+            previous_values = dict(zip(previous, row[1:]))
+        
+        if "tags" in values:
+            for statement in _replace_tags_statements(task_id, values["tags"], cleared=clear_tags):
+                await self.db.execute(statement)
+            self.db.expire(task, ["tag_entries"])
+        if audit is not None and statement_audit is None:
+            await self.db.execute(
+                _audit_insert(audit, task_id, _updated_metadata(audit.metadata, task, previous_values))
+            )
+        return task, previous_values
     
-    def delete(self, task_id: int) -> bool:
-        """Delete a task by ID."""
-        task = self.db.query(Task).filter(Task.id == task_id).first()
-        if task:
-            self.db.delete(task)
-            self.db.commit()
-            return True
-        return False
+    async def delete_owned(
+        self,
+        task_id: int,
+        owner_user_id: int,
+        audit: Optional[AuditEvent] = None
+    ) -> Optional[Task]:
+        """Delete a task only if owned by the user (tag rows, then the task, each one statement)."""
+        batched = _batches_statements(self.db)
+        *dependents, delete_task = _delete_owned_statements(
+            task_id, owner_user_id, batched, audit if batched else None
+        )
+        for statement in dependents:
+            await self.db.execute(statement)
+        deleted_task = (await self.db.execute(delete_task)).scalar_one_or_none()
+        if deleted_task is not None and audit is not None and not batched:
+            await self.db.execute(_audit_insert(audit, task_id, {**audit.metadata, "title": deleted_task.title}))
+        return deleted_task
@@ -0,0 +1,38 @@
+"""Pre-built statements for the hot lookups.
+
+The user lookup of every authenticated request and the task lookups by id
+run with the same shape on every call. Building them once at import, with
+their values as bind parameters, skips rebuilding the select() and its ORM
+options per call; SQLAlchemy also memoizes the cache key of a statement
+object, so executing the same object goes straight to the compiled form in
+the engine's statement cache (see infrastructure/database/statement_cache.py).
+
+Statements are immutable and safe to share across sessions and threads.
+Execute them with their parameters, e.g.
+`db.execute(TASK_BY_ID, {"task_id": task_id})`.
+"""
+
+from sqlalchemy import bindparam, select
+from sqlalchemy.orm import joinedload
+
+from domain.models.task import Task
+from domain.models.user import User
+
+# get_current_user (params: user_id)
+USER_BY_ID = select(User).where(User.id == bindparam("user_id"))
+
+# Task with its owner loaded (params: task_id)
+TASK_BY_ID = select(Task).options(joinedload(Task.owner)).where(Task.id == bindparam("task_id"))
+
+# Tasks with their owners loaded, unordered (params: task_ids, non-empty list)
+TASKS_BY_IDS = (
+    select(Task)
+    .options(joinedload(Task.owner))
+    .where(Task.id.in_(bindparam("task_ids", expanding=True)))
+)
+
+# Cache version check of task responses, no join (params: task_ids, non-empty list)
+TASK_UPDATED_AT_BY_IDS = select(Task.id, Task.updated_at).where(Task.id.in_(bindparam("task_ids", expanding=True)))
+
+# Owner lookup answering 403 vs 404 after an ownership-checked write (params: task_id)
+TASK_OWNER_ID = select(Task.owner_user_id).where(Task.id == bindparam("task_id"))
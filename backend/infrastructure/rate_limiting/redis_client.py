@@ -4,6 +4,8 @@ import os
 import logging
 from typing import Optional
 import redis
+from redis.backoff import NoBackoff
+from redis.retry import Retry
 
 logger = logging.getLogger(__name__)
 
@@ -11,6 +13,54 @@ logger = logging.getLogger(__name__)
 _redis_client: Optional[redis.Redis] = None
 
 
+def create_redis_client(
+    decode_responses: bool = True,
+    socket_timeout: float = 2,
+    retries: Optional[int] = None
+) -> redis.Redis:
+    """Create a Redis client from REDIS_URL or REDIS_HOST/PORT/PASSWORD/DB.
+    
+    The connection is opened lazily; callers ping or handle redis errors.
+    
+    Args:
+        decode_responses: Return strings instead of bytes
+        socket_timeout: Connect and command timeout in seconds
+        retries: Retries (without backoff) after a connection error or
+            timeout; None keeps redis-py's default policy (retries with
+            backoff, so a call can take several times socket_timeout)
+    
+    Returns:
+        Redis client instance
+    """
+    # Support REDIS_URL (e.g., redis://redis:6379/0) or individual env vars
+    redis_url = os.getenv("REDIS_URL")
+    if redis_url:
+        # Parse redis:// URL format
+        from urllib.parse import urlparse
+        parsed = urlparse(redis_url)
+        host = parsed.hostname or "localhost"
+        port = parsed.port or 6379
+        password = parsed.password or None
+        db = int(parsed.path.lstrip('/')) if parsed.path else 0
+    else:
+        # Fallback to individual environment variables
+        host = os.getenv("REDIS_HOST", "localhost")
+        port = int(os.getenv("REDIS_PORT", "6379"))
+        password = os.getenv("REDIS_PASSWORD") or None
+        db = int(os.getenv("REDIS_DB", "0"))
+    
+    return redis.Redis(
+        host=host,
+        port=port,
+        password=password,
+        db=db,
+        decode_responses=decode_responses,
+        socket_connect_timeout=socket_timeout,
+        socket_timeout=socket_timeout,
+        **({"retry": Retry(NoBackoff(), retries)} if retries is not None else {})
+    )
+
+
 def get_redis_client() -> Optional[redis.Redis]:
     """Get or create Redis client instance.
     
@@ -36,36 +86,16 @@ def get_redis_client() -> Optional[redis.Redis]:
     
     # Create new client
     try:
-        # Support REDIS_URL (e.g., redis://redis:6379/0) or individual env vars
-        redis_url = os.getenv("REDIS_URL")
-        if redis_url:
-            # Parse redis:// URL format
-            from urllib.parse import urlparse
-            parsed = urlparse(redis_url)
-            host = parsed.hostname or "localhost"
-            port = parsed.port or 6379
-            password = parsed.password or None
-            db = int(parsed.path.lstrip('/')) if parsed.path else 0
-        else:
-            # Fallback to individual environment variables
-            host = os.getenv("REDIS_HOST", "localhost")
-            port = int(os.getenv("REDIS_PORT", "6379"))
-            password = os.getenv("REDIS_PASSWORD") or None
-            db = int(os.getenv("REDIS_DB", "0"))
-        
-        _redis_client = redis.Redis(
-            host=host,
-            port=port,
-            password=password,
-            db=db,
+        _redis_client = create_redis_client(
             decode_responses=True,  # Return strings instead of bytes
-            socket_connect_timeout=2,  # Fast timeout for rate limiting
-            socket_timeout=2
+            socket_timeout=2,  # Fast timeout for rate limiting
+            retries=0  # Reconnected on every request while down: fail fast
         )
         
         # Test connection
         _redis_client.ping()
-        logger.info(f"Redis client connected to {host}:{port}")
+        connection_kwargs = _redis_client.connection_pool.connection_kwargs
+        logger.info(f"Redis client connected to {connection_kwargs['host']}:{connection_kwargs['port']}")
         return _redis_client
         
     except (redis.ConnectionError, redis.TimeoutError, Exception) as e:
@@ -0,0 +1,13 @@
+"""Infrastructure layer - Search module."""
+
+from .full_text import build_full_text_match, create_search_index, rebuild_search_index
+from .trigram import build_substring_match, create_trigram_index, rebuild_trigram_index
+
+__all__ = [
+    "build_full_text_match",
+    "create_search_index",
+    "rebuild_search_index",
+    "build_substring_match",
+    "create_trigram_index",
+    "rebuild_trigram_index"
+]
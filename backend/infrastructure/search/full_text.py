@@ -0,0 +1,194 @@
+"""Full-text search index for tasks (title + description).
+
+Backends:
+- SQLite: FTS5 external-content virtual table `task_search` (porter stemming),
+  kept in sync with `tasks` by AFTER INSERT/UPDATE/DELETE triggers.
+- PostgreSQL: stored generated `tsvector` column `tasks.search_vector`
+  with a GIN index.
+
+Both indexes are maintained by the database itself, so every writer
+(repositories, worker, seed scripts) keeps them current on task
+create/update/delete. The DDL runs automatically when the `tasks` table is
+created; existing databases are migrated with scripts/build_search_index.py.
+"""
+
+import re
+from typing import Dict, List, Optional
+
+from sqlalchemy import column, event, func, literal_column, select, table, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.selectable import Subquery
+
+from domain.models.task import Task
+
+# SQLite FTS5 virtual table (external content: stores only the index, not a copy of the text)
+SQLITE_FTS_DDL = [
+    """CREATE VIRTUAL TABLE IF NOT EXISTS task_search USING fts5(
+        title, description,
+        content='tasks', content_rowid='id',
+        tokenize='porter unicode61'
+    )""",
+    """CREATE TRIGGER IF NOT EXISTS task_search_ai AFTER INSERT ON tasks BEGIN
+        INSERT INTO task_search(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS task_search_ad AFTER DELETE ON tasks BEGIN
+        INSERT INTO task_search(task_search, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS task_search_au AFTER UPDATE OF title, description ON tasks BEGIN
+        INSERT INTO task_search(task_search, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO task_search(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END""",
+]
+
+SQLITE_FTS_REBUILD = "INSERT INTO task_search(task_search) VALUES ('rebuild')"
+
+SQLITE_FTS_DROP = "DROP TABLE IF EXISTS task_search"
+
+# PostgreSQL generated tsvector column + GIN index
+POSTGRES_FTS_DDL = [
+    """ALTER TABLE tasks ADD COLUMN IF NOT EXISTS search_vector tsvector
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(description, '')), 'B')
+        ) STORED""",
+    "CREATE INDEX IF NOT EXISTS idx_task_search_vector ON tasks USING GIN (search_vector)",
+]
+
+# Lightweight table construct for the FTS5 virtual table (not an ORM model)
+task_search = table("task_search", column("rowid"), column("title"), column("description"))
+
+# Availability per database URL (FTS5 may be missing from the SQLite build)
+_availability: Dict[str, bool] = {}
+
+
+def _sqlite_has_fts5(connection: Connection) -> bool:
+    """Check whether the SQLite library was compiled with FTS5."""
+    try:
+        return bool(connection.exec_driver_sql(
+            "SELECT sqlite_compileoption_used('ENABLE_FTS5')"
+        ).scalar())
+    except Exception:
+        return False
+
+
+def get_index_ddl(connection: Connection) -> List[str]:
+    """Get the full-text index DDL statements for the connection's dialect."""
+    dialect = connection.dialect.name
+    if dialect == "sqlite" and _sqlite_has_fts5(connection):
+        return SQLITE_FTS_DDL
+    if dialect == "postgresql":
+        return POSTGRES_FTS_DDL
+    return []
+
+
+def create_search_index(connection: Connection) -> bool:
+    """
+    Create the full-text index for the connection's dialect (idempotent).
+
+    Returns:
+        True if an index was created/present, False if the backend is unsupported
+    """
+    statements = get_index_ddl(connection)
+    for statement in statements:
+        connection.exec_driver_sql(statement)
+    _availability.pop(str(connection.engine.url), None)
+    return bool(statements)
+
+
+def rebuild_search_index(connection: Connection) -> None:
+    """Re-index all existing tasks (SQLite only; PostgreSQL columns are generated)."""
+    if connection.dialect.name == "sqlite" and _sqlite_has_fts5(connection):
+        connection.exec_driver_sql(SQLITE_FTS_REBUILD)
+
+
+@event.listens_for(Task.__table__, "after_create")
+def _create_search_index_after_tasks(target, connection, **kw):
+    """Create the full-text index whenever the tasks table is created."""
+    create_search_index(connection)
+
+
+@event.listens_for(Task.__table__, "before_drop")
+def _drop_search_index_before_tasks(target, connection, **kw):
+    """Drop the FTS5 table with the tasks table (triggers are dropped by SQLite)."""
+    if connection.dialect.name == "sqlite":
+        connection.exec_driver_sql(SQLITE_FTS_DROP)
+    _availability.pop(str(connection.engine.url), None)
+
+
+def is_search_index_available(db: Session) -> bool:
+    """Check (once per database) whether the full-text index exists."""
+    bind = db.get_bind()
+    key = str(bind.url)
+    if key not in _availability:
+        dialect = bind.dialect.name
+        if dialect == "sqlite":
+            exists = db.execute(text(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'task_search'"
+            )).first()
+        elif dialect == "postgresql":
+            exists = db.execute(text(
+                "SELECT 1 FROM information_schema.columns "
+                "WHERE table_name = 'tasks' AND column_name = 'search_vector'"
+            )).first()
+        else:
+            exists = None
+        _availability[key] = exists is not None
+    return _availability[key]
+
+
+def _search_terms(q: str) -> List[str]:
+    """Split a user search string into word tokens (drops FTS operators/punctuation)."""
+    return re.findall(r"\w+", q.lower())
+
+
+def build_full_text_match(db: Session, q: str) -> Optional[Subquery]:
+    """
+    Build the full-text match subquery for a search term.
+
+    Every word must match (AND) and is stemmed and prefix-matched, so
+    "deploy" also finds "deployed" and "depl" finds both.
+
+    Args:
+        db: Database session
+        q: Raw search term from the request
+
+    Returns:
+        Subquery with `task_id` and `relevance` (higher is better) columns to
+        join against tasks, or None if full-text search is unavailable or q
+        has no word tokens (callers fall back to substring matching).
+    """
+    terms = _search_terms(q)
+    if not terms or not is_search_index_available(db):
+        return None
+
+    dialect = db.get_bind().dialect.name
+    if dialect == "sqlite":
+        match_query = " ".join(f'"{term}"*' for term in terms)
+        matches = (
+            select(
+                task_search.c.rowid.label("task_id"),
+                # bm25() is lower-is-better; negate so higher means more relevant
+                (-func.bm25(literal_column("task_search"), 10.0, 1.0)).label("relevance"),
+            )
+            .where(literal_column("task_search").op("MATCH")(match_query))
+            .subquery("task_search_matches")
+        )
+        return matches
+
+    # PostgreSQL
+    ts_query = func.to_tsquery("english", " & ".join(f"{term}:*" for term in terms))
+    search_vector = literal_column("tasks.search_vector")
+    matches = (
+        select(
+            Task.id.label("task_id"),
+            func.ts_rank(search_vector, ts_query).label("relevance"),
+        )
+        .where(search_vector.op("@@")(ts_query))
+        .subquery("task_search_matches")
+    )
+    return matches
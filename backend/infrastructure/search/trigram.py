@@ -0,0 +1,340 @@
+"""Trigram substring indexes for tasks (title + description) and task tags.
+
+Keeps `q` substring semantics (partial words, mid-word matches) index-backed:
+- SQLite: FTS5 external-content table `task_trigram` using the trigram
+  tokenizer (SQLite >= 3.34), kept in sync by triggers like `task_search`.
+- PostgreSQL: `pg_trgm` GIN indexes on `tasks.title` and `tasks.description`,
+  which the planner uses for `ILIKE '%q%'` directly.
+
+The `tags` filter (partial tag matches) gets the same treatment:
+- SQLite: FTS5 trigram table `task_tag_trigram` with one row per task
+  (rowid = task id) holding its tags joined by TAG_SEPARATOR, rewritten by
+  triggers on `task_tags`. Trigrams never span the separator, so a term
+  only matches within a single tag.
+- PostgreSQL: `pg_trgm` GIN index on `task_tags.tag`, which serves the
+  `LIKE '%tag%'` semi-join directly.
+
+Optional: disable with SEARCH_TRIGRAM_ENABLED=false, or it is skipped when the
+backend lacks support (old SQLite, no permission to create pg_trgm). Searches
+then fall back to a plain ILIKE scan. Existing databases are migrated with
+scripts/build_search_index.py.
+"""
+
+import os
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import column, event, func, literal_column, or_, select, table, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.selectable import Select, Subquery
+
+from domain.models.task import Task
+from domain.models.task_tag import TaskTag
+from infrastructure.search.full_text import _sqlite_has_fts5
+
+SEARCH_TRIGRAM_ENABLED = os.getenv("SEARCH_TRIGRAM_ENABLED", "true").lower() == "true"
+
+# Trigrams need at least 3 characters; shorter terms cannot use the index
+MIN_TRIGRAM_LENGTH = 3
+
+# SQLite FTS5 trigram table (case-insensitive, external content)
+SQLITE_TRIGRAM_DDL = [
+    """CREATE VIRTUAL TABLE IF NOT EXISTS task_trigram USING fts5(
+        title, description,
+        content='tasks', content_rowid='id',
+        tokenize='trigram'
+    )""",
+    """CREATE TRIGGER IF NOT EXISTS task_trigram_ai AFTER INSERT ON tasks BEGIN
+        INSERT INTO task_trigram(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS task_trigram_ad AFTER DELETE ON tasks BEGIN
+        INSERT INTO task_trigram(task_trigram, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS task_trigram_au AFTER UPDATE OF title, description ON tasks BEGIN
+        INSERT INTO task_trigram(task_trigram, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO task_trigram(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END""",
+]
+
+SQLITE_TRIGRAM_REBUILD = "INSERT INTO task_trigram(task_trigram) VALUES ('rebuild')"
+
+SQLITE_TRIGRAM_DROP = "DROP TABLE IF EXISTS task_trigram"
+
+# PostgreSQL pg_trgm GIN indexes (serve ILIKE '%q%' directly)
+POSTGRES_TRIGRAM_DDL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS idx_task_title_trgm ON tasks USING GIN (title gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS idx_task_description_trgm ON tasks USING GIN (description gin_trgm_ops)",
+]
+
+# Joins a task's tags in task_tag_trigram (char(31), never part of a search term)
+TAG_SEPARATOR = "\x1f"
+
+# SQLite FTS5 trigram table of each task's tags (rowid = task id)
+SQLITE_TAG_TRIGRAM_DDL = [
+    """CREATE VIRTUAL TABLE IF NOT EXISTS task_tag_trigram USING fts5(
+        tags,
+        tokenize='trigram'
+    )""",
+    """CREATE TRIGGER IF NOT EXISTS task_tag_trigram_ai AFTER INSERT ON task_tags BEGIN
+        DELETE FROM task_tag_trigram WHERE rowid = new.task_id;
+        INSERT INTO task_tag_trigram(rowid, tags)
+        SELECT new.task_id, group_concat(tag, char(31)) FROM task_tags WHERE task_id = new.task_id;
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS task_tag_trigram_ad AFTER DELETE ON task_tags BEGIN
+        DELETE FROM task_tag_trigram WHERE rowid = old.task_id;
+        INSERT INTO task_tag_trigram(rowid, tags)
+        SELECT old.task_id, group_concat(tag, char(31)) FROM task_tags WHERE task_id = old.task_id
+        HAVING count(*) > 0;
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS task_tag_trigram_au AFTER UPDATE ON task_tags BEGIN
+        DELETE FROM task_tag_trigram WHERE rowid IN (old.task_id, new.task_id);
+        INSERT INTO task_tag_trigram(rowid, tags)
+        SELECT task_id, group_concat(tag, char(31)) FROM task_tags
+        WHERE task_id IN (old.task_id, new.task_id) GROUP BY task_id;
+    END""",
+    # A reused task id must not inherit the tags of a deleted task
+    """CREATE TRIGGER IF NOT EXISTS task_tag_trigram_task_ad AFTER DELETE ON tasks BEGIN
+        DELETE FROM task_tag_trigram WHERE rowid = old.id;
+    END""",
+]
+
+SQLITE_TAG_TRIGRAM_REBUILD = [
+    "DELETE FROM task_tag_trigram",
+    """INSERT INTO task_tag_trigram(rowid, tags)
+    SELECT task_id, group_concat(tag, char(31)) FROM task_tags GROUP BY task_id""",
+]
+
+SQLITE_TAG_TRIGRAM_DROP = [
+    "DROP TRIGGER IF EXISTS task_tag_trigram_task_ad",
+    "DROP TABLE IF EXISTS task_tag_trigram",
+]
+
+# PostgreSQL pg_trgm GIN index on the tag (serves LIKE '%tag%' directly)
+POSTGRES_TAG_TRIGRAM_DDL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS idx_task_tag_trgm ON task_tags USING GIN (tag gin_trgm_ops)",
+]
+
+# Lightweight table constructs for the FTS5 trigram tables (not ORM models)
+task_trigram = table("task_trigram", column("rowid"), column("title"), column("description"))
+task_tag_trigram = table("task_tag_trigram", column("rowid"), column("tags"))
+
+# Availability per (database URL, index)
+_availability: Dict[Tuple[str, str], bool] = {}
+
+
+def _sqlite_has_trigram(connection: Connection) -> bool:
+    """Check whether SQLite has FTS5 with the trigram tokenizer (3.34+)."""
+    if not _sqlite_has_fts5(connection):
+        return False
+    version = connection.exec_driver_sql("SELECT sqlite_version()").scalar()
+    return tuple(int(part) for part in version.split(".")[:2]) >= (3, 34)
+
+
+def get_index_ddl(connection: Connection) -> List[str]:
+    """Get the trigram index DDL statements for the connection's dialect."""
+    if not SEARCH_TRIGRAM_ENABLED:
+        return []
+    dialect = connection.dialect.name
+    if dialect == "sqlite" and _sqlite_has_trigram(connection):
+        return SQLITE_TRIGRAM_DDL
+    if dialect == "postgresql":
+        return POSTGRES_TRIGRAM_DDL
+    return []
+
+
+def get_tag_index_ddl(connection: Connection) -> List[str]:
+    """Get the tag trigram index DDL statements for the connection's dialect."""
+    if not SEARCH_TRIGRAM_ENABLED:
+        return []
+    dialect = connection.dialect.name
+    if dialect == "sqlite" and _sqlite_has_trigram(connection):
+        return SQLITE_TAG_TRIGRAM_DDL
+    if dialect == "postgresql":
+        return POSTGRES_TAG_TRIGRAM_DDL
+    return []
+
+
+def _run_index_ddl(connection: Connection, statements: List[str]) -> bool:
+    """
+    Run index DDL in a savepoint, so a missing privilege for CREATE EXTENSION
+    leaves the surrounding transaction (e.g. create_all) usable.
+    """
+    _availability.clear()
+    if not statements:
+        return False
+    try:
+        with connection.begin_nested():
+            for statement in statements:
+                connection.exec_driver_sql(statement)
+    except Exception:
+        return False
+    return True
+
+
+def create_trigram_index(connection: Connection) -> bool:
+    """
+    Create the trigram index for the connection's dialect (idempotent).
+
+    Returns:
+        True if an index was created/present, False if skipped or unsupported
+    """
+    return _run_index_ddl(connection, get_index_ddl(connection))
+
+
+def create_tag_trigram_index(connection: Connection) -> bool:
+    """
+    Create the tag trigram index for the connection's dialect (idempotent).
+
+    Returns:
+        True if an index was created/present, False if skipped or unsupported
+    """
+    return _run_index_ddl(connection, get_tag_index_ddl(connection))
+
+
+def rebuild_trigram_index(connection: Connection) -> None:
+    """Re-index all existing tasks and tags (SQLite only; PostgreSQL indexes are built on creation)."""
+    if connection.dialect.name == "sqlite" and get_index_ddl(connection):
+        connection.exec_driver_sql(SQLITE_TRIGRAM_REBUILD)
+        for statement in SQLITE_TAG_TRIGRAM_REBUILD:
+            connection.exec_driver_sql(statement)
+
+
+@event.listens_for(Task.__table__, "after_create")
+def _create_trigram_index_after_tasks(target, connection, **kw):
+    """Create the trigram index whenever the tasks table is created."""
+    create_trigram_index(connection)
+
+
+@event.listens_for(Task.__table__, "before_drop")
+def _drop_trigram_index_before_tasks(target, connection, **kw):
+    """Drop the FTS5 trigram table with the tasks table."""
+    if connection.dialect.name == "sqlite":
+        connection.exec_driver_sql(SQLITE_TRIGRAM_DROP)
+    _availability.clear()
+
+
+@event.listens_for(TaskTag.__table__, "after_create")
+def _create_tag_trigram_index_after_task_tags(target, connection, **kw):
+    """Create the tag trigram index whenever the task_tags table is created."""
+    create_tag_trigram_index(connection)
+
+
+@event.listens_for(TaskTag.__table__, "before_drop")
+def _drop_tag_trigram_index_before_task_tags(target, connection, **kw):
+    """Drop the FTS5 tag trigram table (and its trigger on tasks) with the task_tags table."""
+    if connection.dialect.name == "sqlite":
+        for statement in SQLITE_TAG_TRIGRAM_DROP:
+            connection.exec_driver_sql(statement)
+    _availability.clear()
+
+
+def _is_index_available(db: Session, sqlite_table: str, postgres_index: str) -> bool:
+    """Check (once per database) whether a trigram index exists."""
+    bind = db.get_bind()
+    key = (str(bind.url), sqlite_table)
+    if key not in _availability:
+        dialect = bind.dialect.name
+        if dialect == "sqlite":
+            exists = db.execute(text(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"
+            ), {"name": sqlite_table}).first()
+        elif dialect == "postgresql":
+            exists = db.execute(text(
+                "SELECT 1 FROM pg_indexes WHERE indexname = :name"
+            ), {"name": postgres_index}).first()
+        else:
+            exists = None
+        _availability[key] = exists is not None
+    return _availability[key]
+
+
+def is_trigram_index_available(db: Session) -> bool:
+    """Check (once per database) whether the task trigram index exists."""
+    return _is_index_available(db, "task_trigram", "idx_task_title_trgm")
+
+
+def is_tag_trigram_index_available(db: Session) -> bool:
+    """Check (once per database) whether the tag trigram index exists."""
+    return _is_index_available(db, "task_tag_trigram", "idx_task_tag_trgm")
+
+
+def build_substring_match(db: Session, q: str) -> Optional[Subquery]:
+    """
+    Build the trigram-backed substring match subquery for a search term.
+
+    Matches tasks whose title or description contains q (case-insensitive),
+    the same semantics as `ILIKE '%q%'`.
+
+    Args:
+        db: Database session
+        q: Raw search term from the request
+
+    Returns:
+        Subquery with `task_id` and `relevance` (higher is better) columns to
+        join against tasks, or None if the trigram index is unavailable or q
+        is shorter than 3 characters (callers fall back to ILIKE).
+    """
+    if len(q) < MIN_TRIGRAM_LENGTH or not is_trigram_index_available(db):
+        return None
+
+    dialect = db.get_bind().dialect.name
+    if dialect == "sqlite":
+        # A quoted phrase of trigrams matches any row containing the substring
+        match_query = '"' + q.replace('"', '""') + '"'
+        return (
+            select(
+                task_trigram.c.rowid.label("task_id"),
+                (-func.bm25(literal_column("task_trigram"), 10.0, 1.0)).label("relevance"),
+            )
+            .where(literal_column("task_trigram").op("MATCH")(match_query))
+            .subquery("task_trigram_matches")
+        )
+
+    # PostgreSQL: ILIKE is served by the pg_trgm GIN indexes
+    search_term = f"%{q}%"
+    return (
+        select(
+            Task.id.label("task_id"),
+            func.greatest(
+                func.similarity(Task.title, q),
+                func.coalesce(func.similarity(Task.description, q), 0),
+            ).label("relevance"),
+        )
+        .where(or_(Task.title.ilike(search_term), Task.description.ilike(search_term)))
+        .subquery("task_trigram_matches")
+    )
+
+
+def build_tag_match(db: Session, tags: List[str]) -> Select:
+    """
+    Build the tag filter: ids of tasks with a tag containing any of the terms.
+
+    Args:
+        db: Database session
+        tags: Normalized (stripped, lowercased, non-empty) filter terms
+
+    Returns:
+        Select of task ids to semi-join against tasks. On SQLite with the
+        tag trigram table and terms of 3+ characters, an FTS5 match. Otherwise
+        `LIKE '%tag%'` on task_tags: served by the pg_trgm GIN index on
+        PostgreSQL, a scan of the (tag, task_id) index elsewhere.
+    """
+    if (
+        db.get_bind().dialect.name == "sqlite"
+        and all(len(tag) >= MIN_TRIGRAM_LENGTH and TAG_SEPARATOR not in tag for tag in tags)
+        and is_tag_trigram_index_available(db)
+    ):
+        # Quoted phrases of trigrams: tasks having any tag that contains a term
+        match_query = " OR ".join('"' + tag.replace('"', '""') + '"' for tag in tags)
+        return (
+            select(task_tag_trigram.c.rowid)
+            .where(literal_column("task_tag_trigram").op("MATCH")(match_query))
+        )
+
+    return select(TaskTag.task_id).where(or_(*[TaskTag.tag.contains(tag, autoescape=True) for tag in tags]))
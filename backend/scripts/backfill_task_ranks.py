@@ -0,0 +1,108 @@
+"""Script to add and backfill the integer status_rank/priority_rank task columns.
+
+Adds the columns if missing, recomputes them for every existing task from
+status/priority, creates the rank indexes and drops the string-based
+composites they replace. New writes keep the ranks in sync through the Task
+model. Safe to run multiple times.
+"""
+
+import sys
+from sqlalchemy import case, func, inspect, update
+
+# Add parent directory to path
+sys.path.insert(0, '.')
+
+from infrastructure.database import engine, init_db
+from domain.models.task import Task, STATUS_RANKS, PRIORITY_RANKS, UNKNOWN_RANK
+from scripts.create_indexes import create_indexes
+
+RANK_COLUMNS = ["status_rank", "priority_rank"]
+
+# String-based composites replaced by the rank indexes
+OBSOLETE_INDEXES = [
+    "idx_task_status_due_date",
+    "idx_task_status_created_at",
+    "idx_task_priority_due_date",
+    "idx_task_priority_created_at",
+]
+
+
+def _rank_expression(column, ranks):
+    """SQL expression computing a rank column (NULL stays NULL, unknown values rank 0)."""
+    return case(
+        (column.is_(None), None),
+        else_=case(ranks, value=column, else_=UNKNOWN_RANK)
+    )
+
+
+def backfill_task_ranks(batch_size: int = 5000) -> int:
+    """
+    Add missing rank columns and recompute them for every task.
+
+    Args:
+        batch_size: Width of each primary key range updated (and committed) per batch
+
+    Returns:
+        Number of tasks updated
+    """
+    updated = 0
+
+    try:
+        with engine.begin() as connection:
+            existing = {column["name"] for column in inspect(connection).get_columns("tasks")}
+            for name in RANK_COLUMNS:
+                if name not in existing:
+                    print(f"   Adding column tasks.{name}...")
+                    connection.exec_driver_sql(f"ALTER TABLE tasks ADD COLUMN {name} SMALLINT")
+
+        with engine.connect() as connection:
+            max_id = connection.execute(func.max(Task.id).select()).scalar() or 0
+
+        # Set-based UPDATE per primary key range keeps transactions short on large tables
+        for start in range(0, max_id, batch_size):
+            with engine.begin() as connection:
+                result = connection.execute(
+                    update(Task.__table__)
+                    .where(Task.id > start, Task.id <= start + batch_size)
+                    .values(
+                        status_rank=_rank_expression(Task.status, STATUS_RANKS),
+                        priority_rank=_rank_expression(Task.priority, PRIORITY_RANKS)
+                    )
+                )
+            updated += result.rowcount
+            print(f"   Processed {updated} tasks...")
+
+        with engine.begin() as connection:
+            for name in OBSOLETE_INDEXES:
+                connection.exec_driver_sql(f"DROP INDEX IF EXISTS {name}")
+
+        create_indexes()
+
+        print(f"✅ Backfilled ranks for {updated} tasks!")
+        return updated
+
+    except Exception as e:
+        print(f"❌ Error backfilling task ranks: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return updated
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Add and backfill Task.status_rank/priority_rank')
+    parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=5000,
+        help='Primary key range per batch (default: 5000)'
+    )
+
+    args = parser.parse_args()
+
+    # Initialize database
+    init_db()
+
+    # Backfill ranks
+    backfill_task_ranks(batch_size=args.batch_size)
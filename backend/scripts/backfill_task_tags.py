@@ -0,0 +1,81 @@
+"""Script to backfill the normalized task_tags table from Task.tags JSON strings.
+
+Creates the task_tags table if missing (via init_db) and rebuilds its rows
+for every existing task. Safe to run multiple times.
+"""
+
+import sys
+from sqlalchemy.orm import Session, selectinload
+
+# Add parent directory to path
+sys.path.insert(0, '.')
+
+from infrastructure.database import SessionLocal, init_db
+from infrastructure.persistence.repositories.task_repository import sync_task_tags
+from domain.models.task import Task
+
+
+def backfill_task_tags(batch_size: int = 500) -> int:
+    """
+    Rebuild task_tags rows from the JSON `tags` column of every task.
+
+    Args:
+        batch_size: Number of tasks processed (and committed) per batch
+
+    Returns:
+        Number of tasks processed
+    """
+    db: Session = SessionLocal()
+    processed = 0
+    last_id = 0
+
+    try:
+        while True:
+            # Keyset batches by primary key so memory stays bounded on large tables
+            tasks = db.query(Task).options(selectinload(Task.tag_entries)).filter(
+                Task.id > last_id
+            ).order_by(Task.id).limit(batch_size).all()
+
+            if not tasks:
+                break
+
+            for task in tasks:
+                sync_task_tags(task)
+
+            db.commit()
+            processed += len(tasks)
+            last_id = tasks[-1].id
+            db.expunge_all()
+            print(f"   Processed {processed} tasks...")
+
+        print(f"✅ Backfilled tags for {processed} tasks!")
+        return processed
+
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Error backfilling task tags: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return processed
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Backfill normalized task_tags from Task.tags JSON')
+    parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=500,
+        help='Number of tasks per batch (default: 500)'
+    )
+
+    args = parser.parse_args()
+
+    # Initialize database (creates task_tags table if missing)
+    init_db()
+
+    # Backfill tags
+    backfill_task_tags(batch_size=args.batch_size)
@@ -0,0 +1,101 @@
+"""Benchmark the per-call Python overhead of the hot lookups.
+
+Compares building the statement on every call (before) with executing the
+pre-built statements of infrastructure/persistence/statements.py (after):
+
+- build: constructing the statement and computing its cache key, i.e. the
+  work done before the compiled SQL is found in the statement cache
+- execute: a full ORM execution against an in-memory SQLite database (so the
+  database time is negligible), with an empty identity map as in a request
+
+Usage: python scripts/benchmark_statements.py [iterations]
+"""
+
+import sys
+import timeit
+
+# Add parent directory to path
+sys.path.insert(0, '.')
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session, joinedload
+
+from domain.models import Base
+from domain.models.task import Task
+from domain.models.user import User
+from infrastructure.persistence.statements import USER_BY_ID, TASK_BY_ID, TASK_OWNER_ID
+
+
+def _ad_hoc_task_by_id(task_id):
+    return select(Task).options(joinedload(Task.owner)).where(Task.id == task_id)
+
+
+def _ad_hoc_owner_id(task_id):
+    return select(Task.owner_user_id).where(Task.id == task_id)
+
+
+def _per_call_us(function, iterations):
+    """Average microseconds per call (best of 3 runs)."""
+    return min(timeit.repeat(function, number=iterations, repeat=3)) / iterations * 1e6
+
+
+def benchmark(iterations=5000):
+    """Print before/after timings for each hot lookup."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    db = Session(engine)
+    user = User(username="bench", email="bench@example.com", hashed_password="x")
+    db.add(user)
+    db.flush()
+    task = Task(title="Bench", owner_user_id=user.id)
+    db.add(task)
+    db.commit()
+    user_id, task_id = user.id, task.id
+
+    def get_user_before():
+        db.expunge_all()
+        return db.get(User, user_id)
+
+    def get_user_after():
+        db.expunge_all()
+        return db.execute(USER_BY_ID, {"user_id": user_id}).scalar_one()
+
+    def get_task_before():
+        db.expunge_all()
+        return db.execute(_ad_hoc_task_by_id(task_id)).scalar_one()
+
+    def get_task_after():
+        db.expunge_all()
+        return db.execute(TASK_BY_ID, {"task_id": task_id}).scalar_one()
+
+    def get_owner_before():
+        return db.execute(_ad_hoc_owner_id(task_id)).scalar_one()
+
+    def get_owner_after():
+        return db.execute(TASK_OWNER_ID, {"task_id": task_id}).scalar_one()
+
+    cases = [
+        ("task by id: build", lambda: _ad_hoc_task_by_id(task_id)._generate_cache_key(),
+         lambda: TASK_BY_ID._generate_cache_key()),
+        ("owner id: build", lambda: _ad_hoc_owner_id(task_id)._generate_cache_key(),
+         lambda: TASK_OWNER_ID._generate_cache_key()),
+        ("user by id: execute", get_user_before, get_user_after),
+        ("task by id: execute", get_task_before, get_task_after),
+        ("owner id: execute", get_owner_before, get_owner_after),
+    ]
+
+    print(f"\n⏱️  Per-call Python overhead ({iterations} iterations, best of 3)\n")
+    print(f"{'Lookup':<22} {'Before (µs)':>12} {'After (µs)':>12} {'Saved':>8}")
+    print("-" * 58)
+    for name, before, after in cases:
+        before_us = _per_call_us(before, iterations)
+        after_us = _per_call_us(after, iterations)
+        saved = (1 - after_us / before_us) * 100
+        print(f"{name:<22} {before_us:>12.1f} {after_us:>12.1f} {saved:>7.0f}%")
+
+    db.close()
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
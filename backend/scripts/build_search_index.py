@@ -0,0 +1,58 @@
+"""Script to create and populate the task search indexes.
+
+New databases get the indexes automatically when the tasks table is created.
+Run this once on existing databases. Safe to run multiple times.
+
+- Full-text: SQLite FTS5 table + triggers (then a full rebuild);
+  PostgreSQL generated tsvector column + GIN index.
+- Trigram (substring `q` and partial tag filters): SQLite FTS5 trigram tables
+  + triggers; PostgreSQL pg_trgm GIN indexes (skipped if
+  SEARCH_TRIGRAM_ENABLED=false).
+"""
+
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, '.')
+
+from infrastructure.database import engine, init_db
+from infrastructure.search.full_text import create_search_index, rebuild_search_index
+from infrastructure.search.trigram import create_tag_trigram_index, create_trigram_index, rebuild_trigram_index
+
+
+def build_search_index() -> bool:
+    """
+    Create (if missing) and rebuild the full-text and trigram search indexes.
+
+    Returns:
+        True if successful, False otherwise
+    """
+    try:
+        with engine.begin() as connection:
+            if not create_search_index(connection):
+                print(f"⚠️  Full-text search is not supported for '{engine.dialect.name}', skipping.")
+                return False
+            rebuild_search_index(connection)
+
+            if create_trigram_index(connection) and create_tag_trigram_index(connection):
+                rebuild_trigram_index(connection)
+                print(f"✅ Trigram substring index ready ({engine.dialect.name})!")
+            else:
+                print("⚠️  Trigram substring index skipped (disabled or unsupported).")
+
+        print(f"✅ Full-text search index ready ({engine.dialect.name})!")
+        return True
+
+    except Exception as e:
+        print(f"❌ Error building search index: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+if __name__ == "__main__":
+    # Initialize database
+    init_db()
+
+    # Build index
+    build_search_index()
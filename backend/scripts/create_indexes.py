@@ -0,0 +1,59 @@
+"""Script to create missing model indexes on an existing database.
+
+`create_all` only creates indexes together with their table, so indexes
+added to a model later (e.g. the task filter/sort composites) are missing
+from databases created before. Run this once after upgrading. Safe to run
+multiple times: existing indexes are skipped.
+"""
+
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, '.')
+
+from sqlalchemy import inspect
+
+from infrastructure.database import engine, init_db
+from domain.models import Base
+
+
+def create_indexes() -> bool:
+    """
+    Create every index declared on the models that does not exist yet.
+
+    Returns:
+        True if successful, False otherwise
+    """
+    try:
+        with engine.begin() as connection:
+            inspector = inspect(connection)
+            existing_tables = set(inspector.get_table_names())
+            created = 0
+
+            for table in Base.metadata.sorted_tables:
+                if table.name not in existing_tables:
+                    continue
+                existing = {index["name"] for index in inspector.get_indexes(table.name)}
+                for index in sorted(table.indexes, key=lambda index: index.name):
+                    if index.name in existing:
+                        continue
+                    print(f"   Creating {index.name} on {table.name}...")
+                    index.create(connection)
+                    created += 1
+
+        print(f"✅ Indexes up to date ({created} created)!")
+        return True
+
+    except Exception as e:
+        print(f"❌ Error creating indexes: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+if __name__ == "__main__":
+    # Initialize database
+    init_db()
+
+    # Create missing indexes
+    create_indexes()
@@ -1,7 +1,6 @@
 """Script to create a user in the database."""
 
 import sys
-import bcrypt
 from sqlalchemy.orm import Session
 
 # Add parent directory to path
@@ -9,6 +8,7 @@ sys.path.insert(0, '.')
 
 from infrastructure.database import SessionLocal, init_db
 from domain.models.user import User
+from application.auth.login import hash_password
 
 
 def create_user(username: str, email: str, password: str) -> User:
@@ -36,7 +36,7 @@ def create_user(username: str, email: str, password: str) -> User:
             return None
         
         # Hash password
-        hashed_password = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+        hashed_password = hash_password(password)
         
         # Create user
         user = User(
@@ -0,0 +1,61 @@
+"""Script to generate a JWT signing key pair (RS256 or ES256)."""
+
+import os
+import sys
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, rsa
+
+# Add parent directory to path
+sys.path.insert(0, '.')
+
+from infrastructure.auth.config import auth_config
+from infrastructure.auth.signing_keys import key_id, read_key
+
+
+def generate_signing_key(algorithm: str, path: str) -> bool:
+    """
+    Write a new private key as PEM (readable by the owner only).
+
+    Args:
+        algorithm: RS256 or ES256
+        path: Key file to create (set it as JWT_SIGNING_KEY_FILE or in JWT_PUBLISHED_KEY_FILES)
+
+    Returns:
+        True if the key was written, False if the file already exists
+    """
+    if os.path.exists(path):
+        print(f"❌ {path} already exists!")
+        return False
+
+    if algorithm == "RS256":
+        key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    else:
+        key = ec.generate_private_key(ec.SECP256R1())
+    pem = key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption()
+    )
+
+    with os.fdopen(os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600), "wb") as key_file:
+        key_file.write(pem)
+
+    # Same kid as the API will put in token headers and the JWKS
+    kid = key_id(read_key(path, algorithm))
+    print(f"✅ {algorithm} key written to {path} (kid {kid})")
+    return True
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Generate a JWT signing key pair')
+    parser.add_argument('path', help='Private key file to create')
+    parser.add_argument('--algorithm', choices=['RS256', 'ES256'],
+                        default=auth_config.get_algorithm() if auth_config.get_algorithm() != 'HS256' else 'RS256',
+                        help='Key type (default: JWT_ALGORITHM, or RS256)')
+
+    args = parser.parse_args()
+
+    generate_signing_key(args.algorithm, args.path)
@@ -1,7 +1,6 @@
 """Script to reset a user's password in the database."""
 
 import sys
-import bcrypt
 from sqlalchemy.orm import Session
 
 # Add parent directory to path
@@ -9,6 +8,8 @@ sys.path.insert(0, '.')
 
 from infrastructure.database import SessionLocal, init_db
 from domain.models.user import User
+from application.auth.login import hash_password
+from infrastructure.cache.principal_cache import invalidate_principal
 
 
 def reset_password(username: str, new_password: str) -> bool:
@@ -35,11 +36,13 @@ def reset_password(username: str, new_password: str) -> bool:
             return False
         
         # Hash new password
-        hashed_password = bcrypt.hashpw(new_password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+        hashed_password = hash_password(new_password)
         
         # Update password
         user.hashed_password = hashed_password
         db.commit()
+        # Running API processes drop the Redis entry now, their own after PRINCIPAL_CACHE_TTL_SECONDS
+        invalidate_principal(user.id)
         
         print(f"✅ Password reset successfully for user '{user.username}'!")
         return True
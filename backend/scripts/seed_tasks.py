@@ -13,6 +13,7 @@ sys.path.insert(0, '.')
 from infrastructure.database import SessionLocal, init_db
 from domain.models.user import User
 from domain.models.task import Task
+from infrastructure.persistence.repositories.task_repository import sync_task_tags
 
 
 # Sample data for generating tasks
@@ -112,8 +113,8 @@ def get_or_create_seed_user(db: Session) -> User:
     
     if not user:
         # Create seed user
-        import bcrypt
-        hashed_password = bcrypt.hashpw(b"seed_password", bcrypt.gensalt()).decode('utf-8')
+        from application.auth.login import hash_password
+        hashed_password = hash_password("seed_password")
         user = User(
             username="seed_user",
             email="seed@example.com",
@@ -211,6 +212,7 @@ def seed_tasks(count: int = 50, user_id: int = None):
         for i in range(count):
             task_data = generate_task_data(i, user.id)
             task = Task(**task_data)
+            sync_task_tags(task)
             db.add(task)
             created += 1
         
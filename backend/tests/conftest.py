@@ -3,17 +3,24 @@
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import NullPool
 import bcrypt
 
 from api.main import app
-from infrastructure.database import get_db
+from infrastructure.database import get_db, get_async_db, to_async_url
 # Import Base first, then all models to ensure they're registered
 from domain.models import Base
 from domain.models.user import User
 from domain.models.task import Task
 from domain.models.attachment import Attachment
 from infrastructure.persistence.models.audit_event import AuditEvent
+from infrastructure.cache import redis_cache
+from infrastructure.cache.task_generation import bump_task_generation
+from infrastructure.cache.task_response_cache import clear_task_response_cache
+from infrastructure.cache.principal_cache import clear_principal_cache
+from infrastructure.auth.token_verifier import clear_verified_tokens
 
 # Use shared in-memory SQLite for tests (file-based ensures same connection)
 # Using a file path ensures all connections share the same database
@@ -23,7 +30,11 @@ _test_db_file = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
 _test_db_file.close()
 TEST_DATABASE_URL = f"sqlite:///{_test_db_file.name}"
 test_engine = create_engine(TEST_DATABASE_URL, connect_args={"check_same_thread": False})
-TestSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=test_engine)
+TestSessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=test_engine)
+# Async routes use the same database file; NullPool because TestClient may
+# run each request on a new event loop
+test_async_engine = create_async_engine(to_async_url(TEST_DATABASE_URL), poolclass=NullPool)
+TestAsyncSessionLocal = async_sessionmaker(test_async_engine, autoflush=False, expire_on_commit=False)
 
 # Cleanup function to remove test database file
 def _cleanup_test_db():
@@ -41,6 +52,11 @@ def db_session():
     Base.metadata.drop_all(bind=test_engine)
     # Create tables
     Base.metadata.create_all(bind=test_engine)
+    # The database was replaced outside the task use cases: drop cached results
+    bump_task_generation()
+    clear_task_response_cache()
+    clear_principal_cache()
+    clear_verified_tokens()
     
     db = TestSessionLocal()
     try:
@@ -61,7 +77,12 @@ def client(db_session: Session):
         finally:
             pass  # Don't close here, fixture handles it
     
+    async def override_get_async_db():
+        async with TestAsyncSessionLocal() as db:
+            yield db
+    
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
     yield TestClient(app)
     app.dependency_overrides.clear()
 
@@ -124,3 +145,68 @@ def user2(db_session: Session):
     db_session.commit()
     db_session.refresh(user)
     return user
+
+
+class InMemoryRedis:
+    """Minimal in-memory stand-in for the Redis commands used by the caches."""
+    
+    def __init__(self):
+        self.values = {}
+        self.index = {}
+    
+    def get(self, key):
+        return self.values.get(key)
+    
+    def mget(self, keys, *args):
+        keys = list(keys) if isinstance(keys, (list, tuple)) else [keys]
+        return [self.values.get(key) for key in keys + list(args)]
+    
+    def set(self, key, value, ex=None, px=None):
+        self.values[key] = value
+    
+    def exists(self, *keys):
+        return sum(1 for key in keys if key in self.values)
+    
+    def incr(self, key):
+        self.values[key] = str(int(self.values.get(key, b"0")) + 1).encode()
+        return int(self.values[key])
+    
+    def zadd(self, key, mapping):
+        self.index.update(mapping)
+    
+    def zcard(self, key):
+        return len(self.index)
+    
+    def zpopmin(self, key, count):
+        oldest = sorted(self.index.items(), key=lambda item: item[1])[:count]
+        for member, _ in oldest:
+            del self.index[member]
+        return oldest
+    
+    def delete(self, *keys):
+        for key in keys:
+            self.values.pop(key, None)
+    
+    def pipeline(self, transaction=True):
+        return _InMemoryPipeline(self)
+
+
+class _InMemoryPipeline:
+    def __init__(self, client):
+        self.client = client
+        self.calls = []
+    
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.calls.append((name, args, kwargs))
+    
+    def execute(self):
+        return [getattr(self.client, name)(*args, **kwargs) for name, args, kwargs in self.calls]
+
+
+@pytest.fixture
+def cache_redis(monkeypatch):
+    """Point the application caches at an in-memory Redis."""
+    fake = InMemoryRedis()
+    monkeypatch.setattr(redis_cache, "_client", fake)
+    yield fake
+    redis_cache.reset_cache_client()
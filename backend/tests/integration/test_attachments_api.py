@@ -0,0 +1,117 @@
+"""Integration tests for attachment endpoints (async routes on AsyncSession)."""
+
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from api.main import app
+from api.routes import attachments as attachment_routes
+from api.routes import tasks as task_routes
+from domain.models.user import User
+from domain.models.task import Task
+from infrastructure.attachments.storage import LocalFileStorage
+from infrastructure.persistence.models.audit_event import AuditEvent
+
+
+@pytest.fixture
+def storage(client: TestClient, tmp_path):
+    """Store uploads in a temporary directory."""
+    local_storage = LocalFileStorage(base_path=str(tmp_path))
+    app.dependency_overrides[attachment_routes.get_storage] = lambda: local_storage
+    app.dependency_overrides[task_routes.get_storage] = lambda: local_storage
+    return local_storage
+
+
+@pytest.fixture
+def token(client: TestClient, user1: User) -> str:
+    """Login as user1."""
+    response = client.post("/api/auth/login", json={"username": "user1", "password": "password1"})
+    return response.json()["token"]
+
+
+@pytest.fixture
+def task_user1(db_session: Session, user1: User) -> Task:
+    """Create task owned by user1."""
+    task = Task(title="With files", status="todo", priority="low", owner_user_id=user1.id)
+    db_session.add(task)
+    db_session.commit()
+    db_session.refresh(task)
+    return task
+
+
+def test_attachment_upload_list_delete(client: TestClient, db_session: Session, storage, token: str, task_user1: Task):
+    """Test the attachment lifecycle through the async endpoints."""
+    headers = {"Authorization": f"Bearer {token}"}
+
+    upload = client.post(
+        f"/api/tasks/{task_user1.id}/attachments",
+        files={"file": ("notes file.txt", b"hello", "text/plain")},
+        headers=headers
+    )
+    assert upload.status_code == 201
+    attachment = upload.json()
+    assert attachment["filename"] == "notes_file.txt"
+    assert attachment["file_size"] == 5
+    assert storage.exists(f"{task_user1.id}/notes_file.txt")
+
+    listed = client.get(f"/api/tasks/{task_user1.id}/attachments", headers=headers)
+    assert listed.status_code == 200
+    assert [item["id"] for item in listed.json()] == [attachment["id"]]
+
+    deleted = client.delete(f"/api/attachments/{attachment['id']}", headers=headers)
+    assert deleted.status_code == 204
+    assert client.get(f"/api/tasks/{task_user1.id}/attachments", headers=headers).json() == []
+    assert not storage.exists(f"{task_user1.id}/notes_file.txt")
+
+    actions = [event.action_type for event in db_session.query(AuditEvent).order_by(AuditEvent.id)]
+    assert actions == ["attachment_uploaded", "attachment_deleted"]
+
+
+def test_delete_task_removes_attachments(client: TestClient, storage, token: str, task_user1: Task):
+    """Test deleting a task deletes its attachments and files."""
+    headers = {"Authorization": f"Bearer {token}"}
+    client.post(
+        f"/api/tasks/{task_user1.id}/attachments",
+        files={"file": ("a.txt", b"data", "text/plain")},
+        headers=headers
+    )
+
+    response = client.delete(f"/api/tasks/{task_user1.id}", headers=headers)
+
+    assert response.status_code == 204
+    assert client.get(f"/api/tasks/{task_user1.id}", headers=headers).status_code == 404
+    assert not storage.exists(f"{task_user1.id}/a.txt")
+
+
+def test_storage_calls_run_off_the_event_loop(client: TestClient, storage, token: str, task_user1: Task, monkeypatch):
+    """Test upload and both deletions write and unlink files from worker threads, never on the event loop."""
+    on_loop = []
+    calls = []
+
+    def recording(name):
+        method = getattr(storage, name)
+
+        def call(*args, **kwargs):
+            try:
+                asyncio.get_running_loop()
+                on_loop.append(name)
+            except RuntimeError:
+                pass
+            calls.append(name)
+            return method(*args, **kwargs)
+        return call
+
+    for name in ("save", "delete"):
+        monkeypatch.setattr(storage, name, recording(name))
+
+    headers = {"Authorization": f"Bearer {token}"}
+    url = f"/api/tasks/{task_user1.id}/attachments"
+    first = client.post(url, files={"file": ("a.txt", b"a", "text/plain")}, headers=headers).json()
+    client.post(url, files={"file": ("b.txt", b"b", "text/plain")}, headers=headers)
+    assert client.delete(f"/api/attachments/{first['id']}", headers=headers).status_code == 204
+    assert client.delete(f"/api/tasks/{task_user1.id}", headers=headers).status_code == 204
+
+    assert calls == ["save", "save", "delete", "delete"]
+    assert on_loop == []
@@ -1,10 +1,13 @@
 """Integration tests for audit trail."""
 
+import asyncio
+
 import pytest
 from sqlalchemy.orm import Session
 import bcrypt
 
 from domain.models.user import User
+from domain.auth.principal import Principal
 from domain.models.task import Task
 from domain.audit.audit_event import AuditActionType
 from infrastructure.persistence.models.audit_event import AuditEvent as AuditEventModel
@@ -14,16 +17,34 @@ from application.tasks.delete_task import delete_task
 from application.tasks.schemas import TaskCreateRequest, TaskUpdateRequest
 from application.attachments.upload_attachment import upload_attachment
 from application.attachments.delete_attachment import delete_attachment
-from application.attachments.repository import AttachmentRepository
-from application.tasks.repository import TaskRepository
-from infrastructure.persistence.repositories.task_repository import SQLAlchemyTaskRepository
-from infrastructure.persistence.repositories.attachment_repository import SQLAlchemyAttachmentRepository
+from infrastructure.persistence.repositories.task_repository import AsyncSQLAlchemyTaskRepository
+from infrastructure.persistence.repositories.attachment_repository import AsyncSQLAlchemyAttachmentRepository
 from infrastructure.attachments.storage import LocalFileStorage
-from infrastructure.audit.audit_logger import AuditLoggerImpl
-from infrastructure.persistence.repositories.audit_repository import SQLAlchemyAuditRepository
+from infrastructure.audit.audit_logger import AsyncAuditLoggerImpl
+from infrastructure.persistence.repositories.audit_repository import AsyncSQLAlchemyAuditRepository
+from infrastructure.database.unit_of_work import AsyncSQLAlchemyUnitOfWork
+from tests.conftest import TestAsyncSessionLocal
 from io import BytesIO
 
 
+class UseCaseDependencies:
+    """Repositories, unit of work and audit logger on one async session (as the routes wire them)."""
+
+    def __init__(self, db):
+        self.tasks = AsyncSQLAlchemyTaskRepository(db)
+        self.attachments = AsyncSQLAlchemyAttachmentRepository(db)
+        self.unit_of_work = AsyncSQLAlchemyUnitOfWork(db)
+        self.audit_logger = AsyncAuditLoggerImpl(AsyncSQLAlchemyAuditRepository(db))
+
+
+def run_use_cases(scenario):
+    """Run scenario(deps) on a fresh async session of the test database."""
+    async def run():
+        async with TestAsyncSessionLocal() as db:
+            return await scenario(UseCaseDependencies(db))
+    return asyncio.run(run())
+
+
 @pytest.fixture
 def test_user(db_session: Session):
     """Create a test user."""
@@ -39,25 +60,17 @@ def test_user(db_session: Session):
     return user
 
 
-@pytest.fixture
-def audit_logger(db_session: Session):
-    """Create audit logger."""
-    audit_repository = SQLAlchemyAuditRepository(db_session)
-    return AuditLoggerImpl(audit_repository)
-
-
-def test_task_creation_creates_audit_event(db_session: Session, test_user, audit_logger):
+def test_task_creation_creates_audit_event(db_session: Session, test_user):
     """Test that task creation creates an audit event."""
-    task_repository = SQLAlchemyTaskRepository(db_session)
-    
-    # Create task
     request = TaskCreateRequest(
         title="Test Task",
         description="Test Description",
         status="todo",
         priority="high"
     )
-    create_task(task_repository, request, test_user.id, audit_logger)
+    
+    # Create task
+    created_task = run_use_cases(lambda deps: create_task(deps.tasks, deps.unit_of_work, request, Principal.of(test_user)))
     
     # Verify audit event was created
     events = db_session.query(AuditEventModel).filter(
@@ -68,21 +81,23 @@ def test_task_creation_creates_audit_event(db_session: Session, test_user, audit
     event = events[0]
     assert event.user_id == test_user.id
     assert event.resource_type == "task"
-    assert event.event_metadata is not None
-    assert "title" in event.event_metadata
+    assert event.resource_id == str(created_task.id)
+    assert event.event_metadata == {"title": "Test Task", "status": "todo", "priority": "high"}
 
 
-def test_task_update_creates_audit_event(db_session: Session, test_user, audit_logger):
+def test_task_update_creates_audit_event(db_session: Session, test_user):
     """Test that task update creates an audit event."""
-    task_repository = SQLAlchemyTaskRepository(db_session)
-    
-    # Create task first
-    request = TaskCreateRequest(title="Test Task", status="todo")
-    created_task = create_task(task_repository, request, test_user.id, audit_logger)
+    async def scenario(deps):
+        # Create task first
+        request = TaskCreateRequest(title="Test Task", status="todo")
+        created_task = await create_task(deps.tasks, deps.unit_of_work, request, Principal.of(test_user))
+        
+        # Update task
+        update_request = TaskUpdateRequest(status="in_progress")
+        await update_task(deps.tasks, deps.unit_of_work, created_task.id, update_request, Principal.of(test_user))
+        return created_task
     
-    # Update task
-    update_request = TaskUpdateRequest(status="in_progress")
-    update_task(task_repository, created_task.id, update_request, test_user.id, audit_logger)
+    created_task = run_use_cases(scenario)
     
     # Verify audit event was created
     events = db_session.query(AuditEventModel).filter(
@@ -94,31 +109,28 @@ def test_task_update_creates_audit_event(db_session: Session, test_user, audit_l
     assert event.user_id == test_user.id
     assert event.resource_type == "task"
     assert event.resource_id == str(created_task.id)
-    assert "changes" in event.event_metadata
+    assert event.event_metadata["changes"]["status"] == {"old": "todo", "new": "in_progress"}
 
 
-def test_task_deletion_creates_audit_event(db_session: Session, test_user, audit_logger):
+def test_task_deletion_creates_audit_event(db_session: Session, test_user):
     """Test that task deletion creates an audit event."""
-    task_repository = SQLAlchemyTaskRepository(db_session)
-    
-    # Create task first
-    request = TaskCreateRequest(title="Test Task")
-    created_task = create_task(task_repository, request, test_user.id, audit_logger)
-    db_session.commit()  # Commit task creation
-    
-    # Delete task
-    delete_task(
-        repository=task_repository, 
-        task_id=created_task.id, 
-        authenticated_user_id=test_user.id,
-        attachment_repository=None,
-        storage=None,
-        audit_logger=audit_logger
-    )
-    db_session.commit()  # Commit deletion and audit event
+    async def scenario(deps):
+        # Create task first
+        request = TaskCreateRequest(title="Test Task")
+        created_task = await create_task(deps.tasks, deps.unit_of_work, request, Principal.of(test_user))
+        
+        # Delete task
+        await delete_task(
+            repository=deps.tasks,
+            unit_of_work=deps.unit_of_work,
+            task_id=created_task.id,
+            authenticated_user_id=test_user.id,
+            attachment_repository=None,
+            storage=None
+        )
+        return created_task
     
-    # Refresh session to see committed audit events
-    db_session.expire_all()
+    created_task = run_use_cases(scenario)
     
     # Verify audit event was created
     events = db_session.query(AuditEventModel).filter(
@@ -130,33 +142,36 @@ def test_task_deletion_creates_audit_event(db_session: Session, test_user, audit
     assert event.user_id == test_user.id
     assert event.resource_type == "task"
     assert event.resource_id == str(created_task.id)
+    assert event.event_metadata == {"task_id": created_task.id, "title": "Test Task"}
 
 
-def test_attachment_upload_creates_audit_event(db_session: Session, test_user, audit_logger):
-    """Test that attachment upload creates an audit event."""
-    task_repository = SQLAlchemyTaskRepository(db_session)
-    attachment_repository = SQLAlchemyAttachmentRepository(db_session)
-    storage = LocalFileStorage()
-    
-    # Create task first
-    request = TaskCreateRequest(title="Test Task")
-    created_task = create_task(task_repository, request, test_user.id, audit_logger)
-    
-    # Upload attachment
-    file_content = b"test file content"
-    file_bytes = BytesIO(file_content)
-    
-    upload_attachment(
-        task_repository=task_repository,
-        attachment_repository=attachment_repository,
-        storage=storage,
-        task_id=created_task.id,
-        file=file_bytes,
+async def _upload(deps, task_id: int, user_id: int):
+    """Upload a small text attachment to the task."""
+    return await upload_attachment(
+        task_repository=deps.tasks,
+        attachment_repository=deps.attachments,
+        unit_of_work=deps.unit_of_work,
+        storage=LocalFileStorage(),
+        task_id=task_id,
+        file=BytesIO(b"test file content"),
         filename="test.txt",
         content_type="text/plain",
-        authenticated_user_id=test_user.id,
-        audit_logger=audit_logger
+        authenticated_user_id=user_id,
+        audit_logger=deps.audit_logger
     )
+
+
+def test_attachment_upload_creates_audit_event(db_session: Session, test_user):
+    """Test that attachment upload creates an audit event."""
+    async def scenario(deps):
+        # Create task first
+        request = TaskCreateRequest(title="Test Task")
+        created_task = await create_task(deps.tasks, deps.unit_of_work, request, Principal.of(test_user))
+        
+        # Upload attachment
+        await _upload(deps, created_task.id, test_user.id)
+    
+    run_use_cases(scenario)
     
     # Verify audit event was created
     events = db_session.query(AuditEventModel).filter(
@@ -171,40 +186,26 @@ def test_attachment_upload_creates_audit_event(db_session: Session, test_user, a
     assert "filename" in event.event_metadata
 
 
-def test_attachment_deletion_creates_audit_event(db_session: Session, test_user, audit_logger):
+def test_attachment_deletion_creates_audit_event(db_session: Session, test_user):
     """Test that attachment deletion creates an audit event."""
-    task_repository = SQLAlchemyTaskRepository(db_session)
-    attachment_repository = SQLAlchemyAttachmentRepository(db_session)
-    storage = LocalFileStorage()
-    
-    # Create task and attachment
-    request = TaskCreateRequest(title="Test Task")
-    created_task = create_task(task_repository, request, test_user.id, audit_logger)
-    
-    file_content = b"test file content"
-    file_bytes = BytesIO(file_content)
-    
-    uploaded = upload_attachment(
-        task_repository=task_repository,
-        attachment_repository=attachment_repository,
-        storage=storage,
-        task_id=created_task.id,
-        file=file_bytes,
-        filename="test.txt",
-        content_type="text/plain",
-        authenticated_user_id=test_user.id,
-        audit_logger=audit_logger
-    )
+    async def scenario(deps):
+        # Create task and attachment
+        request = TaskCreateRequest(title="Test Task")
+        created_task = await create_task(deps.tasks, deps.unit_of_work, request, Principal.of(test_user))
+        uploaded = await _upload(deps, created_task.id, test_user.id)
+        
+        # Delete attachment
+        await delete_attachment(
+            task_repository=deps.tasks,
+            attachment_repository=deps.attachments,
+            unit_of_work=deps.unit_of_work,
+            storage=LocalFileStorage(),
+            attachment_id=uploaded.id,
+            authenticated_user_id=test_user.id,
+            audit_logger=deps.audit_logger
+        )
     
-    # Delete attachment
-    delete_attachment(
-        task_repository=task_repository,
-        attachment_repository=attachment_repository,
-        storage=storage,
-        attachment_id=uploaded.id,
-        authenticated_user_id=test_user.id,
-        audit_logger=audit_logger
-    )
+    run_use_cases(scenario)
     
     # Verify audit event was created
     events = db_session.query(AuditEventModel).filter(
@@ -244,20 +245,8 @@ def test_reminder_sent_creates_audit_event(db_session: Session, test_user):
     # Manually process reminder (simulating worker behavior)
     now = datetime.now(UTC)
     last_24h = now - timedelta(hours=24)
-    success = _process_single_reminder(db_session, task, now, last_24h)
-    
-    if success:
-        # Log audit event (same as worker does)
-        audit_logger.log(
-            action_type=AuditActionType.REMINDER_SENT,
-            user_id=None,  # System action
-            resource_type="reminder",
-            resource_id=str(task.id),
-            metadata={
-                "task_id": task.id,
-                "due_date": task.due_date.isoformat() if task.due_date else None
-            }
-        )
+    success = _process_single_reminder(db_session, task, now, last_24h, audit_logger)
+    assert success
     
     # Verify audit event was created
     events = db_session.query(AuditEventModel).filter(
@@ -271,3 +260,21 @@ def test_reminder_sent_creates_audit_event(db_session: Session, test_user):
     assert event.resource_id == str(task.id)
     assert event.event_metadata is not None
     assert "task_id" in event.event_metadata
+
+
+def test_task_and_audit_event_are_committed_together(db_session: Session, test_user):
+    """Test repositories only stage changes: a failed commit persists neither the task nor its audit event."""
+    async def scenario(deps):
+        async def failing_commit():
+            raise RuntimeError("commit failed")
+        
+        deps.unit_of_work.commit = failing_commit
+        await create_task(deps.tasks, deps.unit_of_work, TaskCreateRequest(title="Not committed"), Principal.of(test_user))
+    
+    with pytest.raises(RuntimeError):
+        run_use_cases(scenario)
+    
+    assert db_session.query(Task).filter(Task.title == "Not committed").count() == 0
+    assert db_session.query(AuditEventModel).filter(
+        AuditEventModel.action_type == AuditActionType.TASK_CREATED
+    ).count() == 0
@@ -55,3 +55,37 @@ def test_login_nonexistent_user(client: TestClient):
     data = response.json()
     assert "error" in data["detail"]
     assert data["detail"]["error"]["code"] == "INVALID_CREDENTIALS"
+
+
+def test_login_fails_fast_when_hashing_queue_is_full(client: TestClient, test_user: User, monkeypatch):
+    """Test login answers 503 with Retry-After instead of queueing behind a full hashing pool."""
+    from infrastructure.auth import password_hashing
+    full = password_hashing.PASSWORD_HASHING_WORKERS + password_hashing.PASSWORD_HASHING_MAX_QUEUE
+    monkeypatch.setattr(password_hashing, "_pending", full)
+    
+    response = client.post("/api/auth/login", json={"username": "testuser", "password": "testpassword"})
+    
+    assert response.status_code == 503
+    assert response.json()["detail"]["error"]["code"] == "SERVICE_BUSY"
+    assert response.headers["Retry-After"] == "1"
+
+
+def test_login_rehashes_password_at_configured_cost(client: TestClient, db_session, test_user: User, monkeypatch):
+    """Test a successful login re-hashes a password stored at another cost, and only then."""
+    from application.auth.login import hash_cost
+    from infrastructure.auth.config import auth_config
+    assert hash_cost(test_user.hashed_password) == 12
+    monkeypatch.setattr(auth_config, "BCRYPT_ROUNDS", 4)
+    
+    wrong = client.post("/api/auth/login", json={"username": "testuser", "password": "wrongpassword"})
+    db_session.refresh(test_user)
+    assert wrong.status_code == 401
+    assert hash_cost(test_user.hashed_password) == 12
+    
+    response = client.post("/api/auth/login", json={"username": "testuser", "password": "testpassword"})
+    db_session.refresh(test_user)
+    assert response.status_code == 200
+    assert hash_cost(test_user.hashed_password) == 4
+    
+    again = client.post("/api/auth/login", json={"username": "testuser", "password": "testpassword"})
+    assert again.status_code == 200
@@ -0,0 +1,186 @@
+"""Task write statements executed on PostgreSQL.
+
+On PostgreSQL a task write is one statement: data-modifying CTEs write the
+task's tag rows and its audit event with the task. These tests run those
+statements against a real server, on each async driver
+(POSTGRES_ASYNC_DRIVER); set TEST_POSTGRES_URL to a scratch database (its
+tables are dropped and recreated). Skipped otherwise.
+"""
+
+import asyncio
+import os
+from contextlib import contextmanager
+from typing import Iterator, List
+
+import pytest
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from domain.models import Base
+from domain.models.task import Task
+from domain.models.task_tag import TaskTag
+from domain.models.user import User
+from domain.auth.principal import Principal
+from domain.audit.audit_event import AuditActionType
+from infrastructure.database import ASYNC_DRIVERS, to_async_url
+from infrastructure.persistence.models.audit_event import AuditEvent as AuditEventModel
+from infrastructure.persistence.repositories.task_repository import (
+    AsyncSQLAlchemyTaskRepository,
+    _delete_owned_statements,
+    _update_owned_statement
+)
+from infrastructure.database.unit_of_work import AsyncSQLAlchemyUnitOfWork
+from application.tasks.create_task import create_task
+from application.tasks.update_task import update_task
+from application.tasks.delete_task import delete_task
+from application.tasks.schemas import TaskCreateRequest, TaskUpdateRequest
+
+POSTGRES_URL = os.getenv("TEST_POSTGRES_URL")
+
+pytestmark = pytest.mark.skipif(not POSTGRES_URL, reason="TEST_POSTGRES_URL is not set")
+
+
+@pytest.fixture(autouse=True, params=["asyncpg", "psycopg"])
+def async_driver(request, monkeypatch) -> str:
+    """Run each test on both supported async PostgreSQL drivers."""
+    monkeypatch.setitem(ASYNC_DRIVERS, "postgresql", request.param)
+    return request.param
+
+
+def run_on_postgres(scenario):
+    """Run scenario(session, owner, other) on fresh tables with two users (their principals)."""
+    async def run():
+        engine = create_async_engine(to_async_url(POSTGRES_URL), poolclass=NullPool)
+        try:
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.drop_all)
+                await conn.run_sync(Base.metadata.create_all)
+            async with async_sessionmaker(engine, autoflush=False, expire_on_commit=False)() as db:
+                owner = User(username="owner", email="owner@example.com", hashed_password="x")
+                other = User(username="other", email="other@example.com", hashed_password="x")
+                db.add_all([owner, other])
+                await db.commit()
+                return await scenario(db, Principal.of(owner), Principal.of(other))
+        finally:
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.drop_all)
+            await engine.dispose()
+    return asyncio.run(run())
+
+
+@contextmanager
+def recorded_statements(db) -> Iterator[List[str]]:
+    """Record the first keyword of each SQL statement the session's engine executes."""
+    engine = db.bind.sync_engine
+    statements: List[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement.split(None, 1)[0].upper())
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
+async def _tags(db, task_id: int) -> List[str]:
+    result = await db.execute(select(TaskTag.tag).where(TaskTag.task_id == task_id).order_by(TaskTag.tag))
+    return list(result.scalars())
+
+
+async def _audit_events(db) -> list:
+    result = await db.execute(select(AuditEventModel).order_by(AuditEventModel.id))
+    return list(result.scalars())
+
+
+def test_task_writes_and_audit_events_are_one_statement():
+    """Test create, update and delete each write the task, its tag rows and its audit event in one statement."""
+    async def scenario(db, owner, other):
+        repository, unit_of_work = AsyncSQLAlchemyTaskRepository(db), AsyncSQLAlchemyUnitOfWork(db)
+        request = TaskCreateRequest(title="Ship", status="todo", priority="low", tags=["API", "backend"])
+
+        with recorded_statements(db) as statements:
+            created = await create_task(repository, unit_of_work, request, owner)
+        assert statements == ["WITH"]
+        assert created.owner_username == "owner"
+        assert await _tags(db, created.id) == ["api", "backend"]
+
+        with recorded_statements(db) as statements:
+            updated = await update_task(
+                repository, unit_of_work, created.id,
+                TaskUpdateRequest(title="Shipped", status="done", priority="low"), owner
+            )
+        assert statements == ["WITH"]
+        assert (updated.title, updated.status) == ("Shipped", "done")
+
+        with pytest.raises(PermissionError):
+            await delete_task(repository, unit_of_work, created.id, other.id)
+        with recorded_statements(db) as statements:
+            assert await delete_task(repository, unit_of_work, created.id, owner.id)
+        assert statements == ["WITH"]
+        assert (await db.execute(select(Task.id).where(Task.id == created.id))).first() is None
+        assert await _tags(db, created.id) == []
+
+        events = await _audit_events(db)
+        assert [(e.action_type, e.user_id, e.resource_id) for e in events] == [
+            (AuditActionType.TASK_CREATED, owner.id, str(created.id)),
+            (AuditActionType.TASK_UPDATED, owner.id, str(created.id)),
+            (AuditActionType.TASK_DELETED, owner.id, str(created.id))
+        ]
+        assert [e.event_metadata for e in events] == [
+            {"title": "Ship", "status": "todo", "priority": "low"},
+            {"task_id": created.id, "changes": {"title": {"new": "Shipped"}, "status": {"old": "todo", "new": "done"}}},
+            {"task_id": created.id, "title": "Shipped"}
+        ]
+
+    run_on_postgres(scenario)
+
+
+def test_update_statement_returns_previous_values_and_clears_tags():
+    """Test the self-joined UPDATE returns the pre-update values and deletes the tag rows, for the owner only."""
+    async def scenario(db, owner, other):
+        task = Task(title="Tagged", status="todo", tags='["a", "b"]', owner_user_id=owner.id)
+        task.tag_entries = [TaskTag(tag="a"), TaskTag(tag="b")]
+        db.add(task)
+        await db.commit()
+
+        not_owned = _update_owned_statement(
+            task.id, other.id, {"status": "done", "tags": None}, ("status",), True, clear_tags=True
+        )
+        assert (await db.execute(not_owned)).first() is None
+        assert await _tags(db, task.id) == ["a", "b"]
+
+        owned = _update_owned_statement(
+            task.id, owner.id, {"status": "done", "tags": None}, ("status",), True, clear_tags=True
+        )
+        updated, old_status = (await db.execute(owned)).one()
+        await db.commit()
+
+        assert (updated.status, old_status) == ("done", "todo")
+        assert await _tags(db, task.id) == []
+
+    run_on_postgres(scenario)
+
+
+def test_batched_delete_removes_tags_and_task_for_the_owner_only():
+    """Test the one-statement delete (deleted_tags CTE) deletes nothing for another user."""
+    async def scenario(db, owner, other):
+        task = Task(title="Doomed", tags='["a"]', owner_user_id=owner.id)
+        task.tag_entries = [TaskTag(tag="a")]
+        db.add(task)
+        await db.commit()
+
+        [not_owned] = _delete_owned_statements(task.id, other.id, batched=True)
+        assert (await db.execute(not_owned)).scalar_one_or_none() is None
+        assert await _tags(db, task.id) == ["a"]
+
+        [owned] = _delete_owned_statements(task.id, owner.id, batched=True)
+        assert (await db.execute(owned)).scalar_one().title == "Doomed"
+        await db.commit()
+
+        assert await _tags(db, task.id) == []
+        assert (await db.execute(select(Task.id).where(Task.id == task.id))).first() is None
+
+    run_on_postgres(scenario)
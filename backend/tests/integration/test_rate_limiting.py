@@ -7,20 +7,28 @@ from sqlalchemy.orm import Session
 import bcrypt
 
 from api.main import app
-from infrastructure.database import get_db
+from infrastructure.database import get_db, get_async_db, to_async_url
 from domain.models import Base
 from domain.models.user import User
 from infrastructure.rate_limiting.rate_limiter import check_rate_limit
 from infrastructure.rate_limiting.redis_client import get_redis_client, close_redis_client
 
 
-# Use in-memory SQLite for tests
-TEST_DATABASE_URL = "sqlite:///:memory:"
+# Use a temporary SQLite file for tests (shared by the sync and async engines)
+import tempfile
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+
+_test_db_file = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
+_test_db_file.close()
+TEST_DATABASE_URL = f"sqlite:///{_test_db_file.name}"
 
 test_engine = create_engine(TEST_DATABASE_URL, connect_args={"check_same_thread": False})
 TestSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=test_engine)
+test_async_engine = create_async_engine(to_async_url(TEST_DATABASE_URL), poolclass=NullPool)
+TestAsyncSessionLocal = async_sessionmaker(test_async_engine, autoflush=False, expire_on_commit=False)
 
 
 @pytest.fixture(scope="function")
@@ -44,7 +52,12 @@ def client(db_session: Session):
         finally:
             pass
     
+    async def override_get_async_db():
+        async with TestAsyncSessionLocal() as db:
+            yield db
+    
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
     yield TestClient(app)
     app.dependency_overrides.clear()
 
@@ -204,6 +217,22 @@ def test_rate_limiting_middleware_authenticated_user(client, test_user, monkeypa
         assert response.status_code in [200, 404]
 
 
+def test_token_verified_once_per_request(client, test_user, monkeypatch):
+    """Test the rate limiter and get_current_user share one token verification."""
+    import api.middleware.auth as auth_middleware
+    monkeypatch.setenv("RATE_LIMIT_ENABLED", "true")
+    login_response = client.post("/api/auth/login", json={"username": "testuser_rate", "password": "testpassword"})
+    headers = {"Authorization": f"Bearer {login_response.json()['token']}"}
+    
+    verified = []
+    verify = auth_middleware.verify_access_token
+    monkeypatch.setattr(auth_middleware, "verify_access_token", lambda token: verified.append(token) or verify(token))
+    
+    response = client.get("/api/tasks/", headers=headers)
+    assert response.status_code == 200
+    assert len(verified) == 1
+
+
 def test_rate_limiting_middleware_unauthenticated(client, monkeypatch):
     """Test rate limiting for unauthenticated requests (IP-based)."""
     import os
@@ -0,0 +1,85 @@
+"""Integration tests for read-replica routing and the read-your-writes window."""
+
+import os
+import tempfile
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import NullPool
+
+import infrastructure.database as database
+from domain.models import Base
+from domain.models.user import User
+from domain.models.task import Task
+from infrastructure.database import to_async_url
+from infrastructure.database import read_your_writes
+
+
+@pytest.fixture
+def replica(monkeypatch, cache_redis):
+    """Configure one read replica: a separate database the tests fill directly."""
+    replica_file = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
+    replica_file.close()
+    url = f"sqlite:///{replica_file.name}"
+    sync_engine = create_engine(url, connect_args={"check_same_thread": False})
+    async_engine = create_async_engine(to_async_url(url), poolclass=NullPool)
+    Base.metadata.create_all(bind=sync_engine)
+
+    monkeypatch.setattr(database, "replica_engines", [sync_engine])
+    monkeypatch.setattr(database, "async_replica_engines", [async_engine])
+    monkeypatch.setattr(read_your_writes, "_sticky_until", {})
+
+    db = Session(bind=sync_engine)
+    yield db
+    db.close()
+    sync_engine.dispose()
+    os.unlink(replica_file.name)
+
+
+def _login(client: TestClient, username: str, password: str) -> dict:
+    response = client.post("/api/auth/login", json={"username": username, "password": password})
+    return {"Authorization": f"Bearer {response.json()['token']}"}
+
+
+def test_reads_are_served_by_replica(client: TestClient, db_session: Session, replica: Session, user1: User):
+    """Test list and get endpoints read from the replica, not the primary."""
+    db_session.add(Task(title="On primary", owner_user_id=user1.id))
+    db_session.commit()
+    replica.add(User(id=user1.id, username="user1", email="user1@example.com", hashed_password="x"))
+    replica_task = Task(title="On replica", owner_user_id=user1.id)
+    replica.add(replica_task)
+    replica.commit()
+    headers = _login(client, "user1", "password1")
+
+    listed = client.get("/api/tasks/", headers=headers)
+    fetched = client.get(f"/api/tasks/{replica_task.id}", headers=headers)
+
+    assert [task["title"] for task in listed.json()["tasks"]] == ["On replica"]
+    assert fetched.json()["title"] == "On replica"
+
+
+def test_writer_reads_own_writes_from_primary(client: TestClient, replica: Session, user1: User, user2: User):
+    """Test a user who just wrote reads from the primary while others still read the replica."""
+    writer = _login(client, "user1", "password1")
+    other = _login(client, "user2", "password2")
+
+    created = client.post("/api/tasks/", json={"title": "Fresh"}, headers=writer).json()
+
+    assert client.get(f"/api/tasks/{created['id']}", headers=writer).status_code == 200
+    assert [task["title"] for task in client.get("/api/tasks/", headers=writer).json()["tasks"]] == ["Fresh"]
+    # Not replicated yet: other users don't see it
+    assert client.get(f"/api/tasks/{created['id']}", headers=other).status_code == 404
+
+
+def test_window_expires(client: TestClient, replica: Session, user1: User, cache_redis, monkeypatch):
+    """Test reads return to the replica once the read-your-writes window has passed."""
+    headers = _login(client, "user1", "password1")
+    created = client.post("/api/tasks/", json={"title": "Fresh"}, headers=headers).json()
+
+    read_your_writes._sticky_until.clear()
+    cache_redis.delete(f"{read_your_writes.KEY_PREFIX}{user1.id}")
+
+    assert client.get(f"/api/tasks/{created['id']}", headers=headers).status_code == 404
@@ -0,0 +1,92 @@
+"""Integration tests for the SQLite production profile (WAL pragmas, single writer)."""
+
+import os
+import tempfile
+import threading
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from domain.models import Base
+from domain.models.user import User
+from infrastructure.database.pool import pool_options
+from infrastructure.database.sqlite import (
+    apply_sqlite_pragmas,
+    routing_session_class,
+    writer_engine_options
+)
+
+
+@pytest.fixture
+def sqlite_profile():
+    """Reader and writer engines on a temp file with the profile applied; yields a sessionmaker."""
+    db_file = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
+    db_file.close()
+    url = f"sqlite:///{db_file.name}"
+    connect_args = {"check_same_thread": False}
+    reader = create_engine(url, connect_args=connect_args, **pool_options(url, "test_sqlite_reader"))
+    writer = create_engine(url, connect_args=connect_args, **writer_engine_options("test_sqlite_writer"))
+    apply_sqlite_pragmas(reader)
+    apply_sqlite_pragmas(writer)
+    Base.metadata.create_all(bind=writer)
+
+    yield sessionmaker(autoflush=False, class_=routing_session_class(reader, writer)), reader, writer
+
+    reader.dispose()
+    writer.dispose()
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(db_file.name + suffix):
+            os.unlink(db_file.name + suffix)
+
+
+def test_connections_use_wal(sqlite_profile):
+    """Test every connection is opened with the profile's pragmas."""
+    _, reader, _ = sqlite_profile
+    with reader.connect() as connection:
+        assert connection.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert connection.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+        assert connection.execute(text("PRAGMA busy_timeout")).scalar() == 5000
+
+
+def test_session_reads_own_writes_on_writer(sqlite_profile):
+    """Test a session stays on the writer after flushing, then returns to readers after commit."""
+    make_session, _, writer = sqlite_profile
+    with make_session() as session:
+        assert session.get_bind() is not writer
+
+        session.add(User(username="alice", email="alice@example.com", hashed_password="x"))
+        session.flush()
+
+        assert session.get_bind() is writer
+        assert writer.pool.checkedout() == 1
+        assert session.query(User).filter(User.username == "alice").count() == 1
+
+        session.commit()
+
+        assert session.get_bind() is not writer
+        assert writer.pool.checkedout() == 0
+
+
+def test_concurrent_writes_are_serialized(sqlite_profile):
+    """Test concurrent writers queue for the writer connection instead of failing."""
+    make_session, _, _ = sqlite_profile
+    errors = []
+
+    def write(index: int) -> None:
+        try:
+            with make_session() as session:
+                session.add(User(username=f"user{index}", email=f"user{index}@example.com", hashed_password="x"))
+                session.commit()
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=write, args=(i,)) for i in range(20)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    with make_session() as session:
+        assert session.query(User).count() == 20
@@ -0,0 +1,78 @@
+"""Query plan tests: every supported task search shape is index-backed."""
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from application.tasks.search_tasks import run_search, ALLOWED_SORT_FIELDS
+from infrastructure.cache import search_cache
+
+FILTERS = [
+    {},
+    {"status": "todo"},
+    {"priority": "high"},
+    {"priority": "urgent"},
+    {"owner_user_id": 1},
+]
+
+SORTS = [None] + [f"{field}:{direction}" for field in ALLOWED_SORT_FIELDS for direction in ["asc", "desc"]]
+
+
+def _page_query_plan(db_session: Session, monkeypatch, **params) -> list:
+    """Run the search query (no result cache) and return the EXPLAIN QUERY PLAN lines of its page query."""
+    monkeypatch.setattr(search_cache, "SEARCH_CACHE_ENABLED", False)
+    engine = db_session.get_bind()
+    if engine.dialect.name != "sqlite":
+        pytest.skip("Query plan assertions are written for SQLite")
+
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        run_search(db_session, **params)
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    # The page query is the one joining the owner (the other one is the COUNT)
+    statement, parameters = next(s for s in statements if "LEFT OUTER JOIN users" in s[0])
+    rows = db_session.connection().exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+    return [row[3] for row in rows]
+
+
+def _full_scans(plan: list) -> list:
+    """Plan lines that scan the tasks table without an index."""
+    return [line for line in plan if line.startswith("SCAN tasks") and "INDEX" not in line]
+
+
+@pytest.mark.parametrize("filters", FILTERS)
+@pytest.mark.parametrize("sort", SORTS)
+def test_search_shapes_never_full_scan_tasks(db_session: Session, monkeypatch, filters: dict, sort: str):
+    """Test every filter/sort combination reads tasks through an index."""
+    plan = _page_query_plan(db_session, monkeypatch, sort=sort, **filters)
+
+    assert _full_scans(plan) == [], plan
+
+
+@pytest.mark.parametrize("params, index", [
+    ({}, "idx_task_created_at_id"),
+    ({"sort": "updated_at:desc"}, "idx_task_updated_at_id"),
+    ({"sort": "due_date:asc"}, "ix_tasks_due_date"),
+    ({"sort": "title:asc"}, "ix_tasks_title"),
+    ({"owner_user_id": 1}, "idx_task_owner_created_at"),
+    ({"owner_user_id": 1, "sort": "due_date:asc"}, "idx_task_owner_due_date"),
+    ({"sort": "priority:desc"}, "idx_task_priority_rank_id"),
+    ({"status": "todo"}, "idx_task_status_rank_created_at"),
+    ({"status": "todo", "sort": "due_date:desc"}, "idx_task_status_rank_due_date"),
+    ({"status": "blocked"}, "idx_task_status_rank_created_at"),  # Unknown value: rank 0 + string check
+    ({"priority": "high"}, "idx_task_priority_rank_created_at"),
+    ({"priority": "high", "sort": "due_date:asc"}, "idx_task_priority_rank_due_date"),
+])
+def test_search_shapes_read_pages_in_index_order(db_session: Session, monkeypatch, params: dict, index: str):
+    """Test composite indexes serve filter + sort without sorting the result set."""
+    plan = _page_query_plan(db_session, monkeypatch, **params)
+
+    assert any(f"INDEX {index}" in line for line in plan), plan
+    assert not any("TEMP B-TREE FOR ORDER BY" in line for line in plan), plan
@@ -106,3 +106,29 @@ def test_create_task_unauthenticated(client: TestClient):
     )
     
     assert response.status_code in [401, 403]  # Unauthorized or Forbidden (no token provided)
+
+
+def test_create_task_commits_once(client: TestClient, test_user: User):
+    """Test the task and its audit event are written in a single transaction."""
+    from sqlalchemy import event
+    from tests.conftest import test_async_engine
+    
+    login_response = client.post(
+        "/api/auth/login",
+        json={"username": "testuser", "password": "testpassword"}
+    )
+    headers = {"Authorization": f"Bearer {login_response.json()['token']}"}
+    
+    commits = []
+    
+    def count_commit(connection):
+        commits.append(connection)
+    
+    event.listen(test_async_engine.sync_engine, "commit", count_commit)
+    try:
+        response = client.post("/api/tasks/", json={"title": "One commit", "tags": ["a"]}, headers=headers)
+    finally:
+        event.remove(test_async_engine.sync_engine, "commit", count_commit)
+    
+    assert response.status_code == 201
+    assert len(commits) == 1
@@ -1,11 +1,21 @@
 """Integration tests for read task endpoints."""
 
+import asyncio
+import json
+from datetime import datetime
+
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
 from domain.models.user import User
 from domain.models.task import Task
+from api import responses
+from application.tasks.get_task import get_task_json_many
+from infrastructure.cache import task_response_cache
+from infrastructure.cache.task_response_cache import clear_task_response_cache
+from infrastructure.persistence.repositories.task_repository import AsyncSQLAlchemyTaskRepository
+from tests.conftest import TestAsyncSessionLocal
 
 
 @pytest.fixture
@@ -116,3 +126,106 @@ def test_list_tasks_unauthenticated(client: TestClient):
     response = client.get("/api/tasks/")
     
     assert response.status_code in [401, 403]  # Unauthorized or Forbidden (no token provided)
+
+
+def test_fast_json_responses_match_validated_responses(
+    client: TestClient, db_session: Session, user1: User, task_user1: Task, monkeypatch
+):
+    """Test pre-encoded GET responses match the validated response_model output."""
+    task_user1.tags = '["backend", "api"]'
+    task_user1.due_date = datetime(2030, 1, 15, 9, 30, 0, 123456)
+    db_session.commit()
+    
+    login_response = client.post(
+        "/api/auth/login",
+        json={
+            "username": "user1",
+            "password": "password1"
+        }
+    )
+    headers = {"Authorization": f"Bearer {login_response.json()['token']}"}
+    urls = [f"/api/tasks/{task_user1.id}", "/api/tasks/?page_size=5"]
+    
+    monkeypatch.setattr(responses, "FAST_JSON_RESPONSES", True)
+    fast = [client.get(url, headers=headers) for url in urls]
+    monkeypatch.setattr(responses, "FAST_JSON_RESPONSES", False)
+    validated = [client.get(url, headers=headers) for url in urls]
+    
+    for fast_response, validated_response in zip(fast, validated):
+        assert fast_response.status_code == 200
+        assert fast_response.headers["content-type"] == "application/json"
+        assert fast_response.json() == validated_response.json()
+    assert fast[0].json()["tags"] == ["backend", "api"]
+
+
+def test_get_task_served_from_response_cache_by_version(
+    client: TestClient, db_session: Session, user1: User, task_user1: Task
+):
+    """Test GET /api/tasks/{id} reuses the encoded body until the task's updated_at changes."""
+    login_response = client.post(
+        "/api/auth/login",
+        json={
+            "username": "user1",
+            "password": "password1"
+        }
+    )
+    headers = {"Authorization": f"Bearer {login_response.json()['token']}"}
+    url = f"/api/tasks/{task_user1.id}"
+    
+    assert client.get(url, headers=headers).json()["title"] == "User1's Task"
+    
+    # Same updated_at: the cached body is served
+    tasks_table = Task.__table__
+    db_session.execute(
+        tasks_table.update()
+        .where(tasks_table.c.id == task_user1.id)
+        .values(title="Changed without touching updated_at", updated_at=tasks_table.c.updated_at)
+    )
+    db_session.commit()
+    assert client.get(url, headers=headers).json()["title"] == "User1's Task"
+    
+    # Any writer that moves updated_at gets a fresh body
+    db_session.execute(
+        tasks_table.update().where(tasks_table.c.id == task_user1.id).values(updated_at=datetime(2031, 1, 1))
+    )
+    db_session.commit()
+    assert client.get(url, headers=headers).json()["title"] == "Changed without touching updated_at"
+    
+    # Update and delete through the API invalidate the entry
+    client.put(url, json={"title": "Updated"}, headers=headers)
+    assert client.get(url, headers=headers).json()["title"] == "Updated"
+    client.delete(url, headers=headers)
+    assert client.get(url, headers=headers).status_code == 404
+
+
+def test_get_task_json_many_reads_misses_in_one_query(db_session: Session, user1: User, cache_redis):
+    """Test multi-get serves cached bodies (memory, then Redis) and loads only the misses."""
+    tasks = [Task(title=f"Task {i}", owner_user_id=user1.id) for i in range(3)]
+    db_session.add_all(tasks)
+    db_session.commit()
+    
+    async def scenario():
+        async with TestAsyncSessionLocal() as db:
+            repository = AsyncSQLAlchemyTaskRepository(db)
+            versions = await repository.get_updated_at_many([task.id for task in tasks])
+            
+            loaded = []
+            get_by_ids = repository.get_by_ids
+            
+            async def recording_get_by_ids(ids):
+                loaded.append(sorted(ids))
+                return await get_by_ids(ids)
+            
+            repository.get_by_ids = recording_get_by_ids
+            
+            await get_task_json_many(repository, {tasks[0].id: versions[tasks[0].id]})
+            clear_task_response_cache()  # Only the Redis tier remains
+            return loaded, await get_task_json_many(repository, versions)
+    
+    loaded, bodies = asyncio.run(scenario())
+    
+    assert loaded == [[tasks[0].id], sorted([tasks[1].id, tasks[2].id])]
+    assert {task_id: json.loads(body)["title"] for task_id, body in bodies.items()} == {
+        task.id: task.title for task in tasks
+    }
+    assert f"{task_response_cache.KEY_PREFIX}{tasks[2].id}" in cache_redis.values
@@ -0,0 +1,455 @@
+"""Integration tests for task search/filter endpoint."""
+
+import asyncio
+import threading
+
+import pytest
+import redis
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from domain.models.user import User
+from domain.models.task import Task
+from domain.models.task_tag import TaskTag
+from application.tasks.search_tasks import run_search
+from infrastructure.search.trigram import build_tag_match
+from infrastructure.cache import search_cache, redis_cache
+from infrastructure.cache.principal_cache import clear_principal_cache
+from infrastructure.metrics.registry import (
+    TASK_SEARCH_CACHE_HITS_TOTAL,
+    TASK_SEARCH_CACHE_MISSES_TOTAL,
+    TASK_SEARCH_CACHE_BYPASS_TOTAL
+)
+
+
+@pytest.fixture
+def token(client: TestClient, user1: User) -> str:
+    """Login as user1 and return the access token."""
+    login_response = client.post(
+        "/api/auth/login",
+        json={
+            "username": "user1",
+            "password": "password1"
+        }
+    )
+    return login_response.json()["token"]
+
+
+def _create_task(client: TestClient, token: str, **fields) -> dict:
+    """Create a task through the API and return the response body."""
+    response = client.post(
+        "/api/tasks/",
+        json=fields,
+        headers={"Authorization": f"Bearer {token}"}
+    )
+    assert response.status_code == 201
+    return response.json()
+
+
+def test_filter_by_tags_partial_case_insensitive(client: TestClient, token: str):
+    """Test tag filter matches partial, case-insensitive tags in SQL."""
+    backend = _create_task(client, token, title="Backend task", tags=["Backend", "API"])
+    frontend = _create_task(client, token, title="Frontend task", tags=["frontend"])
+    _create_task(client, token, title="Untagged task")
+
+    response = client.get(
+        "/api/tasks/?tags=backe",
+        headers={"Authorization": f"Bearer {token}"}
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [task["id"] for task in data["tasks"]] == [backend["id"]]
+    assert data["tasks"][0]["tags"] == ["Backend", "API"]
+    assert data["pagination"]["total"] == 1
+
+    # Any of the given tags matches
+    response = client.get(
+        "/api/tasks/?tags=api,FRONT&sort=title:asc",
+        headers={"Authorization": f"Bearer {token}"}
+    )
+
+    data = response.json()
+    assert [task["id"] for task in data["tasks"]] == [backend["id"], frontend["id"]]
+
+
+def test_filter_by_tags_paginates_in_sql(client: TestClient, token: str):
+    """Test tag filter total and pages are consistent."""
+    for i in range(5):
+        _create_task(client, token, title=f"Tagged {i}", tags=["urgent"])
+    _create_task(client, token, title="Other", tags=["later"])
+
+    response = client.get(
+        "/api/tasks/?tags=urgent&page=2&page_size=2&sort=title:asc",
+        headers={"Authorization": f"Bearer {token}"}
+    )
+
+    data = response.json()
+    assert [task["title"] for task in data["tasks"]] == ["Tagged 2", "Tagged 3"]
+    assert data["pagination"]["total"] == 5
+    assert data["pagination"]["total_pages"] == 3
+
+
+def test_update_task_tags_resyncs_tag_rows(client: TestClient, db_session: Session, token: str):
+    """Test task_tags rows follow tag updates."""
+    task = _create_task(client, token, title="Retag me", tags=["old", "Keep"])
+
+    response = client.put(
+        f"/api/tasks/{task['id']}",
+        json={"tags": ["keep", "new"]},
+        headers={"Authorization": f"Bearer {token}"}
+    )
+    assert response.status_code == 200
+
+    rows = db_session.query(TaskTag.tag).filter(TaskTag.task_id == task["id"]).all()
+    assert sorted(tag for (tag,) in rows) == ["keep", "new"]
+
+    response = client.get(
+        "/api/tasks/?tags=old",
+        headers={"Authorization": f"Bearer {token}"}
+    )
+    assert response.json()["pagination"]["total"] == 0
+
+
+
+def test_tag_filter_uses_tag_trigram_index(client: TestClient, db_session: Session, token: str):
+    """Test partial tag terms go through the tag trigram index, match within one tag and follow writes."""
+    task = _create_task(client, token, title="Tagged", tags=["backend", "api-v2"])
+    other = _create_task(client, token, title="Other", tags=["docs"])
+    headers = {"Authorization": f"Bearer {token}"}
+
+    assert "task_tag_trigram" in str(build_tag_match(db_session, ["cken"]))
+    assert "task_tag_trigram" not in str(build_tag_match(db_session, ["ap"]))  # Too short: LIKE
+
+    def tagged(terms: str):
+        return [t["id"] for t in client.get(f"/api/tasks/?tags={terms}&sort=title:asc", headers=headers).json()["tasks"]]
+
+    assert tagged("cken") == [task["id"]]
+    assert tagged("i-v,ocs") == [other["id"], task["id"]]
+    assert tagged("endapi") == []  # No match across two tags
+    assert tagged("ap") == [task["id"]]
+
+    client.put(f"/api/tasks/{task['id']}", json={"tags": ["frontend"]}, headers=headers)
+    assert tagged("cken") == []
+    assert tagged("onten") == [task["id"]]
+
+    client.delete(f"/api/tasks/{task['id']}", headers=headers)
+    assert tagged("onten") == []
+
+def test_search_full_text_matches_words_and_prefixes(client: TestClient, token: str):
+    """Test q uses the full-text index (word and prefix matching, stemming)."""
+    deploy = _create_task(client, token, title="Deploy release", description="Ship to staging")
+    docs = _create_task(client, token, title="Write docs", description="Explain how releases are deployed")
+    _create_task(client, token, title="Unrelated", description="Nothing here")
+
+    response = client.get(
+        "/api/tasks/?q=depl&sort=title:asc",
+        headers={"Authorization": f"Bearer {token}"}
+    )
+
+    data = response.json()
+    assert [task["id"] for task in data["tasks"]] == [deploy["id"], docs["id"]]
+    assert data["pagination"]["total"] == 2
+
+    # All words must match
+    response = client.get(
+        "/api/tasks/?q=deploy staging",
+        headers={"Authorization": f"Bearer {token}"}
+    )
+    assert [task["id"] for task in response.json()["tasks"]] == [deploy["id"]]
+
+
+def test_search_sort_relevance(client: TestClient, token: str):
+    """Test sort=relevance ranks title matches above description matches."""
+    in_description = _create_task(client, token, title="Weekly sync", description="Discuss the invoice backlog")
+    in_title = _create_task(client, token, title="Invoice export", description="CSV export")
+
+    response = client.get(
+        "/api/tasks/?q=invoice&sort=relevance",
+        headers={"Authorization": f"Bearer {token}"}
+    )
+
+    assert response.status_code == 200
+    assert [task["id"] for task in response.json()["tasks"]] == [in_title["id"], in_description["id"]]
+
+
+def test_search_index_follows_update_and_delete(client: TestClient, token: str):
+    """Test the full-text index is kept in sync on update and delete."""
+    task = _create_task(client, token, title="Alpha task")
+    headers = {"Authorization": f"Bearer {token}"}
+
+    client.put(f"/api/tasks/{task['id']}", json={"title": "Beta task"}, headers=headers)
+    assert client.get("/api/tasks/?q=alpha", headers=headers).json()["pagination"]["total"] == 0
+    assert client.get("/api/tasks/?q=beta", headers=headers).json()["pagination"]["total"] == 1
+
+    client.delete(f"/api/tasks/{task['id']}", headers=headers)
+    assert client.get("/api/tasks/?q=beta", headers=headers).json()["pagination"]["total"] == 0
+
+
+def test_search_substring_mode_matches_mid_word(client: TestClient, token: str):
+    """Test search_mode=substring keeps partial/mid-word matching via the trigram index."""
+    task = _create_task(client, token, title="Refactor authentication", description="Split the Middleware")
+    _create_task(client, token, title="Write docs")
+    headers = {"Authorization": f"Bearer {token}"}
+
+    # Mid-word matches are not found by full-text search...
+    response = client.get("/api/tasks/?q=thentic", headers=headers)
+    assert response.json()["pagination"]["total"] == 0
+
+    # ...but are with substring mode, in title and description (case-insensitive)
+    for term in ["thentic", "DLEWA", "or auth"]:
+        response = client.get(f"/api/tasks/?q={term}&search_mode=substring", headers=headers)
+        assert [t["id"] for t in response.json()["tasks"]] == [task["id"]], term
+
+    # Short terms fall back to a plain substring scan
+    response = client.get("/api/tasks/?q=ct&search_mode=substring", headers=headers)
+    assert [t["id"] for t in response.json()["tasks"]] == [task["id"]]
+
+    # Substring index follows updates
+    client.put(f"/api/tasks/{task['id']}", json={"title": "Rename module"}, headers=headers)
+    response = client.get("/api/tasks/?q=thentic&search_mode=substring", headers=headers)
+    assert response.json()["pagination"]["total"] == 0
+
+
+def test_sort_priority_uses_semantic_rank(client: TestClient, db_session: Session, token: str):
+    """Test sort=priority orders low < medium < high (not lexically) and filters use the rank columns."""
+    for priority in ["medium", "high", None, "low", "urgent"]:
+        _create_task(client, token, title=f"Priority {priority}", priority=priority)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    response = client.get("/api/tasks/?sort=priority:desc", headers=headers)
+    assert [t["priority"] for t in response.json()["tasks"]] == ["high", "medium", "low", "urgent", None]
+
+    # Ranks follow updates; unknown values still filter exactly
+    task = response.json()["tasks"][0]
+    client.put(f"/api/tasks/{task['id']}", json={"priority": "low"}, headers=headers)
+    response = client.get("/api/tasks/?priority=low", headers=headers)
+    assert sorted(t["title"] for t in response.json()["tasks"]) == ["Priority high", "Priority low"]
+    response = client.get("/api/tasks/?priority=urgent", headers=headers)
+    assert [t["title"] for t in response.json()["tasks"]] == ["Priority urgent"]
+    assert db_session.query(Task.priority_rank).filter(Task.id == task["id"]).scalar() == 1
+
+
+@pytest.mark.parametrize("sort", [
+    "created_at:desc",
+    "due_date:asc",
+    "due_date:desc",
+    "priority:desc",
+    "title:asc",
+    "updated_at:asc",
+])
+def test_cursor_pagination_walks_all_rows(client: TestClient, token: str, sort: str):
+    """Test cursor pages match offset order without gaps, including NULL and tied sort values."""
+    for i in range(7):
+        _create_task(
+            client, token,
+            title=f"Task {i % 3}",  # Ties on title
+            priority=["low", "high", None][i % 3],  # Ties and NULLs
+            due_date=None if i % 2 else f"2030-01-0{i + 1}T00:00:00"
+        )
+    headers = {"Authorization": f"Bearer {token}"}
+
+    expected = [t["id"] for t in client.get(f"/api/tasks/?sort={sort}&page_size=100", headers=headers).json()["tasks"]]
+
+    seen = []
+    url = f"/api/tasks/?sort={sort}&page_size=3"
+    response = client.get(url, headers=headers).json()
+    seen.extend(t["id"] for t in response["tasks"])
+    while response["pagination"]["next_cursor"]:
+        response = client.get(f"{url}&cursor={response['pagination']['next_cursor']}", headers=headers).json()
+        seen.extend(t["id"] for t in response["tasks"])
+
+    assert seen == expected
+    assert len(seen) == 7
+
+
+def test_cursor_pagination_rejects_invalid_cursor(client: TestClient, token: str):
+    """Test malformed or mismatched cursors return 400."""
+    for i in range(3):
+        _create_task(client, token, title=f"Task {i}")
+    headers = {"Authorization": f"Bearer {token}"}
+
+    response = client.get("/api/tasks/?page_size=1&sort=title:asc", headers=headers)
+    next_cursor = response.json()["pagination"]["next_cursor"]
+    assert next_cursor
+
+    response = client.get(f"/api/tasks/?cursor={next_cursor}&sort=title:desc", headers=headers)
+    assert response.status_code == 400
+
+    response = client.get("/api/tasks/?cursor=not-a-cursor", headers=headers)
+    assert response.status_code == 400
+    assert response.json()["detail"]["error"]["code"] == "VALIDATION_ERROR"
+
+
+def test_include_total_false_skips_count(client: TestClient, token: str):
+    """Test include_total=false returns null totals and has_next instead."""
+    for i in range(3):
+        _create_task(client, token, title=f"Task {i}")
+    headers = {"Authorization": f"Bearer {token}"}
+
+    pagination = client.get("/api/tasks/?include_total=false&page_size=2", headers=headers).json()["pagination"]
+    assert pagination["total"] is None
+    assert pagination["total_pages"] is None
+    assert pagination["has_next"] is True
+
+    pagination = client.get("/api/tasks/?include_total=false&page=2&page_size=2", headers=headers).json()["pagination"]
+    assert pagination["has_next"] is False
+
+
+def test_approximate_total_is_cached_and_invalidated_by_writes(client: TestClient, db_session: Session, token: str):
+    """Test total_mode=approximate reuses the cached count until a task write."""
+    _create_task(client, token, title="Cached count", status="todo")
+    headers = {"Authorization": f"Bearer {token}"}
+    url = "/api/tasks/?status=todo&total_mode=approximate"
+
+    assert client.get(url, headers=headers).json()["pagination"]["total"] == 1
+
+    # A write outside the task use cases is not seen until the cache expires...
+    db_session.execute(Task.__table__.update().values(status="done", status_rank=3))
+    db_session.commit()
+    assert client.get(url, headers=headers).json()["pagination"]["total"] == 1
+
+    # ...while writes through the API invalidate it immediately
+    _create_task(client, token, title="Another", status="todo")
+    _create_task(client, token, title="And another", status="todo")
+    assert client.get(url, headers=headers).json()["pagination"]["total"] == 2
+
+
+def test_search_tasks_uses_column_projection(db_session: Session, user1: User):
+    """Test the search query maps plain rows to responses without hydrating ORM objects."""
+    db_session.add(Task(title="Projected", tags='["a"]', owner_user_id=user1.id))
+    db_session.commit()
+    db_session.expunge_all()
+
+    result = run_search(db_session)
+
+    task = result["tasks"][0]
+    assert task.title == "Projected"
+    assert task.tags == ["a"]
+    assert task.owner_username == "user1"
+    assert len(db_session.identity_map) == 0
+
+
+def test_search_result_cache_hits_until_task_write(client: TestClient, db_session: Session, token: str, cache_redis, monkeypatch):
+    """Test repeated searches are served from the cache and task writes invalidate them."""
+    monkeypatch.setattr(search_cache, "SEARCH_CACHE_ENABLED", True)
+    _create_task(client, token, title="Cached page")
+    headers = {"Authorization": f"Bearer {token}"}
+    url = "/api/tasks/?sort=title:asc"
+    
+    hits, misses = TASK_SEARCH_CACHE_HITS_TOTAL._value.get(), TASK_SEARCH_CACHE_MISSES_TOTAL._value.get()
+    first = client.get(url, headers=headers).json()
+    
+    # A write outside the task use cases is not seen: the page comes from the cache
+    db_session.execute(Task.__table__.update().values(title="Changed behind the cache"))
+    db_session.commit()
+    assert client.get(url, headers=headers).json() == first
+    assert TASK_SEARCH_CACHE_MISSES_TOTAL._value.get() == misses + 1
+    assert TASK_SEARCH_CACHE_HITS_TOTAL._value.get() == hits + 1
+    
+    # Writes through the API bump the generation: the next read is fresh
+    _create_task(client, token, title="Another")
+    titles = [t["title"] for t in client.get(url, headers=headers).json()["tasks"]]
+    assert titles == ["Another", "Changed behind the cache"]
+    assert TASK_SEARCH_CACHE_MISSES_TOTAL._value.get() == misses + 2
+
+
+def test_search_result_cache_is_size_bounded(client: TestClient, token: str, cache_redis, monkeypatch):
+    """Test the oldest entries are evicted beyond SEARCH_CACHE_MAX_ENTRIES."""
+    monkeypatch.setattr(search_cache, "SEARCH_CACHE_ENABLED", True)
+    monkeypatch.setattr(search_cache, "SEARCH_CACHE_MAX_ENTRIES", 2)
+    _create_task(client, token, title="Bounded")
+    headers = {"Authorization": f"Bearer {token}"}
+    
+    for page_size in [1, 2, 3]:
+        client.get(f"/api/tasks/?page_size={page_size}", headers=headers)
+    
+    entries = [key for key in cache_redis.values if key.startswith(search_cache.KEY_PREFIX)]
+    assert len(entries) == 2
+    assert len(cache_redis.index) == 2
+
+
+def test_search_result_cache_bypassed_when_redis_down(client: TestClient, token: str, monkeypatch):
+    """Test searches fall back to the database when Redis is unreachable."""
+    class UnreachableRedis:
+        def incr(self, key):
+            raise redis.ConnectionError("Connection refused")
+    
+    monkeypatch.setattr(search_cache, "SEARCH_CACHE_ENABLED", True)
+    monkeypatch.setattr(redis_cache, "create_redis_client", lambda **kwargs: UnreachableRedis())
+    redis_cache.reset_cache_client()
+    task = _create_task(client, token, title="Still served")
+    
+    bypassed = TASK_SEARCH_CACHE_BYPASS_TOTAL._value.get()
+    response = client.get("/api/tasks/", headers={"Authorization": f"Bearer {token}"})
+    
+    assert response.status_code == 200
+    assert [t["id"] for t in response.json()["tasks"]] == [task["id"]]
+    assert TASK_SEARCH_CACHE_BYPASS_TOTAL._value.get() == bypassed + 1
+    redis_cache.reset_cache_client()
+
+
+def test_cache_reconnect_does_not_block_other_callers(monkeypatch):
+    """Test callers get None while another thread reconnects (hooks run outside the lock, no retries)."""
+    in_hook, release = threading.Event(), threading.Event()
+    created = []
+
+    class SlowRedis:
+        def incr(self, key):
+            in_hook.set()
+            release.wait(5)
+
+    def create(**kwargs):
+        created.append(kwargs)
+        return SlowRedis()
+
+    monkeypatch.setattr(redis_cache, "create_redis_client", create)
+    redis_cache.reset_cache_client()
+    connecting = threading.Thread(target=redis_cache.get_cache_client)
+    connecting.start()
+    try:
+        assert in_hook.wait(5)
+        assert redis_cache.get_cache_client() is None
+        assert redis_cache.cache_client_backing_off()
+    finally:
+        release.set()
+        connecting.join(5)
+
+    assert isinstance(redis_cache.get_cache_client(), SlowRedis)
+    assert created == [
+        {"decode_responses": False, "socket_timeout": redis_cache.CACHE_REDIS_TIMEOUT_SECONDS, "retries": 0}
+    ]
+    redis_cache.reset_cache_client()
+
+
+def test_cache_redis_calls_run_off_the_event_loop(client: TestClient, token: str, cache_redis, monkeypatch):
+    """Test async handlers make their blocking Redis calls from worker threads, never on the event loop."""
+    monkeypatch.setattr(search_cache, "SEARCH_CACHE_ENABLED", True)
+    on_loop = []
+    calls = []
+    
+    def recording(name):
+        command = getattr(cache_redis, name)
+        
+        def call(*args, **kwargs):
+            try:
+                asyncio.get_running_loop()
+                on_loop.append(name)
+            except RuntimeError:
+                pass
+            calls.append(name)
+            return command(*args, **kwargs)
+        return call
+    
+    for name in ("get", "mget", "set", "exists", "incr", "delete", "pipeline"):
+        monkeypatch.setattr(cache_redis, name, recording(name))
+    
+    headers = {"Authorization": f"Bearer {token}"}
+    task = _create_task(client, token, title="Off the loop")
+    clear_principal_cache()  # The next request reads the principal from Redis
+    assert client.get("/api/tasks/", headers=headers).status_code == 200
+    assert client.get(f"/api/tasks/{task['id']}", headers=headers).status_code == 200
+    assert client.put(f"/api/tasks/{task['id']}", json={"title": "Moved"}, headers=headers).status_code == 200
+    
+    assert {"get", "mget", "incr", "delete", "pipeline"} <= set(calls)
+    assert on_loop == []
@@ -185,3 +185,22 @@ def test_delete_task_not_found(client: TestClient, user1: User):
     )
     
     assert response.status_code == 404
+
+
+def test_delete_task_removes_tags_and_attachments(client: TestClient, db_session: Session, user1: User, user2: User):
+    """Test deleting a task removes its tag and attachment rows; a non-owner's attempt removes nothing."""
+    from domain.models.attachment import Attachment
+    from domain.models.task_tag import TaskTag
+    
+    owner = {"Authorization": f"Bearer {client.post('/api/auth/login', json={'username': 'user1', 'password': 'password1'}).json()['token']}"}
+    other = {"Authorization": f"Bearer {client.post('/api/auth/login', json={'username': 'user2', 'password': 'password2'}).json()['token']}"}
+    task_id = client.post("/api/tasks/", json={"title": "Tagged", "tags": ["a", "b"]}, headers=owner).json()["id"]
+    client.post(f"/api/tasks/{task_id}/attachments", files={"file": ("a.txt", b"data", "text/plain")}, headers=owner)
+    
+    assert client.delete(f"/api/tasks/{task_id}", headers=other).status_code == 403
+    assert db_session.query(TaskTag).filter(TaskTag.task_id == task_id).count() == 2
+    assert db_session.query(Attachment).filter(Attachment.task_id == task_id).count() == 1
+    
+    assert client.delete(f"/api/tasks/{task_id}", headers=owner).status_code == 204
+    assert db_session.query(TaskTag).filter(TaskTag.task_id == task_id).count() == 0
+    assert db_session.query(Attachment).filter(Attachment.task_id == task_id).count() == 0
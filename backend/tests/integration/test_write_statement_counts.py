@@ -0,0 +1,183 @@
+"""Statement counts per write endpoint.
+
+Write paths get generated values from the INSERT itself and keep committed
+objects usable (expire_on_commit=False), so a write is its DML plus the
+lookups it needs, with no reload after flush or commit. The authenticated
+user comes from the principal cache after the user's first request. These
+tests pin the number of statements each endpoint sends to the database
+(SQLite; on PostgreSQL the tag and audit writes ride in the task's statement,
+see test_postgres_task_writes.py).
+"""
+
+from contextlib import contextmanager
+from typing import Iterator, List
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from domain.auth.principal import Principal
+from domain.models.user import User
+from infrastructure.cache.principal_cache import KEY_PREFIX, get_local_principal, put_principal
+from tests.conftest import test_async_engine
+
+
+@contextmanager
+def recorded_statements() -> Iterator[List[str]]:
+    """Record the SQL statements executed by the API's (async) engine."""
+    statements: List[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement.split(None, 1)[0].upper())
+
+    event.listen(test_async_engine.sync_engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(test_async_engine.sync_engine, "before_cursor_execute", record)
+
+
+@pytest.fixture
+def headers(client: TestClient, user1: User) -> dict:
+    """Authorization headers for user1."""
+    response = client.post("/api/auth/login", json={"username": "user1", "password": "password1"})
+    return {"Authorization": f"Bearer {response.json()['token']}"}
+
+
+def test_create_task_statements(client: TestClient, headers: dict):
+    """Test creating a task (first authenticated request): user lookup, task INSERT, tag INSERT, audit INSERT."""
+    with recorded_statements() as statements:
+        response = client.post("/api/tasks/", json={"title": "Counted", "tags": ["a", "b"]}, headers=headers)
+
+    assert response.status_code == 201
+    assert response.json()["owner_username"] == "user1"
+    assert statements == ["SELECT", "INSERT", "INSERT", "INSERT"]
+
+
+def test_update_task_statements(client: TestClient, headers: dict):
+    """Test updating a task: one ownership-checked UPDATE ... RETURNING, audit INSERT (user cached)."""
+    task_id = client.post("/api/tasks/", json={"title": "Counted"}, headers=headers).json()["id"]
+
+    with recorded_statements() as statements:
+        response = client.put(f"/api/tasks/{task_id}", json={"title": "Renamed"}, headers=headers)
+
+    assert response.status_code == 200
+    assert response.json()["title"] == "Renamed"
+    assert response.json()["owner_username"] == "user1"
+    assert statements == ["UPDATE", "INSERT"]
+
+
+def test_update_task_status_statements(client: TestClient, headers: dict):
+    """Test a status change also reads the old status for the audit event (SQLite; PostgreSQL returns it from the UPDATE)."""
+    task_id = client.post("/api/tasks/", json={"title": "Counted", "status": "todo"}, headers=headers).json()["id"]
+
+    with recorded_statements() as statements:
+        response = client.put(f"/api/tasks/{task_id}", json={"status": "done"}, headers=headers)
+
+    assert response.status_code == 200
+    assert response.json()["status"] == "done"
+    assert statements == ["SELECT", "UPDATE", "INSERT"]
+
+
+def test_update_task_of_other_user_statements(client: TestClient, headers: dict, user2: User):
+    """Test a write matching no row falls back to one lookup to answer 403 (not 404); user1's first request."""
+    response = client.post("/api/auth/login", json={"username": "user2", "password": "password2"})
+    other_headers = {"Authorization": f"Bearer {response.json()['token']}"}
+    task_id = client.post("/api/tasks/", json={"title": "Not yours"}, headers=other_headers).json()["id"]
+
+    with recorded_statements() as statements:
+        response = client.put(f"/api/tasks/{task_id}", json={"title": "Mine now"}, headers=headers)
+
+    assert response.status_code == 403
+    assert statements == ["SELECT", "UPDATE", "SELECT"]
+
+
+def test_delete_task_statements(client: TestClient, headers: dict):
+    """Test deleting a task: ownership-checked DELETEs (attachments, tags, task), audit INSERT."""
+    task_id = client.post("/api/tasks/", json={"title": "Counted", "tags": ["a"]}, headers=headers).json()["id"]
+
+    with recorded_statements() as statements:
+        response = client.delete(f"/api/tasks/{task_id}", headers=headers)
+
+    assert response.status_code == 204
+    assert statements == ["DELETE", "DELETE", "DELETE", "INSERT"]
+
+
+def test_upload_attachment_statements(client: TestClient, headers: dict):
+    """Test uploading an attachment: task lookup, attachment INSERT, audit INSERT."""
+    task_id = client.post("/api/tasks/", json={"title": "Counted"}, headers=headers).json()["id"]
+
+    with recorded_statements() as statements:
+        response = client.post(
+            f"/api/tasks/{task_id}/attachments",
+            files={"file": ("notes.txt", b"hello", "text/plain")},
+            headers=headers
+        )
+
+    assert response.status_code == 201
+    assert response.json()["uploaded_at"] is not None
+    assert statements == ["SELECT", "INSERT", "INSERT"]
+
+
+def test_delete_attachment_statements(client: TestClient, headers: dict):
+    """Test deleting an attachment: attachment and task lookups, DELETE, audit INSERT."""
+    task_id = client.post("/api/tasks/", json={"title": "Counted"}, headers=headers).json()["id"]
+    attachment_id = client.post(
+        f"/api/tasks/{task_id}/attachments",
+        files={"file": ("notes.txt", b"hello", "text/plain")},
+        headers=headers
+    ).json()["id"]
+
+    with recorded_statements() as statements:
+        response = client.delete(f"/api/attachments/{attachment_id}", headers=headers)
+
+    assert response.status_code == 204
+    assert statements == ["SELECT", "SELECT", "DELETE", "INSERT"]
+
+
+def test_authenticated_read_skips_user_lookup(client: TestClient, headers: dict):
+    """Test a cached principal costs no query: reading a cached task body only checks its version."""
+    task_id = client.post("/api/tasks/", json={"title": "Counted"}, headers=headers).json()["id"]
+    client.get(f"/api/tasks/{task_id}", headers=headers)
+
+    with recorded_statements() as statements:
+        response = client.get(f"/api/tasks/{task_id}", headers=headers)
+
+    assert response.status_code == 200
+    assert statements == ["SELECT"]
+
+
+def test_password_change_drops_cached_principal(client: TestClient, headers: dict):
+    """Test the next request after a password change loads the user again."""
+    client.post("/api/tasks/", json={"title": "Counted"}, headers=headers)
+    response = client.post(
+        "/api/auth/change-password",
+        json={"current_password": "password1", "new_password": "newpassword1"},
+        headers=headers
+    )
+    assert response.status_code == 200
+
+    with recorded_statements() as statements:
+        response = client.post("/api/tasks/", json={"title": "After"}, headers=headers)
+
+    assert response.status_code == 201
+    assert statements == ["SELECT", "INSERT", "INSERT"]
+
+
+def test_user_deletion_drops_cached_principal_on_commit(db_session, user1: User, cache_redis):
+    """Test deleting a user evicts their principal after the commit, not during the flush or on rollback."""
+    user_id = user1.id
+
+    def cached() -> bool:
+        return get_local_principal(user_id) is not None and f"{KEY_PREFIX}{user_id}" in cache_redis.values
+
+    put_principal(Principal.of(user1))
+    db_session.delete(user1)
+    db_session.flush()
+    assert cached()
+    db_session.rollback()
+    assert cached()
+
+    db_session.delete(db_session.get(User, user_id))
+    db_session.commit()
+    assert not cached()
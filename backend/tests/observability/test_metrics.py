@@ -137,3 +137,34 @@ def test_worker_metrics_incremented(db_session, monkeypatch):
     # Success count should have increased
     # Note: This is a basic check - exact value depends on Prometheus format
     assert "reminders_processed_total" in updated_metrics
+
+
+def test_db_pool_metrics_show_starvation(tmp_path, monkeypatch):
+    """Test pool gauges track checkouts up to a starved pool, and connection hold and connect times are recorded."""
+    from sqlalchemy import create_engine
+    from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+    from prometheus_client import REGISTRY
+    from infrastructure.database import pool
+    
+    monkeypatch.setattr(pool, "DB_POOL_SIZE_SETTING", 1)
+    monkeypatch.setattr(pool, "DB_MAX_OVERFLOW", 0)
+    monkeypatch.setattr(pool, "DB_POOL_TIMEOUT_SECONDS", 0.05)
+    url = f"sqlite:///{tmp_path / 'pool.db'}"
+    engine = create_engine(url, **pool.pool_options(url, "test_starved"))
+    pool.instrument_pool(engine, "test_starved")
+    labels = {"pool": "test_starved"}
+    
+    def sample(name):
+        return REGISTRY.get_sample_value(name, labels) or 0
+    
+    with engine.connect():
+        assert sample("db_pool_checked_out") == 1
+        with pytest.raises(PoolTimeoutError):
+            engine.connect()
+    
+    assert sample("db_pool_checked_out") == 0
+    assert sample("db_pool_overflow") == 0
+    assert sample("db_pool_size") == 1
+    assert sample("db_pool_connection_held_seconds_count") == 1
+    assert sample("db_pool_connect_seconds_count") == 1
+    engine.dispose()
@@ -0,0 +1,71 @@
+"""Tests for the password hashing pool and bcrypt cost handling at login."""
+
+import asyncio
+import threading
+
+import bcrypt
+import pytest
+
+from application.auth import login
+from application.auth.login import _check_login_password, hash_cost, hash_password, needs_rehash
+from infrastructure.auth import password_hashing
+from infrastructure.auth.config import auth_config
+from infrastructure.auth.password_hashing import PasswordHashingBusyError, run_password_hashing
+from infrastructure.metrics.registry import PASSWORD_HASHING_QUEUE_DEPTH
+
+
+def test_jobs_beyond_the_queue_are_rejected(monkeypatch):
+    """Test a job is refused at once while workers + queue are taken, and accepted again after."""
+    monkeypatch.setattr(password_hashing, "PASSWORD_HASHING_WORKERS", 1)
+    monkeypatch.setattr(password_hashing, "PASSWORD_HASHING_MAX_QUEUE", 1)
+    release = threading.Event()
+
+    async def scenario():
+        running = [asyncio.ensure_future(run_password_hashing(release.wait)) for _ in range(2)]
+        await asyncio.sleep(0)
+        assert PASSWORD_HASHING_QUEUE_DEPTH._value.get() == 1
+        with pytest.raises(PasswordHashingBusyError):
+            await run_password_hashing(lambda: "hashed")
+        release.set()
+        assert await asyncio.gather(*running) == [True, True]
+        return await run_password_hashing(lambda: "hashed")
+
+    assert asyncio.run(scenario()) == "hashed"
+    assert PASSWORD_HASHING_QUEUE_DEPTH._value.get() == 0
+
+
+def test_hash_cost_and_needs_rehash(monkeypatch):
+    """Test the cost is read from the hash and compared with BCRYPT_ROUNDS."""
+    monkeypatch.setattr(auth_config, "BCRYPT_ROUNDS", 5)
+    current = hash_password("secret")
+    older = bcrypt.hashpw(b"secret", bcrypt.gensalt(rounds=4)).decode("utf-8")
+
+    assert hash_cost(current) == 5 and not needs_rehash(current)
+    assert hash_cost(older) == 4 and needs_rehash(older)
+    assert hash_cost("not-a-bcrypt-hash") is None
+
+
+def test_unknown_user_check_reuses_dummy_hash_per_cost(monkeypatch):
+    """Test checks for unknown users never match and build the dummy hash once per cost."""
+    login._dummy_hash.cache_clear()
+    monkeypatch.setattr(auth_config, "BCRYPT_ROUNDS", 4)
+
+    assert _check_login_password("dummy", None) == (False, None)
+    assert _check_login_password("other", None) == (False, None)
+    assert login._dummy_hash.cache_info().misses == 1
+    assert hash_cost(login._dummy_hash(4)) == 4
+
+    monkeypatch.setattr(auth_config, "BCRYPT_ROUNDS", 5)
+    _check_login_password("dummy", None)
+    assert login._dummy_hash.cache_info().misses == 2
+
+
+def test_matching_password_at_another_cost_returns_new_hash(monkeypatch):
+    """Test a verified password stored at another cost comes back hashed at BCRYPT_ROUNDS."""
+    monkeypatch.setattr(auth_config, "BCRYPT_ROUNDS", 5)
+    older = bcrypt.hashpw(b"secret", bcrypt.gensalt(rounds=4)).decode("utf-8")
+
+    verified, new_hash = _check_login_password("secret", older)
+    assert verified and hash_cost(new_hash) == 5 and login.verify_password("secret", new_hash)
+    assert _check_login_password("secret", new_hash) == (True, None)
+    assert _check_login_password("wrong", older) == (False, None)
@@ -0,0 +1,130 @@
+"""Tests for key pair signed tokens, key rotation and the JWKS endpoint."""
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, rsa
+from fastapi.testclient import TestClient
+from jose import jwt, JWTError
+
+from application.auth.login import create_access_token
+from infrastructure.auth.config import AuthConfig, auth_config
+from infrastructure.auth.signing_keys import key_id, read_key, reload_signing_keys
+from infrastructure.auth.token_verifier import clear_verified_tokens, verify_access_token
+
+
+@pytest.fixture
+def key_pairs(tmp_path, monkeypatch):
+    """Switch signing to a key pair algorithm; returns a function writing PEM key files."""
+
+    def write_key(name: str, algorithm: str = "ES256", public: bool = False) -> str:
+        if algorithm == "RS256":
+            key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        else:
+            key = ec.generate_private_key(ec.SECP256R1())
+        if public:
+            pem = key.public_key().public_bytes(
+                serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+            )
+        else:
+            pem = key.private_bytes(
+                serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+            )
+        path = tmp_path / f"{name}.pem"
+        path.write_bytes(pem)
+        return str(path)
+
+    def use_keys(algorithm: str, signing: str, published: str = "") -> None:
+        monkeypatch.setattr(AuthConfig, "JWT_ALGORITHM", algorithm)
+        monkeypatch.setattr(AuthConfig, "JWT_SIGNING_KEY_FILE", signing)
+        monkeypatch.setattr(AuthConfig, "JWT_PUBLISHED_KEY_FILES", published)
+        reload_signing_keys()
+        clear_verified_tokens()
+
+    write_key.use = use_keys
+    yield write_key
+    monkeypatch.undo()
+    reload_signing_keys()
+    clear_verified_tokens()
+
+
+@pytest.mark.parametrize("algorithm", ["RS256", "ES256"])
+def test_key_pair_tokens_carry_kid_and_verify(key_pairs, algorithm):
+    """Test tokens are signed with the signing key, name it in `kid` and verify locally."""
+    signing = key_pairs("signing", algorithm)
+    key_pairs.use(algorithm, signing)
+
+    token = create_access_token(7)
+
+    header = jwt.get_unverified_header(token)
+    assert header["alg"] == algorithm
+    assert header["kid"] == key_id(read_key(signing, algorithm))
+    assert verify_access_token(token)["sub"] == "7"
+
+
+def test_rotation_keeps_published_keys_valid(key_pairs):
+    """Test tokens of a retired key verify while it is published, and fail once it is removed."""
+    old, new = key_pairs("old"), key_pairs("new")
+    key_pairs.use("ES256", old)
+    old_token = create_access_token(7)
+
+    key_pairs.use("ES256", new, published=old)
+    new_token = create_access_token(8)
+    assert jwt.get_unverified_header(new_token)["kid"] != jwt.get_unverified_header(old_token)["kid"]
+    assert verify_access_token(old_token)["sub"] == "7"
+    assert verify_access_token(new_token)["sub"] == "8"
+
+    key_pairs.use("ES256", new)
+    with pytest.raises(JWTError):
+        verify_access_token(old_token)
+
+
+def test_token_of_unknown_key_is_rejected(key_pairs):
+    """Test a token signed by a key outside the configuration fails, even with a known kid."""
+    key_pairs.use("ES256", key_pairs("stranger"))
+    foreign = create_access_token(7)
+    signing = key_pairs("signing")
+    key_pairs.use("ES256", signing)
+
+    with pytest.raises(JWTError):
+        verify_access_token(foreign)
+    forged = jwt.encode(
+        {"sub": "7"}, read_key(key_pairs("forger"), "ES256"), algorithm="ES256",
+        headers={"kid": key_id(read_key(signing, "ES256"))}
+    )
+    with pytest.raises(JWTError):
+        verify_access_token(forged)
+
+
+def test_validate_requires_private_signing_key(key_pairs):
+    """Test startup validation loads the key files of key pair algorithms."""
+    key_pairs.use("RS256", "")
+    with pytest.raises(ValueError, match="JWT_SIGNING_KEY_FILE"):
+        auth_config.validate()
+
+    key_pairs.use("RS256", key_pairs("public", "RS256", public=True))
+    with pytest.raises(ValueError, match="private key"):
+        auth_config.validate()
+
+    key_pairs.use("RS256", key_pairs("signing", "RS256"))
+    auth_config.validate()
+
+
+def test_jwks_publishes_public_keys_with_http_caching(client: TestClient, key_pairs):
+    """Test the JWKS lists signing and published public keys and answers 304 to a matching ETag."""
+    assert client.get("/.well-known/jwks.json").json() == {"keys": []}
+
+    signing, published = key_pairs("signing"), key_pairs("published", public=True)
+    key_pairs.use("ES256", signing, published=published)
+
+    response = client.get("/.well-known/jwks.json")
+
+    assert response.status_code == 200
+    assert response.headers["Cache-Control"].startswith("public, max-age=")
+    keys = response.json()["keys"]
+    assert [k["kid"] for k in keys] == [key_id(read_key(signing, "ES256")), key_id(read_key(published, "ES256"))]
+    assert all(k["kty"] == "EC" and k["use"] == "sig" and "d" not in k for k in keys)
+    token = create_access_token(7)
+    assert jwt.decode(token, response.json(), algorithms=["ES256"])["sub"] == "7"
+
+    cached = client.get("/.well-known/jwks.json", headers={"If-None-Match": response.headers["ETag"]})
+    assert cached.status_code == 304
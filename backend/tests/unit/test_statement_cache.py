@@ -0,0 +1,65 @@
+"""Tests for pre-built statements and statement cache settings."""
+
+from sqlalchemy import event
+from sqlalchemy.engine.default import CACHE_HIT
+from sqlalchemy.orm import Session
+
+from domain.models.task import Task
+from domain.models.user import User
+from infrastructure.database.statement_cache import (
+    ASYNCPG_PREPARED_STATEMENT_CACHE_SIZE,
+    DB_STATEMENT_CACHE_SIZE,
+    PSYCOPG_PREPARE_THRESHOLD,
+    statement_cache_options
+)
+from infrastructure.persistence.statements import TASK_BY_ID, TASKS_BY_IDS, USER_BY_ID
+
+
+def test_postgres_drivers_keep_prepared_statements():
+    """Test asyncpg/psycopg URLs get their prepared statement settings; other drivers keep their connect args."""
+    assert statement_cache_options("postgresql+asyncpg://user:pass@db/tasks") == {
+        "query_cache_size": DB_STATEMENT_CACHE_SIZE,
+        "connect_args": {"prepared_statement_cache_size": ASYNCPG_PREPARED_STATEMENT_CACHE_SIZE},
+    }
+    assert statement_cache_options("postgresql+psycopg://user:pass@db/tasks") == {
+        "query_cache_size": DB_STATEMENT_CACHE_SIZE,
+        "connect_args": {"prepare_threshold": PSYCOPG_PREPARE_THRESHOLD},
+    }
+    assert statement_cache_options("postgresql+psycopg2://user:pass@db/tasks")["connect_args"] == {}
+    assert statement_cache_options("sqlite:///./tasks.db", {"check_same_thread": False}) == {
+        "query_cache_size": DB_STATEMENT_CACHE_SIZE,
+        "connect_args": {"check_same_thread": False},
+    }
+
+
+def test_prebuilt_statements_load_by_parameter(db_session: Session, test_user: User):
+    """Test the pre-built lookups return the row for the bound id (owner loaded)."""
+    task = Task(title="Lookup", owner_user_id=test_user.id)
+    db_session.add(task)
+    db_session.commit()
+    db_session.expunge_all()
+
+    user = db_session.execute(USER_BY_ID, {"user_id": test_user.id}).scalar_one()
+    assert user.username == test_user.username
+    loaded = db_session.execute(TASK_BY_ID, {"task_id": task.id}).scalar_one()
+    assert "owner" in loaded.__dict__ and loaded.owner.id == test_user.id
+    assert db_session.execute(TASK_BY_ID, {"task_id": task.id + 1}).scalar_one_or_none() is None
+    assert [t.id for t in db_session.execute(TASKS_BY_IDS, {"task_ids": [task.id, task.id + 1]}).scalars()] == [task.id]
+
+
+def test_prebuilt_statements_reuse_compiled_sql(db_session: Session, test_user: User):
+    """Test executing a pre-built statement again is served from the compiled statement cache."""
+    cache_hits = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        cache_hits.append(context.cache_hit)
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        for _ in range(2):
+            db_session.execute(USER_BY_ID, {"user_id": test_user.id}).scalar_one()
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert cache_hits[-1] is CACHE_HIT
@@ -0,0 +1,60 @@
+"""Tests for the batched task write statements (PostgreSQL)."""
+
+from sqlalchemy.dialects import postgresql
+
+from domain.audit.audit_event import AuditActionType, AuditEvent
+from infrastructure.persistence.repositories.task_repository import (
+    _delete_owned_statements,
+    _replace_tags_statements,
+    _update_owned_statement
+)
+
+
+def _sql(statement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+def test_batched_delete_is_one_statement():
+    """Test the tag rows are deleted by the statement deleting the task (ownership-checked)."""
+    statements = _delete_owned_statements(1, 2, batched=True)
+
+    assert len(statements) == 1
+    sql = _sql(statements[0])
+    assert sql.startswith("WITH deleted_tags AS \n(DELETE FROM task_tags WHERE task_tags.task_id IN (SELECT tasks.id")
+    assert "DELETE FROM tasks WHERE tasks.id = " in sql
+    assert "tasks.owner_user_id = " in sql and "RETURNING tasks.id" in sql
+
+
+def test_unbatched_delete_is_two_statements():
+    """Test without batching the tag rows are deleted first, then the task."""
+    delete_tags, delete_task = _delete_owned_statements(1, 2, batched=False)
+
+    assert _sql(delete_tags).startswith("DELETE FROM task_tags")
+    assert _sql(delete_task).startswith("DELETE FROM tasks")
+
+
+def test_batched_tag_update_clears_tags_in_the_update():
+    """Test a tag update clears the old rows in the UPDATE and only inserts the new ones after it."""
+    sql = _sql(_update_owned_statement(1, 2, {"tags": '["a"]'}, (), False, clear_tags=True))
+
+    assert sql.startswith("WITH deleted_tags AS \n(DELETE FROM task_tags")
+    assert "UPDATE tasks SET tags=" in sql
+    statements = _replace_tags_statements(1, '["a"]', cleared=True)
+    assert [_sql(statement).split(None, 2)[:2] for statement in statements] == [["INSERT", "INTO"]]
+
+
+def test_audit_event_is_inserted_from_the_written_row():
+    """Test the audited UPDATE and DELETE are CTEs the audit event is inserted from (nothing for no row)."""
+    audit = AuditEvent(AuditActionType.TASK_UPDATED, 2, "task", "1", {"task_id": 1, "changes": {}})
+
+    update_sql = _sql(_update_owned_statement(1, 2, {"status": "done"}, ("status",), True, audit=audit))
+    assert update_sql.startswith("WITH updated_task AS \n(UPDATE tasks SET status=")
+    assert '"old".status AS old_status' in update_sql
+    assert "INSERT INTO audit_events" in update_sql and "FROM updated_task)" in update_sql
+    assert "updated_task.old_status IS DISTINCT FROM updated_task.status" in update_sql
+
+    [delete_task] = _delete_owned_statements(1, 2, batched=True, audit=audit)
+    delete_sql = _sql(delete_task)
+    assert delete_sql.startswith("WITH deleted_task AS \n(DELETE FROM tasks WHERE tasks.id = ")
+    assert "deleted_tags AS" in delete_sql and "INSERT INTO audit_events" in delete_sql
+    assert delete_sql.rstrip().endswith("FROM deleted_task")
@@ -0,0 +1,58 @@
+"""Tests for access token verification and the verified-token cache."""
+
+import time
+
+import pytest
+from jose import jwt, JWTError
+
+from application.auth.login import create_access_token
+from infrastructure.auth import token_verifier
+from infrastructure.auth.config import auth_config
+from infrastructure.auth.token_verifier import clear_verified_tokens, verify_access_token
+
+
+@pytest.fixture
+def decode_calls(monkeypatch):
+    """Count full verifications (jwt.decode calls) made by the verifier."""
+    calls = []
+    decode = jwt.decode
+
+    def counting_decode(*args, **kwargs):
+        calls.append(args[0])
+        return decode(*args, **kwargs)
+
+    clear_verified_tokens()
+    monkeypatch.setattr(token_verifier.jwt, "decode", counting_decode)
+    yield calls
+    clear_verified_tokens()
+
+
+def test_repeat_token_is_verified_once(decode_calls):
+    """Test a token is verified in full once, then served from the cache until it expires."""
+    token = create_access_token(7)
+
+    assert verify_access_token(token)["sub"] == "7"
+    assert verify_access_token(token)["sub"] == "7"
+    assert decode_calls == [token]
+
+
+def test_altered_token_is_rejected(decode_calls):
+    """Test a token differing from a cached one is verified (and rejected) on its own."""
+    token = create_access_token(7)
+    verify_access_token(token)
+
+    with pytest.raises(JWTError):
+        verify_access_token(token[:-2] + ("AA" if not token.endswith("AA") else "BB"))
+    assert len(decode_calls) == 2
+
+
+def test_cached_token_expires(decode_calls):
+    """Test a cached verification is not used past the token's exp."""
+    expire = int(time.time()) + 1
+    token = jwt.encode({"sub": "7", "exp": expire}, auth_config.get_secret_key(), algorithm=auth_config.get_algorithm())
+    verify_access_token(token)
+
+    time.sleep(expire + 1.1 - time.time())  # jose compares whole seconds
+    with pytest.raises(JWTError):
+        verify_access_token(token)
+    assert len(decode_calls) == 2
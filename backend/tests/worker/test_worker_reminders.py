@@ -293,8 +293,11 @@ def test_reminder_job_retry_on_transient_failure(db_session: Session, monkeypatc
     try:
         # Run reminder job (should retry and succeed)
         from worker.jobs.reminder_job import _process_single_reminder
+        from infrastructure.audit.audit_logger import AuditLoggerImpl
+        from infrastructure.persistence.repositories.audit_repository import SQLAlchemyAuditRepository
         last_24h = now - timedelta(hours=24)
-        success = _process_single_reminder(worker_session, task_in_worker_session, now, last_24h)
+        audit_logger = AuditLoggerImpl(SQLAlchemyAuditRepository(worker_session))
+        success = _process_single_reminder(worker_session, task_in_worker_session, now, last_24h, audit_logger)
         
         # Should succeed after retry
         assert success, "Reminder should succeed after retry"
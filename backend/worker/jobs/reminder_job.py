@@ -24,15 +24,24 @@ MAX_RETRIES = 3
 RETRY_DELAYS = [1, 2, 4]  # Exponential backoff delays in seconds
 
 
-def _process_single_reminder(db: Session, task: Task, now: datetime, last_24h: datetime) -> bool:
+def _process_single_reminder(
+    db: Session,
+    task: Task,
+    now: datetime,
+    last_24h: datetime,
+    audit_logger: AuditLogger
+) -> bool:
     """
     Process reminder for a single task with retry logic.
     
+    The reminder mark and its audit event are committed in one transaction.
+    
     Args:
         db: Database session
         task: Task to process
         now: Current timestamp
         last_24h: Timestamp 24 hours ago
+        audit_logger: Audit logger (writes in the same transaction)
     
     Returns:
         True if reminder was sent, False otherwise
@@ -59,7 +68,19 @@ def _process_single_reminder(db: Session, task: Task, now: datetime, last_24h: d
                 logger.debug("task_reminder_already_sent", task_id=task.id, message="Task already has reminder sent, skipping")
                 return False
             
-            # Commit transaction for this task
+            # Log audit event (system action - user_id is None)
+            audit_logger.log(
+                action_type=AuditActionType.REMINDER_SENT,
+                user_id=None,  # System action, not user-driven
+                resource_type="reminder",
+                resource_id=str(task.id),
+                metadata={
+                    "task_id": task.id,
+                    "due_date": task.due_date.isoformat() if task.due_date else None
+                }
+            )
+            
+            # Commit transaction for this task (reminder mark + audit event)
             db.commit()
             return True
             
@@ -160,7 +181,7 @@ def process_reminders() -> None:
         for task in tasks:
             try:
                 # Process reminder with retry logic
-                success = _process_single_reminder(db, task, now, last_24h)
+                success = _process_single_reminder(db, task, now, last_24h, audit_logger)
                 
                 if success:
                     # Log reminder sent event
@@ -171,18 +192,6 @@ def process_reminders() -> None:
                         worker_run_id=worker_run_id
                     )
                     
-                    # Log audit event (system action - user_id is None)
-                    audit_logger.log(
-                        action_type=AuditActionType.REMINDER_SENT,
-                        user_id=None,  # System action, not user-driven
-                        resource_type="reminder",
-                        resource_id=str(task.id),
-                        metadata={
-                            "task_id": task.id,
-                            "due_date": task.due_date.isoformat() if task.due_date else None
-                        }
-                    )
-                    
                     # Increment metrics
                     REMINDERS_PROCESSED_TOTAL.labels(status="success").inc()
                     